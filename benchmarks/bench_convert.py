@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of the SDK resource to response model conversion.
+
+Compares `Model(**resource)` with ModelConverter on synthetic resources,
+next to the cost of building the SDK resources from API bodies:
+
+    python benchmarks/bench_convert.py --count 10000
+"""
+
+import argparse
+import time
+
+from openstack.compute.v2 import flavor, server
+
+from openstack_mcp_server.tools.convert import ModelConverter
+from openstack_mcp_server.tools.response.compute import Flavor, Server
+
+
+def make_server(index: int) -> server.Server:
+    return server.Server.existing(
+        id=f"server-{index}",
+        name=f"web-{index}",
+        status="ACTIVE",
+        flavor={"original_name": "m1.small", "vcpus": 1, "ram": 2048},
+        image={"id": "image-1"},
+        addresses={
+            "private": [
+                {
+                    "addr": f"10.0.{index // 256 % 256}.{index % 256}",
+                    "version": 4,
+                    "OS-EXT-IPS:type": "fixed",
+                },
+            ],
+        },
+        key_name="default",
+        security_groups=[{"name": "default"}],
+    )
+
+
+def make_flavor(index: int) -> flavor.Flavor:
+    return flavor.Flavor.existing(
+        id=f"flavor-{index}",
+        name=f"m1.{index}",
+        vcpus=1,
+        ram=512,
+        disk=1,
+    )
+
+
+def measure(func, items, repeat: int) -> float:
+    """Best per-item time in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(items)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for model, factory in ((Server, make_server), (Flavor, make_flavor)):
+        indexes = list(range(args.count))
+        sdk = measure(
+            lambda indexes: [factory(i) for i in indexes],
+            indexes,
+            args.repeat,
+        )
+        items = [factory(i) for i in indexes]
+        converter = ModelConverter(model)
+        baseline = measure(
+            lambda items: [model(**item) for item in items],
+            items,
+            args.repeat,
+        )
+        converted = measure(converter.convert_all, items, args.repeat)
+        print(
+            f"{model.__name__:<8} Model(**resource) {baseline:8.1f} us/item"
+            f"  ModelConverter {converted:8.1f} us/item"
+            f"  ({baseline / converted:.1f}x)"
+            f"  SDK resource {sdk:8.1f} us/item",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""
+Latency and throughput benchmark of the MCP tools.
+
+Starts a fake OpenStack API (see fake_openstack.py), runs the real MCP
+server against it over stdio and streamable-http, and calls every
+registered tool that has a scenario below. Reports p50/p99 latency,
+requests per second and the peak RSS of the server process:
+
+    python benchmarks/bench_tools.py --size 1000 --requests 50
+    python benchmarks/bench_tools.py --tools get_servers,get_ports \\
+        --latency 0.02 --concurrency 8 --json results.json
+    python benchmarks/bench_tools.py --baseline results.json
+
+With --baseline, exits non-zero when a tool p50 latency regressed by
+more than --tolerance compared to a previous --json output.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import socket
+import statistics
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+from fake_openstack import FakeOpenStack, parse_sizes
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport, StreamableHttpTransport
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _fresh(fake: FakeOpenStack, collection: str, **attrs) -> str:
+    """Create an item to be used up, outside of the timed call."""
+    return fake.collections[collection].add(attrs)["id"]
+
+
+def _assign_floating_ip(fake: FakeOpenStack, index: int) -> dict:
+    _fresh(fake, "floatingips")
+    return {"floating_network_id": "network-0", "port_id": "port-0"}
+
+
+def _delete_domain(fake: FakeOpenStack, index: int) -> dict:
+    name = f"bench-delete-{index}"
+    _fresh(fake, "domains", name=name, enabled=False)
+    return {"name": name}
+
+
+# Arguments per tool, built from the fake and the call index.
+SCENARIOS: dict[str, Callable[[FakeOpenStack, int], dict]] = {
+    "get_servers": lambda f, i: {},
+    "get_servers_page": lambda f, i: {"limit": 100},
+    "get_servers_delta": lambda f, i: {},
+    "get_server": lambda f, i: {"id": "server-0"},
+    "create_server": lambda f, i: {
+        "name": f"bench-new-{i}",
+        "image": "image-0",
+        "flavor": 1,
+        "network": "network-0",
+    },
+    "create_servers": lambda f, i: {
+        "name": f"bench-multi-{i}",
+        "image": "image-0",
+        "flavor": 1,
+        "network": "network-0",
+        "count": 5,
+    },
+    "get_flavors": lambda f, i: {},
+    "action_server": lambda f, i: {"id": "server-0", "action": "lock"},
+    "action_servers": lambda f, i: {
+        "action": "lock",
+        "ids": ["server-0", "server-1"],
+    },
+    "update_server": lambda f, i: {"id": "server-0", "name": "bench-0"},
+    "delete_server": lambda f, i: {"id": _fresh(f, "servers")},
+    "get_image_images": lambda f, i: {},
+    "create_image": lambda f, i: {
+        "image_data": {
+            "name": f"bench-image-new-{i}",
+            "container_format": "bare",
+            "disk_format": "qcow2",
+            "min_disk": 0,
+            "min_ram": 0,
+            "import_options": {
+                "import_method": "web-download",
+                "uri": "http://images.invalid/bench.qcow2",
+            },
+        },
+    },
+    "get_regions": lambda f, i: {},
+    "get_region": lambda f, i: {"id": "RegionOne"},
+    "create_region": lambda f, i: {"id": f"bench-region-{i}"},
+    "delete_region": lambda f, i: {"id": _fresh(f, "regions")},
+    "update_region": lambda f, i: {"id": "RegionOne", "description": "x"},
+    "get_domains": lambda f, i: {},
+    "get_domain": lambda f, i: {"name": "domain-0"},
+    "create_domain": lambda f, i: {"name": f"bench-domain-{i}"},
+    "delete_domain": _delete_domain,
+    "update_domain": lambda f, i: {"id": "domain-0", "description": "x"},
+    "get_networks": lambda f, i: {},
+    "create_network": lambda f, i: {"name": f"bench-net-new-{i}"},
+    "get_network_detail": lambda f, i: {"network_id": "network-0"},
+    "update_network": lambda f, i: {
+        "network_id": "network-0",
+        "description": "x",
+    },
+    "delete_network": lambda f, i: {"network_id": _fresh(f, "networks")},
+    "get_subnets": lambda f, i: {},
+    "create_subnet": lambda f, i: {
+        "network_id": "network-0",
+        "cidr": f"192.168.{i % 256}.0/24",
+    },
+    "get_subnet_detail": lambda f, i: {"subnet_id": "subnet-0"},
+    "update_subnet": lambda f, i: {"subnet_id": "subnet-0", "name": "x"},
+    "delete_subnet": lambda f, i: {"subnet_id": _fresh(f, "subnets")},
+    "get_ports": lambda f, i: {},
+    "get_ports_delta": lambda f, i: {},
+    "create_port": lambda f, i: {"network_id": "network-0"},
+    "get_port_detail": lambda f, i: {"port_id": "port-0"},
+    "update_port": lambda f, i: {"port_id": "port-0", "description": "x"},
+    "delete_port": lambda f, i: {"port_id": _fresh(f, "ports")},
+    "get_port_allowed_address_pairs": lambda f, i: {"port_id": "port-0"},
+    "set_port_binding": lambda f, i: {
+        "port_id": "port-0",
+        "host_id": "compute-0",
+    },
+    "get_floating_ips": lambda f, i: {},
+    "create_floating_ip": lambda f, i: {"floating_network_id": "network-0"},
+    "delete_floating_ip": lambda f, i: {
+        "floating_ip_id": _fresh(f, "floatingips"),
+    },
+    "update_floating_ip": lambda f, i: {
+        "floating_ip_id": "fip-0",
+        "description": "x",
+    },
+    "create_floating_ips_bulk": lambda f, i: {
+        "floating_network_id": "network-0",
+        "count": 5,
+    },
+    "assign_first_available_floating_ip": _assign_floating_ip,
+    "get_volumes": lambda f, i: {},
+    "get_volumes_delta": lambda f, i: {},
+    "get_volume_details": lambda f, i: {"volume_id": "volume-0"},
+    "create_volume": lambda f, i: {"name": f"bench-volume-{i}", "size": 1},
+    "delete_volume": lambda f, i: {"volume_id": _fresh(f, "volumes")},
+    "extend_volume": lambda f, i: {"volume_id": "volume-0", "new_size": 2},
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q) - 1]
+
+
+def peak_rss_mb(pid: int | None) -> float | None:
+    """Peak RSS of a running process, or of waited children on None."""
+    if pid is None:
+        return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+async def bench_tool(
+    client: Client,
+    fake: FakeOpenStack,
+    name: str,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    scenario = SCENARIOS[name]
+    # Warm up connections, discovery and caches.
+    await client.call_tool(name, scenario(fake, -1), raise_on_error=False)
+
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(index: int) -> None:
+        nonlocal errors
+        arguments = scenario(fake, index)
+        async with semaphore:
+            start = time.perf_counter()
+            result = await client.call_tool(
+                name,
+                arguments,
+                raise_on_error=False,
+            )
+            latencies.append(time.perf_counter() - start)
+        if result.is_error:
+            errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    return {
+        "calls": requests,
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "rps": requests / elapsed,
+    }
+
+
+async def run_transport(
+    transport: str,
+    fake: FakeOpenStack,
+    env: dict[str, str],
+    tools: list[str] | None,
+    requests: int,
+    concurrency: int,
+) -> tuple[dict, float | None]:
+    server = None
+    if transport == "stdio":
+        client_transport = StdioTransport(
+            sys.executable,
+            ["-m", "openstack_mcp_server"],
+            env={**env, "TRANSPORT": "stdio"},
+            keep_alive=False,
+        )
+    else:
+        port = free_port()
+        server = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", "openstack_mcp_server"],
+            env={
+                **env,
+                "TRANSPORT": "streamable-http",
+                "FASTMCP_PORT": str(port),
+            },
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        client_transport = StreamableHttpTransport(
+            f"http://127.0.0.1:{port}/mcp",
+        )
+        await wait_for_port(port)
+
+    results = {}
+    try:
+        async with Client(client_transport, timeout=300) as client:
+            available = [tool.name for tool in await client.list_tools()]
+            for name in available:
+                if tools and name not in tools:
+                    continue
+                if name not in SCENARIOS:
+                    print(f"  {name}: skipped, no scenario", file=sys.stderr)
+                    continue
+                results[name] = await bench_tool(
+                    client,
+                    fake,
+                    name,
+                    requests,
+                    concurrency,
+                )
+                print_row(transport, name, results[name])
+            memory = peak_rss_mb(server.pid if server else None)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    if server is None:
+        # The stdio server has exited and been waited for by now.
+        memory = peak_rss_mb(None)
+    return results, memory
+
+
+async def wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+    raise TimeoutError(f"MCP server did not listen on port {port}")
+
+
+def print_row(transport: str, name: str, result: dict) -> None:
+    print(
+        f"{transport:<16} {name:<34} {result['calls']:>6} "
+        f"{result['errors']:>6} {result['p50_ms']:>9.1f} "
+        f"{result['p99_ms']:>9.1f} {result['rps']:>9.1f}",
+        flush=True,
+    )
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """List p50 latency regressions beyond the tolerance."""
+    regressions = []
+    for transport, results in current["transports"].items():
+        previous = baseline.get("transports", {}).get(transport, {})
+        for name, result in results["tools"].items():
+            before = previous.get("tools", {}).get(name)
+            if before and result["p50_ms"] > before["p50_ms"] * (
+                1 + tolerance
+            ):
+                regressions.append(
+                    f"{transport} {name}: p50 {before['p50_ms']:.1f}ms "
+                    f"-> {result['p50_ms']:.1f}ms",
+                )
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--transports",
+        default="stdio,streamable-http",
+        help="Comma separated transports to benchmark",
+    )
+    parser.add_argument("--tools", help="Comma separated tools to run")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds every fake API request takes",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=100,
+        help="Items seeded in every fake collection",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default={},
+        help="Per collection sizes, e.g. servers=1000,ports=5000",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        default="0",
+        help="CACHE_TTL of the server, 0 measures uncached calls",
+    )
+    parser.add_argument("--json", type=Path, help="Write results to a file")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    fake = FakeOpenStack(args.latency, args.sizes, args.size).start()
+    tools = args.tools.split(",") if args.tools else None
+    output = {"settings": vars(args) | {"json": None, "baseline": None}}
+    output["transports"] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clouds_yaml = fake.write_clouds_yaml(Path(tmp) / "clouds.yaml")
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(ROOT / "src"),
+            "OS_CLIENT_CONFIG_FILE": str(clouds_yaml),
+            "CLOUD_NAME": "bench",
+            # SDK debug logging would dominate the measurements.
+            "DEBUG_MODE": "false",
+            "CACHE_TTL": args.cache_ttl,
+            "AUTH_CACHE": "memory",
+            "WAIT_INTERVAL": "0.1",
+        }
+        print(
+            f"{'transport':<16} {'tool':<34} {'calls':>6} {'errors':>6} "
+            f"{'p50 ms':>9} {'p99 ms':>9} {'rps':>9}",
+        )
+        try:
+            for transport in args.transports.split(","):
+                results, memory = await run_transport(
+                    transport,
+                    fake,
+                    env,
+                    tools,
+                    args.requests,
+                    args.concurrency,
+                )
+                output["transports"][transport] = {
+                    "tools": results,
+                    "peak_rss_mb": memory,
+                }
+                if memory is not None:
+                    print(f"{transport:<16} peak server RSS {memory:.1f} MB")
+        finally:
+            fake.stop()
+    print(f"fake API requests: {next(fake.requests)}")
+
+    if args.json:
+        args.json.write_text(json.dumps(output, indent=2, default=str))
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(output, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
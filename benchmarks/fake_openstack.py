@@ -0,0 +1,659 @@
+"""
+Local fake OpenStack API for benchmarks.
+
+Serves Keystone, Nova, Neutron, Cinder and Glance stand-ins from memory,
+enough for the SDK calls of the MCP tools. Every request waits the
+configured latency, so throughput depends on the MCP server rather than
+on the fake. Run it standalone to point a server at it by hand:
+
+    python benchmarks/fake_openstack.py --port 5000 --size 1000
+"""
+
+import argparse
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+PROJECT_ID = "bench-project"
+REGION = "RegionOne"
+TIMESTAMP = "2025-01-01T00:00:00Z"
+
+# Query parameters that are not attribute filters.
+RESERVED_PARAMS = {
+    "limit",
+    "marker",
+    "fields",
+    "sort_key",
+    "sort_dir",
+    "changes-since",
+    "changes_since",
+}
+
+
+def _server(i: int) -> dict:
+    return {
+        "id": f"server-{i}",
+        "name": f"bench-{i}",
+        "status": "ACTIVE",
+        "flavor": {
+            "original_name": "m1.bench1",
+            "vcpus": 1,
+            "ram": 512,
+            "disk": 1,
+        },
+        "image": {"id": "image-0"},
+        "addresses": {
+            "network-0": [
+                {
+                    "addr": f"10.0.{i // 256 % 256}.{i % 256}",
+                    "version": 4,
+                    "OS-EXT-IPS:type": "fixed",
+                },
+            ],
+        },
+        "key_name": None,
+        "security_groups": [{"name": "default"}],
+        "metadata": {},
+        "tags": [],
+        "tenant_id": PROJECT_ID,
+        "OS-EXT-SRV-ATTR:host": "compute-0",
+        "OS-EXT-SRV-ATTR:hostname": f"bench-{i}",
+        "created": TIMESTAMP,
+        "updated": TIMESTAMP,
+    }
+
+
+def _flavor(i: int) -> dict:
+    return {
+        "id": str(i + 1),
+        "name": f"m1.bench{i + 1}",
+        "vcpus": 1,
+        "ram": 512,
+        "disk": 1,
+        "os-flavor-access:is_public": True,
+    }
+
+
+def _network(i: int) -> dict:
+    return {
+        "id": f"network-{i}",
+        "name": f"bench-net-{i}",
+        "status": "ACTIVE",
+        "admin_state_up": True,
+        "shared": False,
+        "router:external": i == 0,
+        "subnets": [f"subnet-{i}"],
+        "mtu": 1500,
+        "project_id": PROJECT_ID,
+        "revision_number": 1,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _subnet(i: int) -> dict:
+    return {
+        "id": f"subnet-{i}",
+        "name": f"bench-subnet-{i}",
+        "network_id": f"network-{i}",
+        "cidr": f"10.{i // 256 % 256}.{i % 256}.0/24",
+        "ip_version": 4,
+        "gateway_ip": f"10.{i // 256 % 256}.{i % 256}.1",
+        "enable_dhcp": True,
+        "allocation_pools": [],
+        "dns_nameservers": [],
+        "host_routes": [],
+        "project_id": PROJECT_ID,
+        "revision_number": 1,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _port(i: int) -> dict:
+    return {
+        "id": f"port-{i}",
+        "name": f"bench-port-{i}",
+        "network_id": "network-0",
+        "status": "ACTIVE",
+        "admin_state_up": True,
+        "device_id": f"server-{i}",
+        "device_owner": "compute:nova",
+        "mac_address": f"fa:16:3e:00:{i // 256 % 256:02x}:{i % 256:02x}",
+        "fixed_ips": [
+            {
+                "subnet_id": "subnet-0",
+                "ip_address": f"10.0.{i // 256 % 256}.{i % 256}",
+            },
+        ],
+        "security_groups": [],
+        "allowed_address_pairs": [],
+        "binding:host_id": "compute-0",
+        "binding:vnic_type": "normal",
+        "binding:profile": {},
+        "project_id": PROJECT_ID,
+        "revision_number": 1,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _floating_ip(i: int) -> dict:
+    return {
+        "id": f"fip-{i}",
+        "floating_ip_address": f"172.24.{i // 256 % 256}.{i % 256}",
+        "floating_network_id": "network-0",
+        "status": "DOWN",
+        "port_id": None,
+        "fixed_ip_address": None,
+        "router_id": None,
+        "description": "",
+        "project_id": PROJECT_ID,
+        "revision_number": 1,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _volume(i: int) -> dict:
+    return {
+        "id": f"volume-{i}",
+        "name": f"bench-volume-{i}",
+        "status": "available",
+        "size": 1,
+        "bootable": "false",
+        "volume_type": "standard",
+        "availability_zone": "nova",
+        "attachments": [],
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _image(i: int) -> dict:
+    return {
+        "id": f"image-{i}",
+        "name": f"bench-image-{i}",
+        "status": "active",
+        "visibility": "public",
+        "disk_format": "qcow2",
+        "container_format": "bare",
+        "size": 1024,
+        "min_disk": 0,
+        "min_ram": 0,
+        "protected": False,
+        "tags": [],
+        "owner": PROJECT_ID,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _region(i: int) -> dict:
+    return {
+        "id": REGION if i == 0 else f"region-{i}",
+        "description": "",
+        "parent_region_id": None,
+    }
+
+
+def _domain(i: int) -> dict:
+    return {
+        "id": f"domain-{i}",
+        "name": f"domain-{i}",
+        "description": "",
+        "enabled": True,
+    }
+
+
+class Collection:
+    """One API collection held in memory"""
+
+    def __init__(
+        self,
+        plural: str,
+        singular: str,
+        factory,
+        created: dict | None = None,
+        wrapped: bool = True,
+        next_link: str | None = None,
+    ):
+        self.plural = plural
+        self.singular = singular
+        self.factory = factory
+        # Attributes of items created through the API.
+        self.created = created or {}
+        # Glance sends and returns bare objects.
+        self.wrapped = wrapped
+        # Key of the next page link, `<plural>_links` by default.
+        self.next_link = next_link
+        self.items: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def seed(self, count: int) -> None:
+        with self.lock:
+            for i in range(count):
+                item = self.factory(i)
+                self.items[item["id"]] = item
+
+    def add(self, attrs: dict | None = None) -> dict:
+        # Unset attributes get the defaults of a seeded item.
+        attrs = {k: v for k, v in (attrs or {}).items() if v is not None}
+        item = {**self.factory(0), **self.created, **attrs}
+        item["id"] = attrs.get("id") or str(uuid.uuid4())
+        with self.lock:
+            self.items[item["id"]] = item
+        return item
+
+
+# Collections by service, the path prefix after the service root.
+SERVICES = {
+    "compute": {
+        "servers": Collection(
+            "servers",
+            "server",
+            _server,
+            {"status": "ACTIVE"},
+        ),
+        "flavors": Collection("flavors", "flavor", _flavor),
+    },
+    "network": {
+        "networks": Collection("networks", "network", _network),
+        "subnets": Collection("subnets", "subnet", _subnet),
+        "ports": Collection("ports", "port", _port),
+        "floatingips": Collection("floatingips", "floatingip", _floating_ip),
+    },
+    "volume": {
+        "volumes": Collection(
+            "volumes",
+            "volume",
+            _volume,
+            {"status": "available"},
+        ),
+    },
+    "image": {
+        "images": Collection(
+            "images",
+            "image",
+            _image,
+            {"status": "queued"},
+            wrapped=False,
+            next_link="next",
+        ),
+    },
+    "identity": {
+        "regions": Collection("regions", "region", _region),
+        "domains": Collection("domains", "domain", _domain),
+    },
+}
+
+# Service root, versioned endpoint and API version of each service.
+ENDPOINTS = {
+    "identity": ("/identity", "/identity/v3", "v3.14"),
+    "compute": ("/compute", "/compute/v2.1", "v2.1"),
+    "network": ("/network", "/network/v2.0", "v2.0"),
+    "volume": ("/volume", f"/volume/v3/{PROJECT_ID}", "v3.0"),
+    "image": ("/image", "/image/v2", "v2.16"),
+}
+
+MICROVERSIONS = {"compute": ("2.1", "2.96"), "volume": ("3.0", "3.70")}
+
+CATALOG_TYPES = {
+    "identity": "identity",
+    "compute": "compute",
+    "network": "network",
+    "volume": "block-storage",
+    "image": "image",
+}
+
+
+class FakeOpenStack:
+    """
+    In-memory OpenStack cloud served over HTTP.
+
+    :param latency: Seconds every API request waits before replying.
+    :param sizes: Number of seeded items per collection, e.g.
+        `{"servers": 1000}`. Collections not listed get `size` items.
+    :param size: Default number of seeded items.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        sizes: dict[str, int] | None = None,
+        size: int = 100,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.collections: dict[str, Collection] = {}
+        for service, collections in SERVICES.items():
+            for name, template in collections.items():
+                collection = Collection(
+                    template.plural,
+                    template.singular,
+                    template.factory,
+                    template.created,
+                    template.wrapped,
+                    template.next_link,
+                )
+                collection.seed((sizes or {}).get(name, size))
+                self.collections[name] = collection
+        self.requests = itertools.count()
+        self.httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self.httpd.daemon_threads = True
+        self.thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOpenStack":
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            name="fake-openstack",
+            daemon=True,
+        )
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def write_clouds_yaml(self, path: Path, cloud: str = "bench") -> Path:
+        """Write a clouds.yaml (JSON is valid YAML) pointing at the fake."""
+        config = {
+            "clouds": {
+                cloud: {
+                    "auth": {
+                        "auth_url": self.url + ENDPOINTS["identity"][1],
+                        "username": "admin",
+                        "password": "bench",
+                        "project_name": "admin",
+                        "user_domain_name": "Default",
+                        "project_domain_name": "Default",
+                    },
+                    "region_name": REGION,
+                    "identity_api_version": "3",
+                },
+            },
+        }
+        path.write_text(json.dumps(config, indent=2))
+        return path
+
+    def catalog(self) -> list[dict]:
+        return [
+            {
+                "id": service,
+                "type": CATALOG_TYPES[service],
+                "name": service,
+                "endpoints": [
+                    {
+                        "id": f"{service}-{interface}",
+                        "interface": interface,
+                        "region": REGION,
+                        "region_id": REGION,
+                        "url": self.url + endpoint,
+                    }
+                    for interface in ("public", "internal", "admin")
+                ],
+            }
+            for service, (_, endpoint, _) in ENDPOINTS.items()
+        ]
+
+    def version(self, service: str) -> dict:
+        _, endpoint, version_id = ENDPOINTS[service]
+        version = {
+            "id": version_id,
+            "status": "CURRENT",
+            "updated": TIMESTAMP,
+            "links": [{"rel": "self", "href": self.url + endpoint + "/"}],
+        }
+        if service in MICROVERSIONS:
+            version["min_version"], version["version"] = MICROVERSIONS[service]
+        return version
+
+
+def _handler(cloud: FakeOpenStack) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_PUT(self):
+            self._dispatch("PUT")
+
+        def do_PATCH(self):
+            self._dispatch("PATCH")
+
+        def do_DELETE(self):
+            self._dispatch("DELETE")
+
+        def _reply(self, status: int, body=None, headers=None) -> None:
+            data = b"" if body is None else json.dumps(body).encode()
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            if body is not None:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _dispatch(self, method: str) -> None:
+            next(cloud.requests)
+            if cloud.latency:
+                time.sleep(cloud.latency)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                body = {}
+            url = urlsplit(self.path)
+            query = parse_qsl(url.query, keep_blank_values=True)
+            path = url.path.rstrip("/")
+            try:
+                self._route(method, path, dict(query), body)
+            except KeyError as e:
+                self._reply(404, {"error": {"message": f"{e} not found"}})
+
+        def _route(self, method, path, query, body) -> None:
+            if path == ENDPOINTS["identity"][1] + "/auth/tokens":
+                return self._token()
+            for service, (root, endpoint, _) in ENDPOINTS.items():
+                if path == root:
+                    return self._reply(
+                        200,
+                        {"versions": [cloud.version(service)]},
+                    )
+                if path == endpoint or path == endpoint.replace(
+                    f"/{PROJECT_ID}", ""
+                ):
+                    return self._reply(
+                        200,
+                        {"version": cloud.version(service)},
+                    )
+                if path.startswith(endpoint + "/"):
+                    parts = path[len(endpoint) + 1 :].split("/")
+                    return self._resource(method, parts, query, body)
+            raise KeyError(path)
+
+        def _token(self) -> None:
+            token = {
+                "methods": ["password"],
+                "expires_at": "2099-01-01T00:00:00.000000Z",
+                "issued_at": TIMESTAMP,
+                "user": {
+                    "id": "admin",
+                    "name": "admin",
+                    "domain": {"id": "default", "name": "Default"},
+                },
+                "project": {
+                    "id": PROJECT_ID,
+                    "name": "admin",
+                    "domain": {"id": "default", "name": "Default"},
+                },
+                "roles": [{"id": "admin", "name": "admin"}],
+                "catalog": cloud.catalog(),
+            }
+            self._reply(
+                201,
+                {"token": token},
+                {"X-Subject-Token": uuid.uuid4().hex},
+            )
+
+        def _resource(self, method, parts, query, body) -> None:
+            collection = cloud.collections[parts[0]]
+            rest = parts[1:]
+            if not rest or rest == ["detail"]:
+                if method == "GET":
+                    return self._list(collection, query)
+                if method == "POST":
+                    return self._create(collection, body)
+            elif len(rest) == 1:
+                item = collection.items[rest[0]]
+                if method == "GET":
+                    return self._reply(200, self._wrap(collection, item))
+                if method in ("PUT", "PATCH"):
+                    attrs = body.get(collection.singular, body)
+                    if isinstance(attrs, dict):
+                        item.update(attrs)
+                    return self._reply(200, self._wrap(collection, item))
+                if method == "DELETE":
+                    with collection.lock:
+                        del collection.items[rest[0]]
+                    return self._reply(204)
+            elif method == "POST":
+                # Actions, e.g. Nova `action` or Glance `import`.
+                item = collection.items[rest[0]]
+                extend = body.get("os-extend") if body else None
+                if extend:
+                    item["size"] = extend["new_size"]
+                return self._reply(202)
+            self._reply(405, {"error": {"message": "Method not allowed"}})
+
+        @staticmethod
+        def _wrap(collection: Collection, item: dict) -> dict:
+            if collection.wrapped:
+                return {collection.singular: item}
+            return item
+
+        def _list(self, collection: Collection, query: dict) -> None:
+            with collection.lock:
+                items = list(collection.items.values())
+            since = query.get("changes-since") or query.get("changes_since")
+            if since:
+                items = [i for i in items if i.get("updated", "") >= since]
+            for key, value in query.items():
+                if key in RESERVED_PARAMS:
+                    continue
+                if key == "name" and collection.plural == "servers":
+                    # Nova matches names as regular expressions.
+                    pattern = re.compile(value)
+                    items = [
+                        i for i in items if pattern.search(i.get("name", ""))
+                    ]
+                    continue
+                if value.startswith("in:"):
+                    values = set(value[3:].split(","))
+                    items = [i for i in items if str(i.get(key)) in values]
+                    continue
+                items = [
+                    i for i in items if key not in i or _matches(i[key], value)
+                ]
+
+            marker = query.get("marker")
+            if marker:
+                ids = [i["id"] for i in items]
+                items = items[ids.index(marker) + 1 :] if marker in ids else []
+            body = {}
+            limit = int(query["limit"]) if query.get("limit") else None
+            if limit is not None and len(items) > limit:
+                items = items[:limit]
+                next_query = {**query, "marker": items[-1]["id"]}
+                href = f"{self.path.split('?')[0]}?{urlencode(next_query)}"
+                if collection.next_link:
+                    body[collection.next_link] = href
+                else:
+                    body[f"{collection.plural}_links"] = [
+                        {"rel": "next", "href": cloud.url + href},
+                    ]
+            body[collection.plural] = items
+            self._reply(200, body)
+
+        def _create(self, collection: Collection, body: dict) -> None:
+            attrs = body.get(collection.singular, body)
+            if isinstance(attrs, list):
+                # Neutron bulk create.
+                items = [collection.add(a) for a in attrs]
+                return self._reply(201, {collection.plural: items})
+            count = int(attrs.pop("max_count", 1))
+            attrs.pop("min_count", None)
+            reservation = attrs.pop("return_reservation_id", False)
+            reservation_id = f"r-{uuid.uuid4().hex[:8]}"
+            items = [
+                collection.add({**attrs, "reservation_id": reservation_id})
+                for _ in range(count)
+            ]
+            if reservation:
+                return self._reply(202, {"reservation_id": reservation_id})
+            self._reply(201, self._wrap(collection, items[0]))
+
+    return Handler
+
+
+def _matches(actual, expected: str) -> bool:
+    if isinstance(actual, bool):
+        return str(actual).lower() == expected.lower()
+    return str(actual) == expected
+
+
+def parse_sizes(value: str) -> dict[str, int]:
+    """Parse `servers=1000,ports=5000` inventory sizes."""
+    sizes = {}
+    for item in value.split(","):
+        if item.strip():
+            name, _, count = item.partition("=")
+            sizes[name.strip()] = int(count)
+    return sizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--sizes", type=parse_sizes, default={})
+    parser.add_argument("--clouds-yaml", type=Path)
+    args = parser.parse_args()
+
+    cloud = FakeOpenStack(
+        args.latency,
+        args.sizes,
+        args.size,
+        args.host,
+        args.port,
+    )
+    if args.clouds_yaml:
+        cloud.write_clouds_yaml(args.clouds_yaml)
+    print(f"Fake OpenStack listening on {cloud.url}", flush=True)
+    cloud.httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
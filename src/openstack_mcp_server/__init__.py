@@ -2,6 +2,7 @@ import argparse
 import logging
 import signal
 import sys
+import time
 
 
 # Configure root logger
@@ -22,10 +23,15 @@ def handle_interrupt(signum, frame):
 def main():
     """Openstack MCP Server main entry point."""
     try:
+        start = time.perf_counter()
         # Import here to avoid circular imports
         from openstack_mcp_server.config import MCP_TRANSPORT
         from openstack_mcp_server.server import serve
 
+        logger.info(
+            f"Imported the server in {time.perf_counter() - start:.2f}s",
+        )
+
         parser = argparse.ArgumentParser(
             description="Openstack MCP Server",
         )
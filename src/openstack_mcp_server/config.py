@@ -10,5 +10,126 @@ MCP_TRANSPORT: str = os.environ.get("TRANSPORT", "stdio")
 MCP_CLOUD_NAME: str = os.environ.get("CLOUD_NAME", "openstack")
 MCP_DEBUG_MODE: bool = os.environ.get("DEBUG_MODE", "true").lower() == "true"
 
+# Clouds to connect to at startup, as `cloud` or `cloud:region` entries
+MCP_PREWARM_CLOUDS: list[str] = [
+    target.strip()
+    for target in os.environ.get("PREWARM_CLOUDS", "").split(",")
+    if target.strip()
+]
+# Lists cached for every pre-warmed cloud, they live in the catalog cache
+# and are refreshed after CATALOG_REFRESH, see CATALOG_MAX_AGE below
+MCP_PREWARM_CACHES: list[str] = [
+    resource.strip()
+    for resource in os.environ.get(
+        "PREWARM_CACHES",
+        "flavors,regions",
+    ).split(",")
+    if resource.strip()
+]
+
+# Openstack connection pool settings (timeouts in seconds)
+MCP_CONN_POOL_SIZE: int = int(os.environ.get("CONN_POOL_SIZE", "8"))
+MCP_CONN_IDLE_TIMEOUT: float = float(
+    os.environ.get("CONN_IDLE_TIMEOUT", "300"),
+)
+MCP_CONN_MAX_AGE: float = float(os.environ.get("CONN_MAX_AGE", "3600"))
+
+# Keystone token and catalog cache settings
+# AUTH_CACHE is one of `memory`, `file` (shared across restarts) or `none`
+MCP_AUTH_CACHE: str = os.environ.get("AUTH_CACHE", "memory").lower()
+MCP_AUTH_CACHE_DIR: Path = Path(
+    os.environ.get(
+        "AUTH_CACHE_DIR",
+        Path.home() / ".cache" / "openstack-mcp-server" / "auth",
+    ),
+)
+# Tokens expiring within this many seconds are refreshed ahead of time
+MCP_TOKEN_REFRESH_MARGIN: int = int(
+    os.environ.get("TOKEN_REFRESH_MARGIN", "300"),
+)
+
+# List tool response cache settings (TTL in seconds, 0 disables caching)
+# Off by default, list tools then always return the current state
+MCP_CACHE_TTL: float = float(os.environ.get("CACHE_TTL", "0"))
+# Per resource type TTLs, e.g. `networks=60,subnets=60`
+MCP_CACHE_TTL_OVERRIDES: dict[str, float] = {
+    resource.strip(): float(ttl)
+    for resource, _, ttl in (
+        item.partition("=")
+        for item in os.environ.get("CACHE_TTL_OVERRIDES", "").split(",")
+        if item.strip()
+    )
+}
+MCP_CACHE_MAX_ENTRIES: int = int(os.environ.get("CACHE_MAX_ENTRIES", "128"))
+MCP_CACHE_MAX_BYTES: int = int(
+    os.environ.get("CACHE_MAX_BYTES", str(16 * 1024 * 1024)),
+)
+
+# Snapshots of flavors, regions and domains (ages in seconds)
+# CATALOG_CACHE is one of `memory`, `file` (shared across restarts) or `none`
+MCP_CATALOG_CACHE: str = os.environ.get("CATALOG_CACHE", "memory").lower()
+MCP_CATALOG_CACHE_DIR: Path = Path(
+    os.environ.get(
+        "CATALOG_CACHE_DIR",
+        Path.home() / ".cache" / "openstack-mcp-server" / "catalog",
+    ),
+)
+# Snapshots older than this are refreshed in the background
+MCP_CATALOG_REFRESH: float = float(os.environ.get("CATALOG_REFRESH", "300"))
+# Snapshots older than this are not served, the list is fetched again
+MCP_CATALOG_MAX_AGE: float = float(
+    os.environ.get("CATALOG_MAX_AGE", "86400"),
+)
+
+# Seconds before the name to ID index of a resource type is listed again
+MCP_RESOLVER_TTL: float = float(os.environ.get("RESOLVER_TTL", "300"))
+
+# Seconds before the free floating IP index of a network is listed again
+MCP_FIP_POOL_TTL: float = float(os.environ.get("FIP_POOL_TTL", "60"))
+
+# Compact table output, rows beyond about this many bytes are truncated
+MCP_TABLE_MAX_BYTES: int = int(os.environ.get("TABLE_MAX_BYTES", "65536"))
+# Object returned by write tools: minimal, cached or full (refetched)
+MCP_RESPONSE_FRESHNESS: str = os.environ.get("RESPONSE_FRESHNESS", "full")
+
+# Per-tool metrics, served on /metrics or by the get_server_metrics tool
+MCP_METRICS: bool = os.environ.get("METRICS", "true").lower() == "true"
+
+# OpenTelemetry tracing, exported over OTLP (requires the `tracing` extra)
+MCP_TRACING: bool = os.environ.get("TRACING", "false").lower() == "true"
+# Defaults to the standard OTEL_EXPORTER_OTLP_* variables
+MCP_OTLP_ENDPOINT: str | None = os.environ.get("OTLP_ENDPOINT") or None
+MCP_TRACING_SERVICE_NAME: str = os.environ.get(
+    "TRACING_SERVICE_NAME",
+    "openstack-mcp-server",
+)
+
+# Tool schemas cached across restarts, for servers spawned per session
+MCP_SCHEMA_CACHE: bool = (
+    os.environ.get("SCHEMA_CACHE", "false").lower() == "true"
+)
+MCP_SCHEMA_CACHE_DIR: Path = Path(
+    os.environ.get(
+        "SCHEMA_CACHE_DIR",
+        Path.home() / ".cache" / "openstack-mcp-server" / "schemas",
+    ),
+)
+
+# Tool execution settings
+MCP_MAX_WORKERS: int = int(os.environ.get("MAX_WORKERS", "8"))
+# Concurrent API calls per bulk operation, also bounded by CONN_POOL_SIZE
+MCP_BULK_CONCURRENCY: int = int(os.environ.get("BULK_CONCURRENCY", "8"))
+# Seconds between status polls when waiting for resources
+MCP_WAIT_INTERVAL: float = float(os.environ.get("WAIT_INTERVAL", "2"))
+# Upper bound of the status poll interval while nothing changes
+MCP_WAIT_MAX_INTERVAL: float = float(
+    os.environ.get("WAIT_MAX_INTERVAL", "15"),
+)
+# Retries of conflict, rate limit and quota errors (delay in seconds)
+MCP_RETRY_ATTEMPTS: int = int(os.environ.get("RETRY_ATTEMPTS", "4"))
+MCP_RETRY_BASE_DELAY: float = float(
+    os.environ.get("RETRY_BASE_DELAY", "0.5"),
+)
+
 # Application paths
 BASE_DIR = Path(__file__).parent.parent.parent
@@ -1,23 +1,49 @@
+import logging
+import threading
+import time
+
 from fastmcp.server import FastMCP
 from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
 from fastmcp.server.middleware.logging import LoggingMiddleware
 
+from openstack_mcp_server import config
 from openstack_mcp_server.tools import register_tool
+from openstack_mcp_server.tools.tracing import setup_tracing
+
+
+logger = logging.getLogger("openstack-mcp-server")
 
 
 def serve(transport: str, **kwargs):
     """Serve the MCP server with the specified transport."""
+    setup_tracing()
     mcp = FastMCP(
         "openstack_mcp_server",
     )
 
+    start = time.perf_counter()
     register_tool(mcp)
+    logger.info(
+        f"Registered tools in {time.perf_counter() - start:.2f}s",
+    )
     # resister_resources(mcp)
     # register_prompt(mcp)
 
     # Add middlewares
     mcp.add_middleware(ErrorHandlingMiddleware())
     mcp.add_middleware(LoggingMiddleware())
+    if config.MCP_METRICS:
+        from openstack_mcp_server.tools.metrics import register_metrics
+
+        register_metrics(mcp, transport)
+
+    # Import the OpenStack SDK, and pre-warm the configured clouds, in the
+    # background while the transport comes up.
+    threading.Thread(
+        target=_prepare_openstack,
+        name="openstack-mcp-prewarm",
+        daemon=True,
+    ).start()
 
     if transport == "stdio":
         mcp.run(transport="stdio", **kwargs)
@@ -27,3 +53,12 @@ def serve(transport: str, **kwargs):
         mcp.run(transport="sse", **kwargs)
     else:
         raise ValueError(f"Unsupported transport: {transport}")
+
+
+def _prepare_openstack():
+    from openstack_mcp_server.tools.base import import_sdk
+    from openstack_mcp_server.tools.prewarm import warm_up
+
+    import_sdk()
+    if config.MCP_PREWARM_CLOUDS:
+        warm_up()
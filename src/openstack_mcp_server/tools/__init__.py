@@ -1,19 +1,35 @@
 from fastmcp import FastMCP
 
+from openstack_mcp_server import config
+
 
 def register_tool(mcp: FastMCP):
     """
     Register Openstack MCP tools.
+
+    Tools are registered through the async execution path so that blocking
+    OpenStack SDK calls run on a bounded worker pool instead of the event loop.
+    The OpenStack SDK itself is only imported by the first tool call.
     """
 
     from .block_storage_tools import BlockStorageTools
     from .compute_tools import ComputeTools
+    from .executor import ToolRegistrar
     from .identity_tools import IdentityTools
     from .image_tools import ImageTools
     from .network_tools import NetworkTools
+    from .schema_cache import ToolSchemaCache
+
+    schemas = None
+    if config.MCP_SCHEMA_CACHE:
+        schemas = ToolSchemaCache(config.MCP_SCHEMA_CACHE_DIR)
+    registrar = ToolRegistrar(mcp, schemas)
+
+    ComputeTools().register_tools(registrar)
+    ImageTools().register_tools(registrar)
+    IdentityTools().register_tools(registrar)
+    NetworkTools().register_tools(registrar)
+    BlockStorageTools().register_tools(registrar)
 
-    ComputeTools().register_tools(mcp)
-    ImageTools().register_tools(mcp)
-    IdentityTools().register_tools(mcp)
-    NetworkTools().register_tools(mcp)
-    BlockStorageTools().register_tools(mcp)
+    if schemas is not None:
+        schemas.save()
@@ -1,27 +1,378 @@
-import openstack
+import contextlib
+import contextvars
+import logging
+import threading
+import time
 
-from openstack import connection
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from openstack_mcp_server import config
 
+from .metrics import track_upstream_requests
+from .token_cache import TokenCache, ensure_fresh_token, get_token_cache
+from .tracing import trace_upstream_requests
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+logger = logging.getLogger("openstack-mcp-server")
+
+# (cloud name, region name) selected for the current tool call
+_cloud_selection: contextvars.ContextVar[tuple[str | None, str | None]] = (
+    contextvars.ContextVar("openstack_cloud_selection", default=(None, None))
+)
+
+
+@dataclass
+class PooledConnection:
+    """OpenStack connection tracked by the connection pool"""
+
+    connection: "connection.Connection"
+    created_at: float
+    last_used_at: float
+
+
+class OpenStackConnectionPool:
+    """
+    Thread-safe pool of OpenStack connections for a single cloud and region.
+
+    Each connection keeps its own keystoneauth session, so HTTP keep-alive
+    connections are reused by whichever worker leases it next.
+    """
+
+    def __init__(
+        self,
+        cloud_name: str,
+        size: int,
+        idle_timeout: float,
+        max_age: float,
+        region_name: str | None = None,
+        token_cache: TokenCache | None = None,
+    ):
+        self.cloud_name = cloud_name
+        self.region_name = region_name
+        self.token_cache = token_cache
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+
+        self._idle: list[PooledConnection] = []
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._created = 0
+        self._reused = 0
+        self._expired = 0
+
+    def acquire(self, timeout: float | None = None) -> PooledConnection:
+        """
+        Lease a connection, creating one if the pool is not full.
+
+        :param timeout: Seconds to wait for a free connection, or None to wait forever.
+        :return: The leased connection.
+        :raises TimeoutError: If no connection became available in time.
+        """
+        expired = []
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._idle:
+                    pooled = self._idle.pop()
+                    if self._is_expired(pooled, now):
+                        expired.append(pooled)
+                        continue
+                    self._in_use += 1
+                    self._reused += 1
+                    pooled.last_used_at = now
+                    break
+                else:
+                    pooled = None
+
+                if pooled is not None:
+                    break
+                if self._in_use < self.size:
+                    self._in_use += 1
+                    break
+                if not self._cond.wait(timeout):
+                    self._close_all(expired)
+                    raise TimeoutError(
+                        f"No OpenStack connection available for cloud "
+                        f"{self.cloud_name} within {timeout} seconds",
+                    )
+
+        self._close_all(expired)
+        # Connect outside of the lock, the slot is already reserved.
+        try:
+            if pooled is None:
+                conn = self._connect()
+                now = time.monotonic()
+                with self._cond:
+                    self._created += 1
+                pooled = PooledConnection(
+                    connection=conn,
+                    created_at=now,
+                    last_used_at=now,
+                )
+            else:
+                ensure_fresh_token(
+                    pooled.connection,
+                    self.cloud_name,
+                    self.token_cache,
+                )
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        return pooled
+
+    def release(self, pooled: PooledConnection) -> None:
+        """
+        Return a leased connection to the pool.
+
+        :param pooled: The connection returned by acquire().
+        """
+        now = time.monotonic()
+        pooled.last_used_at = now
+        with self._cond:
+            self._in_use -= 1
+            if now - pooled.created_at >= self.max_age:
+                self._expired += 1
+                retired = [pooled]
+            else:
+                # Most recently used connections are handed out first, so
+                # their keep-alive sessions are the least likely to be stale.
+                self._idle.append(pooled)
+                retired = self._evict_idle(now)
+            self._cond.notify()
+        self._close_all(retired)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        self._close_all(idle)
+
+    def stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        :return: Pool size, usage and lifetime counters.
+        """
+        with self._cond:
+            return {
+                "cloud": self.cloud_name,
+                "region": self.region_name,
+                "size": self.size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "created": self._created,
+                "reused": self._reused,
+                "expired": self._expired,
+            }
+
+    def _connect(self) -> "connection.Connection":
+        import openstack
+
+        if self.region_name is None:
+            conn = openstack.connect(cloud=self.cloud_name)
+        else:
+            conn = openstack.connect(
+                cloud=self.cloud_name,
+                region_name=self.region_name,
+            )
+        track_upstream_requests(conn)
+        trace_upstream_requests(conn)
+        # Reuse a cached token and catalog instead of authenticating again.
+        ensure_fresh_token(conn, self.cloud_name, self.token_cache)
+        return conn
+
+    def _is_expired(self, pooled: PooledConnection, now: float) -> bool:
+        if now - pooled.created_at >= self.max_age:
+            self._expired += 1
+            return True
+        if now - pooled.last_used_at >= self.idle_timeout:
+            self._expired += 1
+            return True
+        return False
+
+    def _evict_idle(self, now: float) -> list[PooledConnection]:
+        keep, retired = [], []
+        for pooled in self._idle:
+            if self._is_expired(pooled, now):
+                retired.append(pooled)
+            else:
+                keep.append(pooled)
+        self._idle = keep
+        return retired
+
+    @staticmethod
+    def _close_all(pooled_connections: list[PooledConnection]) -> None:
+        for pooled in pooled_connections:
+            try:
+                pooled.connection.close()
+            except Exception:  # noqa: S110
+                pass
+
 
 class OpenStackConnectionManager:
-    """OpenStack Connection Manager"""
+    """
+    OpenStack Connection Manager
+
+    Holds one lazily created connection pool per clouds.yaml entry and region.
+    """
+
+    _pools: dict[tuple[str, str | None], OpenStackConnectionPool] = {}
+    _lock = threading.Lock()
+    _leases = threading.local()
+    _logging_enabled = False
+
+    @staticmethod
+    def resolve(
+        cloud: str | None = None,
+        region: str | None = None,
+    ) -> tuple[str, str | None]:
+        """
+        Resolve the cloud and region to connect to.
+
+        Explicit arguments win over the selection of the current tool call,
+        which wins over the configured default cloud.
+        """
+        if cloud is None:
+            cloud, selected_region = _cloud_selection.get()
+            region = region or selected_region
+        return cloud or config.MCP_CLOUD_NAME, region
+
+    @classmethod
+    def get_pool(
+        cls,
+        cloud: str | None = None,
+        region: str | None = None,
+    ) -> OpenStackConnectionPool:
+        """OpenStack Connection Pool"""
+        key = cls.resolve(cloud, region)
+        pool = cls._pools.get(key)
+        if pool is None:
+            with cls._lock:
+                pool = cls._pools.get(key)
+                if pool is None:
+                    if not cls._logging_enabled:
+                        import openstack
+
+                        openstack.enable_logging(debug=config.MCP_DEBUG_MODE)
+                        cls._logging_enabled = True
+                    pool = OpenStackConnectionPool(
+                        cloud_name=key[0],
+                        region_name=key[1],
+                        size=config.MCP_CONN_POOL_SIZE,
+                        idle_timeout=config.MCP_CONN_IDLE_TIMEOUT,
+                        max_age=config.MCP_CONN_MAX_AGE,
+                        token_cache=get_token_cache(),
+                    )
+                    cls._pools[key] = pool
+        return pool
+
+    @classmethod
+    def get_connection(
+        cls,
+        cloud: str | None = None,
+        region: str | None = None,
+    ) -> "connection.Connection":
+        """
+        OpenStack Connection
 
-    _connection: connection.Connection | None = None
+        The connection is leased from the pool for the calling thread and is
+        kept until release_connection() is called from the same thread.
+        """
+        key = cls.resolve(cloud, region)
+        leases = cls._thread_leases()
+        lease = leases.get(key)
+        if lease is None:
+            pool = cls.get_pool(*key)
+            lease = leases[key] = (pool, pool.acquire())
+        return lease[1].connection
 
     @classmethod
-    def get_connection(cls) -> connection.Connection:
-        """OpenStack Connection"""
-        if cls._connection is None:
-            openstack.enable_logging(debug=config.MCP_DEBUG_MODE)
-            cls._connection = openstack.connect(cloud=config.MCP_CLOUD_NAME)
-        return cls._connection
+    def release_connection(cls) -> None:
+        """Return the connections leased by the calling thread to the pools."""
+        leases = cls._thread_leases()
+        while leases:
+            _, (pool, pooled) = leases.popitem()
+            pool.release(pooled)
+
+    @classmethod
+    def get_stats(cls) -> list[dict]:
+        """Connection pool statistics for every cloud and region"""
+        with cls._lock:
+            pools = list(cls._pools.values())
+        return [pool.stats() for pool in pools]
+
+    @classmethod
+    def close(cls) -> None:
+        """Close every connection pool."""
+        with cls._lock:
+            pools, cls._pools = cls._pools, {}
+        for pool in pools.values():
+            pool.close()
+
+    @classmethod
+    def _thread_leases(
+        cls,
+    ) -> dict[
+        tuple[str, str | None],
+        tuple[OpenStackConnectionPool, PooledConnection],
+    ]:
+        leases = getattr(cls._leases, "by_cloud", None)
+        if leases is None:
+            leases = cls._leases.by_cloud = {}
+        return leases
 
 
 _openstack_connection_manager = OpenStackConnectionManager()
 
 
-def get_openstack_conn():
+@contextlib.contextmanager
+def cloud_selection(
+    cloud: str | None = None,
+    region: str | None = None,
+) -> Iterator[None]:
+    """
+    Select the cloud and region used by get_openstack_conn() in this context.
+
+    :param cloud: Name of the clouds.yaml entry, or None for the default.
+    :param region: Region name, or None for the cloud's default region.
+    """
+    token = _cloud_selection.set((cloud, region))
+    try:
+        yield
+    finally:
+        _cloud_selection.reset(token)
+
+
+def get_openstack_conn(cloud: str | None = None, region: str | None = None):
     """Get OpenStack Connection"""
-    return _openstack_connection_manager.get_connection()
+    return _openstack_connection_manager.get_connection(cloud, region)
+
+
+def release_openstack_conn():
+    """Release the OpenStack Connections leased by the current thread"""
+    _openstack_connection_manager.release_connection()
+
+
+def get_connection_pool_stats() -> list[dict]:
+    """Get OpenStack Connection Pool statistics"""
+    return _openstack_connection_manager.get_stats()
+
+
+def import_sdk() -> None:
+    """Import the OpenStack SDK ahead of the first tool call"""
+    start = time.perf_counter()
+    import openstack  # noqa: F401
+
+    logger.info(
+        f"Imported the OpenStack SDK in {time.perf_counter() - start:.2f}s",
+    )
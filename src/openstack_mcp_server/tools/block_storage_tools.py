@@ -1,10 +1,16 @@
 from fastmcp import FastMCP
 
-from .base import get_openstack_conn
+from .base import get_openstack_conn, release_openstack_conn
+from .cache import cached, invalidates
+from .delta import latest_timestamp, snapshot_store
+from .response.base import CompactTable, project
 from .response.block_storage import (
     Volume,
     VolumeAttachment,
+    VolumeDelta,
 )
+from .table import OutputFormatEnum, table_output
+from .waiter import wait_for_status
 
 
 class BlockStorageTools:
@@ -17,15 +23,27 @@ class BlockStorageTools:
         Register Block Storage-related tools with the FastMCP instance.
         """
         mcp.tool()(self.get_volumes)
+        mcp.tool()(self.get_volumes_delta)
         mcp.tool()(self.get_volume_details)
         mcp.tool()(self.create_volume)
         mcp.tool()(self.delete_volume)
         mcp.tool()(self.extend_volume)
 
-    def get_volumes(self) -> list[Volume]:
+    @table_output
+    @cached("volumes")
+    def get_volumes(
+        self,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Volume] | CompactTable:
         """
         Get the list of Block Storage volumes.
 
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: A list of Volume objects representing the volumes.
         """
         conn = get_openstack_conn()
@@ -33,41 +51,88 @@ class BlockStorageTools:
         # List the volumes
         volume_list = []
         for volume in conn.block_storage.volumes():
-            attachments = []
-            for attachment in volume.attachments or []:
-                attachments.append(
-                    VolumeAttachment(
-                        server_id=attachment.get("server_id"),
-                        device=attachment.get("device"),
-                        attachment_id=attachment.get("id"),
-                    ),
+            volume_list.append(self._convert_to_volume_model(volume))
+
+        return project(volume_list, fields)
+
+    def get_volumes_delta(self, full_sync: bool = False) -> VolumeDelta:
+        """
+        Get the volumes created, updated or deleted since the previous call.
+
+        The first call lists every volume and returns them as created. Later
+        calls request details only for volumes updated since the previous
+        sync through Cinder's `updated_at` filter, and detect deletions from
+        a listing without details.
+
+        Every client session has its own sync state, so sessions do not
+        consume each other's changes.
+
+        :param full_sync: List every volume again and diff the full listing
+            against the previous sync.
+        :return: A VolumeDelta with the changes and the sync timestamp.
+        """
+        from openstack import exceptions
+
+        snapshot = snapshot_store.get("volumes")
+        with snapshot.lock:
+            since = None if full_sync else snapshot.since
+            conn = get_openstack_conn()
+
+            if since:
+                current_ids = {
+                    volume.id
+                    for volume in conn.block_storage.volumes(details=False)
+                }
+                volumes = list(
+                    conn.block_storage.volumes(updated_at=f"gte:{since}"),
                 )
+                deleted = snapshot.items.keys() - current_ids
+                # Volumes still being created may not have updated_at yet.
+                known_ids = snapshot.items.keys() | {v.id for v in volumes}
+                for volume_id in current_ids - known_ids:
+                    try:
+                        volume = conn.block_storage.get_volume(volume_id)
+                    except exceptions.NotFoundException:
+                        # Deleted since the listing
+                        deleted.add(volume_id)
+                    else:
+                        volumes.append(volume)
+            else:
+                volumes = list(conn.block_storage.volumes())
+                deleted = set()
 
-            volume_list.append(
-                Volume(
-                    id=volume.id,
-                    name=volume.name,
-                    status=volume.status,
-                    size=volume.size,
-                    volume_type=volume.volume_type,
-                    availability_zone=volume.availability_zone,
-                    created_at=str(volume.created_at)
-                    if volume.created_at
-                    else None,
-                    is_bootable=volume.is_bootable,
-                    is_encrypted=volume.is_encrypted,
-                    description=volume.description,
-                    attachments=attachments,
-                ),
+            changed = {
+                volume.id: self._convert_to_volume_model(volume)
+                for volume in volumes
+            }
+            created, updated, deleted = snapshot.apply(
+                changed,
+                deleted,
+                complete=since is None,
+            )
+            snapshot.since = latest_timestamp(
+                (volume.updated_at or volume.created_at for volume in volumes),
+                since,
             )
 
-        return volume_list
+            return VolumeDelta(
+                created=created,
+                updated=updated,
+                deleted=deleted,
+                full_sync=since is None,
+                since=snapshot.since,
+            )
 
-    def get_volume_details(self, volume_id: str) -> Volume:
+    def get_volume_details(
+        self,
+        volume_id: str,
+        fields: list[str] | None = None,
+    ) -> Volume:
         """
         Get detailed information about a specific volume.
 
         :param volume_id: The ID of the volume to get details for
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
         :return: A Volume object with detailed information
         """
         conn = get_openstack_conn()
@@ -84,7 +149,7 @@ class BlockStorageTools:
                 ),
             )
 
-        return Volume(
+        volume_obj = Volume(
             id=volume.id,
             name=volume.name,
             status=volume.status,
@@ -98,6 +163,9 @@ class BlockStorageTools:
             attachments=attachments,
         )
 
+        return project(volume_obj, fields)
+
+    @invalidates("volumes")
     def create_volume(
         self,
         name: str,
@@ -107,6 +175,8 @@ class BlockStorageTools:
         availability_zone: str | None = None,
         bootable: bool | None = None,
         image: str | None = None,
+        wait: bool = False,
+        timeout: int = 600,
     ) -> Volume:
         """
         Create a new volume.
@@ -118,6 +188,8 @@ class BlockStorageTools:
         :param availability_zone: Optional availability zone
         :param bootable: Optional flag to make the volume bootable
         :param image: Optional Image name, ID or object from which to create
+        :param wait: Wait until the volume is available
+        :param timeout: Seconds to wait when `wait` is set
         :return: The created Volume object
         """
         conn = get_openstack_conn()
@@ -139,6 +211,16 @@ class BlockStorageTools:
             bootable=bootable,
             **volume_kwargs,
         )
+        if wait:
+            # The waiter polls with its own connection.
+            release_openstack_conn()
+            volume = wait_for_status(
+                "volumes",
+                volume.id,
+                ["available"],
+                timeout,
+                failures=["error"],
+            )
 
         volume_obj = Volume(
             id=volume.id,
@@ -156,6 +238,7 @@ class BlockStorageTools:
 
         return volume_obj
 
+    @invalidates("volumes")
     def delete_volume(self, volume_id: str, force: bool = False) -> None:
         """
         Delete a volume.
@@ -172,6 +255,7 @@ class BlockStorageTools:
             ignore_missing=False,
         )
 
+    @invalidates("volumes")
     def extend_volume(self, volume_id: str, new_size: int) -> None:
         """
         Extend a volume to a new size.
@@ -183,3 +267,34 @@ class BlockStorageTools:
         conn = get_openstack_conn()
 
         conn.block_storage.extend_volume(volume_id, new_size)
+
+    def _convert_to_volume_model(self, volume) -> Volume:
+        """
+        Convert an OpenStack Volume object to a Volume pydantic model.
+
+        :param volume: OpenStack volume object
+        :return: Pydantic Volume model
+        """
+        attachments = []
+        for attachment in volume.attachments or []:
+            attachments.append(
+                VolumeAttachment(
+                    server_id=attachment.get("server_id"),
+                    device=attachment.get("device"),
+                    attachment_id=attachment.get("id"),
+                ),
+            )
+
+        return Volume(
+            id=volume.id,
+            name=volume.name,
+            status=volume.status,
+            size=volume.size,
+            volume_type=volume.volume_type,
+            availability_zone=volume.availability_zone,
+            created_at=str(volume.created_at) if volume.created_at else None,
+            is_bootable=volume.is_bootable,
+            is_encrypted=volume.is_encrypted,
+            description=volume.description,
+            attachments=attachments,
+        )
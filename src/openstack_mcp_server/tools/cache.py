@@ -0,0 +1,435 @@
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+import pydantic_core
+
+from pydantic import TypeAdapter, ValidationError
+
+from openstack_mcp_server import config
+
+from .base import OpenStackConnectionManager, logger, release_openstack_conn
+
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, ttl: float, max_entries: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[Any, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented every time the cache is cleared"""
+        return self._generation
+
+    def get(self, key: Any) -> tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        :param key: The cache key.
+        :return: A (hit, value) tuple. value is None on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, entry[2]
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return False, None
+
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entries if needed.
+
+        Values larger than the memory cap are not cached.
+
+        :param key: The cache key.
+        :param value: The value to cache.
+        :param generation: The generation read before the value was fetched.
+            The value is dropped if the cache was cleared in the meantime.
+        """
+        if self.ttl <= 0:
+            return
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            if self._entries:
+                self._invalidations += 1
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        :return: Hit/miss counters and current usage.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: Any) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+def _estimate_size(value: Any) -> int:
+    try:
+        return len(pydantic_core.to_json(value))
+    except pydantic_core.PydanticSerializationError:
+        return sys.getsizeof(value)
+
+
+class ResponseCache:
+    """Per-resource-type TTL caches in front of the list tools"""
+
+    def __init__(self):
+        self._caches: dict[str, TTLCache] = {}
+        self._lock = threading.Lock()
+
+    def get_cache(self, resource: str) -> TTLCache:
+        """
+        Get the cache of a resource type, creating it on first use.
+
+        :param resource: The resource type, e.g. `servers`.
+        :return: The TTL cache of the resource type.
+        """
+        cache = self._caches.get(resource)
+        if cache is None:
+            with self._lock:
+                cache = self._caches.get(resource)
+                if cache is None:
+                    cache = self._caches[resource] = TTLCache(
+                        ttl=config.MCP_CACHE_TTL_OVERRIDES.get(
+                            resource,
+                            config.MCP_CACHE_TTL,
+                        ),
+                        max_entries=config.MCP_CACHE_MAX_ENTRIES,
+                        max_bytes=config.MCP_CACHE_MAX_BYTES,
+                    )
+        return cache
+
+    def invalidate(self, *resources: str) -> None:
+        """
+        Drop the cached responses of the given resource types.
+
+        :param resources: The resource types to invalidate.
+        """
+        for resource in resources:
+            cache = self._caches.get(resource)
+            if cache is not None:
+                cache.clear()
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.invalidate(*list(self._caches))
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Get the statistics of every resource type cache.
+
+        :return: Cache statistics keyed by resource type.
+        """
+        return {
+            resource: cache.stats()
+            for resource, cache in list(self._caches.items())
+        }
+
+
+response_cache = ResponseCache()
+
+
+def cached(resource: str) -> Callable:
+    """
+    Cache the result of a list tool method.
+
+    Results are keyed by the selected cloud and region and the call
+    arguments, and expire after the TTL configured for the resource type.
+
+    :param resource: The resource type returned by the tool.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = response_cache.get_cache(resource)
+            key = (
+                OpenStackConnectionManager.resolve(),
+                func.__name__,
+                repr(args),
+                repr(sorted(kwargs.items())),
+            )
+            generation = cache.generation
+            hit, value = cache.get(key)
+            if not hit:
+                value = func(self, *args, **kwargs)
+                cache.set(key, value, generation)
+            return list(value) if isinstance(value, list) else value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*resources: str) -> Callable:
+    """
+    Invalidate the cached list results of resource types after a write.
+
+    The caches are dropped even if the call fails, as the write may have
+    been partially applied.
+
+    :param resources: The resource types modified by the tool.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                response_cache.invalidate(*resources)
+                catalog_cache.invalidate(*resources)
+
+        return wrapper
+
+    return decorator
+
+
+class CatalogCache:
+    """
+    Long-lived snapshots of lists that rarely change, e.g. flavors.
+
+    A snapshot is served as is, without calling the API, until it is
+    `max_age` seconds old. Snapshots older than `refresh_after` seconds
+    are refreshed in the background. With a directory, snapshots
+    are also written to files and survive restarts. A max age of zero
+    disables the cache.
+    """
+
+    def __init__(
+        self,
+        refresh_after: float,
+        max_age: float,
+        directory: Path | None = None,
+    ):
+        self.refresh_after = refresh_after
+        self.max_age = max_age
+        self.directory = Path(directory) if directory is not None else None
+
+        # (resource, cloud, region) -> (fetch time, value)
+        self._snapshots: dict[tuple, tuple[float, Any]] = {}
+        self._refreshing: set[tuple] = set()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        resource: str,
+        value_type: type[T],
+        fetch: Callable[[], T],
+    ) -> T:
+        """
+        Get the snapshot of a list for the selected cloud and region.
+
+        :param resource: The resource type, e.g. `flavors`.
+        :param value_type: Type of the list, used to read snapshot files.
+        :param fetch: Function listing the resources from the API.
+        :return: The snapshot, a copy if it is a list.
+        """
+        if self.max_age <= 0:
+            return fetch()
+        key = (resource, *OpenStackConnectionManager.resolve())
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = self._load(key, value_type)
+        age = time.time() - snapshot[0] if snapshot else None
+        if snapshot is None or age > self.max_age:
+            value = self._fetch(key, fetch)
+        else:
+            value = snapshot[1]
+            if age > self.refresh_after:
+                self._refresh_in_background(key, fetch)
+        return list(value) if isinstance(value, list) else value
+
+    def invalidate(self, *resources: str) -> None:
+        """
+        Drop the snapshots of the given resource types.
+
+        :param resources: The resource types to invalidate.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._snapshots if k[0] in resources]:
+                del self._snapshots[key]
+        if self.directory is not None:
+            for resource in resources:
+                for path in self.directory.glob(f"{resource}-*.json"):
+                    path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop every snapshot kept in memory."""
+        with self._lock:
+            self._generation += 1
+            self._snapshots.clear()
+
+    def _fetch(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        generation = self._generation
+        value = fetch()
+        fetched_at = time.time()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._snapshots[key] = (fetched_at, value)
+        self._save(key, fetched_at, value)
+        return value
+
+    def _refresh_in_background(
+        self,
+        key: tuple,
+        fetch: Callable[[], Any],
+    ) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        # The copied context holds the cloud selection of the caller.
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._refresh, key, fetch),
+            name="openstack-mcp-catalog-refresh",
+            daemon=True,
+        ).start()
+
+    def _refresh(self, key: tuple, fetch: Callable[[], Any]) -> None:
+        try:
+            self._fetch(key, fetch)
+        except Exception:
+            logger.warning(f"Failed to refresh {key[0]}", exc_info=True)
+        finally:
+            release_openstack_conn()
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _path(self, key: tuple) -> Path:
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        return self.directory / f"{key[0]}-{digest}.json"
+
+    def _load(
+        self,
+        key: tuple,
+        value_type: type,
+    ) -> tuple[float, Any] | None:
+        if self.directory is None:
+            return None
+        try:
+            data = json.loads(self._path(key).read_text())
+            snapshot = (
+                float(data["fetched_at"]),
+                _adapter(value_type).validate_python(data["value"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError, ValidationError):
+            return None
+        with self._lock:
+            self._snapshots.setdefault(key, snapshot)
+        return snapshot
+
+    def _save(self, key: tuple, fetched_at: float, value: Any) -> None:
+        if self.directory is None:
+            return
+        try:
+            data = pydantic_core.to_json(
+                {"fetched_at": fetched_at, "value": value},
+            )
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Atomic so concurrent processes never read a partial file.
+            os.replace(tmp_path, self._path(key))
+        except (OSError, pydantic_core.PydanticSerializationError):
+            logger.warning(
+                f"Failed to write catalog snapshot in {self.directory}",
+                exc_info=True,
+            )
+
+
+@functools.cache
+def _adapter(value_type: type) -> TypeAdapter:
+    return TypeAdapter(value_type)
+
+
+catalog_cache = CatalogCache(
+    refresh_after=config.MCP_CATALOG_REFRESH,
+    max_age=(
+        0 if config.MCP_CATALOG_CACHE == "none" else config.MCP_CATALOG_MAX_AGE
+    ),
+    directory=(
+        config.MCP_CATALOG_CACHE_DIR
+        if config.MCP_CATALOG_CACHE == "file"
+        else None
+    ),
+)
+
+
+def get_cache_stats() -> dict[str, dict]:
+    """Get the hit/miss statistics of the list tool caches"""
+    return response_cache.stats()
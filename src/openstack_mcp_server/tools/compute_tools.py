@@ -1,3 +1,6 @@
+import itertools
+import re
+
 from enum import Enum
 from typing import Any
 
@@ -6,9 +9,29 @@ from fastmcp import FastMCP
 from openstack_mcp_server.tools.response.compute import (
     Flavor,
     Server,
+    ServerActionResult,
+    ServerActionSummary,
+    ServerBulkCreateResult,
+    ServerDelta,
+    ServerPage,
 )
 
-from .base import get_openstack_conn
+from .base import get_openstack_conn, release_openstack_conn
+from .cache import cached, catalog_cache, invalidates
+from .convert import ModelConverter
+from .delta import latest_timestamp, snapshot_store
+from .executor import fan_out
+from .freshness import FreshnessEnum, resolve_freshness
+from .pagination import decode_cursor, encode_cursor
+from .resolver import name_resolver
+from .response.base import BulkError, CompactTable, project
+from .retry import retry_with_backoff
+from .table import OutputFormatEnum, table_output
+from .waiter import status_waiter, wait_for_status
+
+
+to_server = ModelConverter(Server)
+to_flavor = ModelConverter(Flavor)
 
 
 class ServerActionEnum(str, Enum):
@@ -29,6 +52,23 @@ class ServerActionEnum(str, Enum):
     UNSHELVE = "unshelve"
 
 
+# Server statuses reached once an action completed
+ACTION_TARGET_STATUSES = {
+    ServerActionEnum.PAUSE: {"PAUSED"},
+    ServerActionEnum.UNPAUSE: {"ACTIVE"},
+    ServerActionEnum.SUSPEND: {"SUSPENDED"},
+    ServerActionEnum.RESUME: {"ACTIVE"},
+    ServerActionEnum.RESCUE: {"RESCUE"},
+    ServerActionEnum.UNRESCUE: {"ACTIVE"},
+    ServerActionEnum.START: {"ACTIVE"},
+    ServerActionEnum.STOP: {"SHUTOFF"},
+    # Nova offloads shelved servers right away unless configured otherwise.
+    ServerActionEnum.SHELVE: {"SHELVED", "SHELVED_OFFLOADED"},
+    ServerActionEnum.SHELVE_OFFLOAD: {"SHELVED_OFFLOADED"},
+    ServerActionEnum.UNSHELVE: {"ACTIVE"},
+}
+
+
 class ComputeTools:
     """
     A class to encapsulate Compute-related tools and utilities.
@@ -39,92 +79,484 @@ class ComputeTools:
         Register Compute-related tools with the FastMCP instance.
         """
         mcp.tool()(self.get_servers)
+        mcp.tool()(self.get_servers_page)
+        mcp.tool()(self.get_servers_delta)
         mcp.tool()(self.get_server)
         mcp.tool()(self.create_server)
+        mcp.tool()(self.create_servers)
         mcp.tool()(self.get_flavors)
         mcp.tool()(self.action_server)
+        mcp.tool()(self.action_servers)
         mcp.tool()(self.update_server)
         mcp.tool()(self.delete_server)
 
-    def get_servers(self) -> list[Server]:
+    @table_output
+    @cached("servers")
+    def get_servers(
+        self,
+        status: str | None = None,
+        name: str | None = None,
+        host: str | None = None,
+        flavor: str | None = None,
+        image: str | None = None,
+        changes_since: str | None = None,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Server] | CompactTable:
         """
         Get the list of Compute servers.
 
+        All filters are applied server-side by Nova. For large projects use
+        get_servers_page() to page through the results instead.
+
+        :param status: Filter by server status (e.g., `ACTIVE`, `SHUTOFF`)
+        :param name: Filter by server name (regular expression)
+        :param host: Filter by compute host name (admin only)
+        :param flavor: Filter by flavor ID
+        :param image: Filter by image ID
+        :param changes_since: Only servers changed since this ISO 8601 timestamp
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: A list of Server objects.
         """
         conn = get_openstack_conn()
-        server_list = []
-        for server in conn.compute.servers():
-            server_list.append(Server(**server))
+        query = self._build_server_query(
+            status,
+            name,
+            host,
+            flavor,
+            image,
+            changes_since,
+        )
+        server_list = to_server.convert_all(conn.compute.servers(**query))
 
-        return server_list
+        return project(server_list, fields)
 
-    def get_server(self, id: str) -> Server:
+    @cached("servers")
+    def get_servers_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        status: str | None = None,
+        name: str | None = None,
+        host: str | None = None,
+        flavor: str | None = None,
+        image: str | None = None,
+        changes_since: str | None = None,
+        fields: list[str] | None = None,
+    ) -> ServerPage:
+        """
+        Get one page of Compute servers.
+
+        Pass the returned `next_cursor` as `cursor` to get the next page.
+        The filters of the first page are kept in the cursor, so filter
+        parameters are ignored when `cursor` is given.
+
+        :param limit: Maximum number of servers in the page (1-1000)
+        :param cursor: Continuation cursor returned by the previous page
+        :param status: Filter by server status (e.g., `ACTIVE`, `SHUTOFF`)
+        :param name: Filter by server name (regular expression)
+        :param host: Filter by compute host name (admin only)
+        :param flavor: Filter by flavor ID
+        :param image: Filter by image ID
+        :param changes_since: Only servers changed since this ISO 8601 timestamp
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :return: A ServerPage with the servers and the next page cursor.
+        """
+        if not 1 <= limit <= 1000:
+            raise ValueError("limit must be between 1 and 1000")
+
+        if cursor:
+            marker, query = decode_cursor(cursor)
+        else:
+            marker = None
+            query = self._build_server_query(
+                status,
+                name,
+                host,
+                flavor,
+                image,
+                changes_since,
+            )
+
+        conn = get_openstack_conn()
+        page_query = dict(query, limit=limit + 1)
+        if marker:
+            page_query["marker"] = marker
+
+        # One extra item tells whether another page exists, islice stops
+        # the SDK generator before it requests the following page.
+        servers = list(
+            itertools.islice(conn.compute.servers(**page_query), limit + 1),
+        )
+        next_cursor = None
+        if len(servers) > limit:
+            servers = servers[:limit]
+            next_cursor = encode_cursor(servers[-1]["id"], query)
+
+        return ServerPage(
+            servers=project(to_server.convert_all(servers), fields),
+            next_cursor=next_cursor,
+        )
+
+    def _build_server_query(
+        self,
+        status: str | None,
+        name: str | None,
+        host: str | None,
+        flavor: str | None,
+        image: str | None,
+        changes_since: str | None,
+    ) -> dict[str, Any]:
+        """
+        Build Nova query parameters from the server filters.
+
+        :return: Query parameters for conn.compute.servers()
+        """
+        query: dict[str, Any] = {
+            "status": status.upper() if status else None,
+            "name": name,
+            "compute_host": host,
+            "flavor": flavor,
+            "image": image,
+            "changes_since": changes_since,
+        }
+        return {k: v for k, v in query.items() if v is not None}
+
+    def get_servers_delta(self, full_sync: bool = False) -> ServerDelta:
+        """
+        Get the servers created, updated or deleted since the previous call.
+
+        The first call lists every server and returns them as created. Later
+        calls only request servers changed since the previous sync through
+        Nova's changes-since filter, which also returns deleted servers.
+
+        Every client session has its own sync state, so sessions do not
+        consume each other's changes.
+
+        :param full_sync: List every server again and diff the full listing
+            against the previous sync.
+        :return: A ServerDelta with the changes and the sync timestamp.
+        """
+        snapshot = snapshot_store.get("servers")
+        with snapshot.lock:
+            since = None if full_sync else snapshot.since
+            conn = get_openstack_conn()
+            query = {"changes_since": since} if since else {}
+
+            changed = {}
+            deleted = []
+            timestamps = []
+            for server in conn.compute.servers(**query):
+                timestamps.append(server.get("updated_at"))
+                if server.get("status") == "DELETED":
+                    deleted.append(server["id"])
+                else:
+                    changed[server["id"]] = to_server(server)
+
+            created, updated, deleted = snapshot.apply(
+                changed,
+                deleted,
+                complete=since is None,
+            )
+            snapshot.since = latest_timestamp(timestamps, since)
+
+            return ServerDelta(
+                created=created,
+                updated=updated,
+                deleted=deleted,
+                full_sync=since is None,
+                since=snapshot.since,
+            )
+
+    def get_server(
+        self,
+        id: str,
+        fields: list[str] | None = None,
+    ) -> Server:
         """
         Get a specific Compute server.
 
         :param id: The ID of the server to retrieve.
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
         :return: A Server object.
         """
         conn = get_openstack_conn()
         server = conn.compute.get_server(id)
-        return Server(**server)
+        return project(to_server(server), fields)
 
+    @invalidates("servers", "ports", "floating_ips")
     def create_server(
         self,
         name: str,
         image: str,
-        flavor: int,
+        flavor: int | str,
         network: str,
         key_name: str | None = None,
         security_groups: list[str] | None = None,
         user_data: str | None = None,
+        wait: bool = False,
+        timeout: int = 600,
+        freshness: FreshnessEnum | None = None,
     ) -> Server:
         """
         Create a new Compute server.
 
         :param name: The name of the server.
-        :param image: The ID of the image to use.
-        :param flavor: The ID of the flavor to use.
-        :param network: The ID of the network to attach.
+        :param image: The name or ID of the image to use.
+        :param flavor: The name or ID of the flavor to use.
+        :param network: The name or ID of the network to attach.
         :param key_name: The name of the key pair to use.
         :param security_groups: A list of security group names to attach.
         :param user_data: User data to pass to the server.
+        :param wait: Wait until the server is ACTIVE
+        :param timeout: Seconds to wait when `wait` is set
+        :param freshness: `full` fetches the created server, `minimal` skips
+            that call and only returns the requested attributes, `cached`
+            is the same as `minimal`, as no copy of a new server is known
+            (defaults to the RESPONSE_FRESHNESS setting)
         :return: A Server object
         """
         conn = get_openstack_conn()
-        server_params: dict[str, Any] = {
-            "name": name,
-            "flavorRef": flavor,
-            "imageRef": image,
-            "networks": [{"uuid": network}],
-            "key_name": key_name,
-            "security_groups": security_groups,
-            "user_data": user_data,
-        }
-        server_params = {
-            k: v for k, v in server_params.items() if v is not None
-        }
+        server_params = self._build_server_params(
+            conn,
+            name,
+            image,
+            flavor,
+            network,
+            key_name,
+            security_groups,
+            user_data,
+        )
 
         resp = conn.compute.create_server(**server_params)
-        # NOTE: The create_server method returns a server object with minimal information.
-        # To get the full server details, we need to fetch it again.
-        server = conn.compute.get_server(resp.id)
+        freshness = resolve_freshness(freshness)
+        if wait:
+            # The waiter polls with its own connection.
+            release_openstack_conn()
+            server = wait_for_status("servers", resp.id, ["ACTIVE"], timeout)
+        elif freshness == FreshnessEnum.FULL:
+            # NOTE: The create_server method returns a server object with minimal information.
+            # To get the full server details, we need to fetch it again.
+            server = conn.compute.get_server(resp.id)
+        else:
+            # The SDK merges the returned ID into the requested attributes.
+            return to_server(resp)
 
-        return Server(**server)
+        return to_server(server)
 
-    def get_flavors(self) -> list[Flavor]:
+    @invalidates("servers", "ports", "floating_ips")
+    def create_servers(
+        self,
+        name: str,
+        image: str,
+        flavor: int | str,
+        network: str,
+        count: int = 1,
+        min_count: int | None = None,
+        names: list[str] | None = None,
+        key_name: str | None = None,
+        security_groups: list[str] | None = None,
+        user_data: str | None = None,
+        max_concurrency: int | None = None,
+        wait: bool = False,
+        timeout: int = 600,
+        freshness: FreshnessEnum | None = None,
+    ) -> ServerBulkCreateResult:
+        """
+        Create many identical Compute servers at once.
+
+        The servers are created with a single Nova request, and their
+        details are fetched with a single listing filtered by the returned
+        reservation ID. Nova names them `<name>-1`, `<name>-2`, and so on.
+
+        :param name: The base name of the servers.
+        :param image: The name or ID of the image to use.
+        :param flavor: The name or ID of the flavor to use.
+        :param network: The name or ID of the network to attach.
+        :param count: The number of servers to create.
+        :param min_count: Create at least this many servers, up to `count`,
+            instead of failing when capacity is short (defaults to `count`)
+        :param names: Explicit server names. One server is created per name
+            with concurrent requests, and `name`, `count` and `min_count`
+            are ignored.
+        :param key_name: The name of the key pair to use.
+        :param security_groups: A list of security group names to attach.
+        :param user_data: User data to pass to the servers.
+        :param max_concurrency: Maximum number of concurrent creates when
+            `names` is given (defaults to the BULK_CONCURRENCY setting)
+        :param wait: Wait until every server is ACTIVE
+        :param timeout: Seconds to wait for the servers when `wait` is set
+        :param freshness: `full` lists the created servers, `minimal` and
+            `cached` skip that call, so only the reservation ID is returned,
+            or the requested attributes of servers created by `names`
+            (defaults to the RESPONSE_FRESHNESS setting)
+        :return: The reservation ID, the created servers and the errors.
+        :raises ValueError: If `count` or `min_count` is out of range.
+        """
+        conn = get_openstack_conn()
+        server_params = self._build_server_params(
+            conn,
+            name,
+            image,
+            flavor,
+            network,
+            key_name,
+            security_groups,
+            user_data,
+        )
+
+        # Waiting lists the servers anyway.
+        refetch = resolve_freshness(freshness) == FreshnessEnum.FULL
+        if names:
+            return self._create_named_servers(
+                server_params,
+                names,
+                max_concurrency,
+                wait,
+                timeout,
+                refetch and not wait,
+            )
+
+        min_count = count if min_count is None else min_count
+        if not 1 <= min_count <= count:
+            raise ValueError(
+                "count and min_count must be 1 <= min_count <= count"
+            )
+
+        # The SDK cannot request a reservation ID, so the request is sent
+        # through the proxy with the same body as compute.create_server().
+        response = conn.compute.post(
+            "/servers",
+            json={
+                "server": {
+                    **server_params,
+                    "min_count": min_count,
+                    "max_count": count,
+                    "return_reservation_id": True,
+                },
+            },
+        )
+        from openstack import exceptions
+
+        exceptions.raise_from_response(response)
+        reservation_id = response.json()["reservation_id"]
+        result = ServerBulkCreateResult(reservation_id=reservation_id)
+        if not (refetch or wait):
+            return result
+
+        servers = list(conn.compute.servers(reservation_id=reservation_id))
+        self._collect_created_servers(
+            result,
+            [(index, server["id"]) for index, server in enumerate(servers)],
+            {server["id"]: server for server in servers},
+            wait,
+            timeout,
+        )
+        return result
+
+    def _create_named_servers(
+        self,
+        server_params: dict[str, Any],
+        names: list[str],
+        max_concurrency: int | None,
+        wait: bool,
+        timeout: int,
+        refetch: bool,
+    ) -> ServerBulkCreateResult:
+        """Create one server per name with concurrent requests."""
+        # The creates below lease their own connections.
+        release_openstack_conn()
+
+        def create(server_name: str) -> Any:
+            conn = get_openstack_conn()
+            return retry_with_backoff(
+                conn.compute.create_server,
+                idempotent=False,
+                **{**server_params, "name": server_name},
+            )
+
+        result = ServerBulkCreateResult()
+        created = []
+        servers = {}
+        for index, (server, error) in enumerate(
+            fan_out(create, names, max_concurrency),
+        ):
+            if error is None:
+                created.append((index, server.id))
+                servers[server.id] = server
+            else:
+                result.errors.append(BulkError(index=index, error=str(error)))
+
+        if created and refetch:
+            servers = {}
+            # Fetch every created server with one listing by name.
+            conn = get_openstack_conn()
+            pattern = "|".join(re.escape(n) for n in dict.fromkeys(names))
+            for server in conn.compute.servers(name=f"^({pattern})$"):
+                servers[server["id"]] = server
+        self._collect_created_servers(result, created, servers, wait, timeout)
+        return result
+
+    def _collect_created_servers(
+        self,
+        result: ServerBulkCreateResult,
+        created: list[tuple[int, str]],
+        servers: dict[str, Any],
+        wait: bool,
+        timeout: int,
+    ) -> None:
+        """Add created servers to a result, once ACTIVE if `wait` is set."""
+        waits = {}
+        if wait and created:
+            # The waiter polls with its own connection.
+            release_openstack_conn()
+            waits = status_waiter.wait(
+                "servers",
+                [server_id for _, server_id in created],
+                ["ACTIVE"],
+                timeout,
+            )
+
+        for index, server_id in created:
+            waited = waits.get(server_id)
+            if waited is not None and waited.error:
+                result.errors.append(
+                    BulkError(index=index, error=waited.error, id=server_id),
+                )
+                continue
+            server = waited.resource if waited else servers.get(server_id)
+            if server is not None:
+                result.servers.append(to_server(server))
+
+    @table_output
+    def get_flavors(
+        self,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Flavor] | CompactTable:
         """
         Get flavors (server hardware configurations).
 
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: A list of Flavor objects.
         """
-        conn = get_openstack_conn()
-        flavor_list = []
-        for flavor in conn.compute.flavors():
-            flavor_list.append(Flavor(**flavor))
-        return flavor_list
 
+        def list_flavors() -> list[Flavor]:
+            conn = get_openstack_conn()
+            return to_flavor.convert_all(conn.compute.flavors())
+
+        flavor_list = catalog_cache.get("flavors", list[Flavor], list_flavors)
+        return project(flavor_list, fields)
+
+    @invalidates("servers")
     def action_server(self, id: str, action: ServerActionEnum) -> None:
         """
         Perform an action on a Compute server.
@@ -149,7 +581,151 @@ class ComputeTools:
         :raises ValueError: If the action is not supported or invalid(ConflictException).
         """
         conn = get_openstack_conn()
+        self._get_action_method(conn, action)(id)
+        return None
+
+    @invalidates("servers")
+    def action_servers(
+        self,
+        action: ServerActionEnum,
+        ids: list[str] | None = None,
+        name_prefix: str | None = None,
+        tag: str | None = None,
+        host: str | None = None,
+        status: str | None = None,
+        max_concurrency: int | None = None,
+        wait: bool = False,
+        timeout: int = 300,
+    ) -> ServerActionSummary:
+        """
+        Perform an action on many Compute servers at once.
+
+        Target servers are given by ID, or selected with filters applied
+        by Nova. The action is sent to the servers concurrently, and a
+        failure on one server does not stop the others.
+
+        :param action: The action to perform, see action_server().
+        :param ids: IDs of the target servers. Filters are ignored if given.
+        :param name_prefix: Select servers whose name starts with this prefix
+        :param tag: Select servers with this tag
+        :param host: Select servers on this compute host (admin only)
+        :param status: Select servers with this status (e.g., `ACTIVE`)
+        :param max_concurrency: Maximum number of concurrent actions
+            (defaults to the BULK_CONCURRENCY setting)
+        :param wait: Wait until every server reached the status expected
+            after the action
+        :param timeout: Seconds to wait for the servers when `wait` is set
+        :return: A summary with the result of every server.
+        :raises ValueError: If no ID or filter selects the target servers.
+        """
+        conn = get_openstack_conn()
+        self._get_action_method(conn, action)
+
+        if ids is None:
+            if not any((name_prefix, tag, host, status)):
+                raise ValueError(
+                    "Either ids or at least one filter must be given",
+                )
+            query = self._build_server_query(
+                status,
+                f"^{re.escape(name_prefix)}" if name_prefix else None,
+                host,
+                None,
+                None,
+                None,
+            )
+            if tag:
+                query["tags"] = tag
+            ids = [server["id"] for server in conn.compute.servers(**query)]
+        # The calls below lease their own connections.
+        release_openstack_conn()
+
+        def run_action(server_id: str) -> None:
+            conn = get_openstack_conn()
+            self._get_action_method(conn, action)(server_id)
+
+        errors = {
+            server_id: error
+            for server_id, (_, error) in zip(
+                ids,
+                fan_out(run_action, ids, max_concurrency),
+            )
+        }
+
+        # All the servers are awaited together with batched listings.
+        waits = {}
+        target_statuses = ACTION_TARGET_STATUSES.get(action)
+        if wait and target_statuses:
+            waits = status_waiter.wait(
+                "servers",
+                [server_id for server_id in ids if errors[server_id] is None],
+                target_statuses,
+                timeout,
+            )
+
+        results = []
+        for server_id in ids:
+            error = errors[server_id]
+            waited = waits.get(server_id)
+            if error is None and waited is not None:
+                error = waited.error
+            results.append(
+                ServerActionResult(
+                    id=server_id,
+                    success=error is None,
+                    status=waited.status if waited else None,
+                    error=str(error) if error else None,
+                ),
+            )
+
+        succeeded = sum(result.success for result in results)
+        return ServerActionSummary(
+            action=ServerActionEnum(action).value,
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results,
+        )
+
+    def _build_server_params(
+        self,
+        conn,
+        name: str,
+        image: str,
+        flavor: int | str,
+        network: str,
+        key_name: str | None,
+        security_groups: list[str] | None,
+        user_data: str | None,
+    ) -> dict[str, Any]:
+        """
+        Build the Nova attributes of a server to create.
+
+        Image, flavor and network names are resolved to IDs, checked
+        against the API so a renamed or replaced resource is not booted.
+        Key pair and security group names are passed as is, as Nova takes
+        names.
+        """
+        resolve_id = name_resolver.resolve_id
+        server_params: dict[str, Any] = {
+            "name": name,
+            "flavorRef": resolve_id(conn, "flavors", flavor, verify=True),
+            "imageRef": resolve_id(conn, "images", image, verify=True),
+            "networks": [
+                {"uuid": resolve_id(conn, "networks", network, verify=True)},
+            ],
+            "key_name": key_name,
+            "security_groups": security_groups,
+            "user_data": user_data,
+        }
+        return {k: v for k, v in server_params.items() if v is not None}
 
+    def _get_action_method(self, conn, action: ServerActionEnum):
+        """
+        Get the SDK method performing a server action.
+
+        :raises ValueError: If the action is not supported.
+        """
         action_methods = {
             ServerActionEnum.PAUSE: conn.compute.pause_server,
             ServerActionEnum.UNPAUSE: conn.compute.unpause_server,
@@ -169,9 +745,9 @@ class ComputeTools:
         if action not in action_methods:
             raise ValueError(f"Unsupported action: {action}")
 
-        action_methods[action](id)
-        return None
+        return action_methods[action]
 
+    @invalidates("servers")
     def update_server(
         self,
         id: str,
@@ -204,8 +780,9 @@ class ComputeTools:
             k: v for k, v in server_params.items() if v is not None
         }
         server = conn.compute.update_server(id, **server_params)
-        return Server(**server)
+        return to_server(server)
 
+    @invalidates("servers", "ports", "floating_ips", "volumes")
     def delete_server(self, id: str) -> None:
         """
         Delete a Compute server.
@@ -0,0 +1,66 @@
+from collections.abc import Iterable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from .tracing import span
+
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+
+
+class ModelConverter(Generic[M]):
+    """
+    Converts OpenStack SDK resources to a response model.
+
+    SDK resources are dicts of all their attributes, nested resources
+    included, so `Model(**resource)` copies every attribute into keyword
+    arguments and validates them all. The converter only picks the keys
+    the model reads, listed once per model, before validating them with
+    the compiled pydantic schema. The result is the same model.
+    """
+
+    def __init__(self, model: type[M]):
+        self.model = model
+        # Keys the model accepts: field names and validation aliases.
+        self.keys: tuple[str, ...] = tuple(
+            dict.fromkeys(
+                key
+                for name, field in model.model_fields.items()
+                for key in (name, field.validation_alias, field.alias)
+                if isinstance(key, str)
+            ),
+        )
+
+    def __call__(self, item: Any) -> M:
+        """
+        Convert one resource.
+
+        :param item: An SDK resource, or a dict of attributes.
+        :return: The response model.
+        """
+        data = {}
+        for key in self.keys:
+            # dict.get skips the attribute lookups of SDK resources.
+            value = dict.get(item, key, _MISSING)
+            if value is not _MISSING:
+                data[key] = value
+        return self.model.model_validate(data)
+
+    def convert_all(self, items: Iterable[Any]) -> list[M]:
+        """
+        Convert many resources.
+
+        Traced as one span, which also covers the API requests of lazy
+        SDK listings read meanwhile.
+
+        :param items: SDK resources, or dicts of attributes.
+        :return: The response models, in order.
+        """
+        with span(f"convert {self.model.__name__}") as current:
+            models = [self(item) for item in items]
+            if current is not None:
+                current.set_attribute("items", len(models))
+            return models
@@ -0,0 +1,149 @@
+import threading
+import weakref
+
+from collections.abc import Iterable
+from typing import Any
+
+from fastmcp.server.dependencies import get_context
+from pydantic import BaseModel
+
+from .base import OpenStackConnectionManager
+
+
+class Snapshot:
+    """
+    Local materialized copy of one resource type of one cloud.
+
+    Delta tools keep the last returned state of every item, so only the
+    differences with the previous sync are reported to the caller.
+    """
+
+    def __init__(self):
+        self.items: dict[str, BaseModel] = {}
+        # Opaque per-item version, e.g. the Neutron revision number.
+        self.revisions: dict[str, Any] = {}
+        # Server-side timestamp the next sync starts from.
+        self.since: str | None = None
+        # Held during a sync so concurrent syncs do not interleave.
+        self.lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Forget every item, so the next sync is a full listing."""
+        self.items.clear()
+        self.revisions.clear()
+        self.since = None
+
+    def apply(
+        self,
+        changed: dict[str, BaseModel],
+        deleted: Iterable[str] = (),
+        complete: bool = False,
+    ) -> tuple[list[BaseModel], list[BaseModel], list[str]]:
+        """
+        Merge fetched items into the snapshot.
+
+        Items equal to their snapshot copy are not reported, so overlapping
+        sync windows never return the same change twice.
+
+        :param changed: Fetched items keyed by ID.
+        :param deleted: IDs of items known to be deleted.
+        :param complete: Whether `changed` is a full listing, in which case
+            items missing from it are reported as deleted.
+        :return: The created items, updated items and deleted IDs.
+        """
+        deleted_ids = set(deleted)
+        if complete:
+            deleted_ids |= self.items.keys() - changed.keys()
+
+        created = []
+        updated = []
+        for item_id, item in changed.items():
+            previous = self.items.get(item_id)
+            if previous is None:
+                created.append(item)
+            elif previous != item:
+                updated.append(item)
+            self.items[item_id] = item
+
+        removed = []
+        for item_id in sorted(deleted_ids):
+            self.revisions.pop(item_id, None)
+            if self.items.pop(item_id, None) is not None:
+                removed.append(item_id)
+
+        return created, updated, removed
+
+
+def _client_session() -> Any:
+    try:
+        return get_context().session
+    except (RuntimeError, ValueError):
+        # Not called on behalf of a client request
+        return None
+
+
+class SnapshotStore:
+    """
+    Snapshots keyed by client session, cloud, region and resource type.
+
+    Every client session syncs against its own snapshots, so sessions never
+    consume each other's changes. Snapshots are dropped with their session.
+    Calls made outside of a client request share one set of snapshots.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[tuple, Snapshot] = {}
+        self._sessions: weakref.WeakKeyDictionary[
+            Any,
+            dict[tuple, Snapshot],
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, resource: str) -> Snapshot:
+        """
+        Get the snapshot of a resource type for the selected cloud.
+
+        :param resource: The resource type, e.g. `servers`.
+        :return: The snapshot of the client session, created empty on
+            first use.
+        """
+        key = (OpenStackConnectionManager.resolve(), resource)
+        session = _client_session()
+        with self._lock:
+            if session is None:
+                snapshots = self._snapshots
+            else:
+                snapshots = self._sessions.setdefault(session, {})
+            snapshot = snapshots.get(key)
+            if snapshot is None:
+                snapshot = snapshots[key] = Snapshot()
+            return snapshot
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        with self._lock:
+            self._snapshots.clear()
+            self._sessions.clear()
+
+
+snapshot_store = SnapshotStore()
+
+
+def latest_timestamp(
+    timestamps: Iterable[str | None],
+    default: str | None = None,
+) -> str | None:
+    """
+    Get the most recent of server-side timestamps.
+
+    Timestamps of one service share a format, so they sort as strings.
+    Using server-side values avoids missing changes on clock skew.
+
+    :param timestamps: ISO 8601 timestamps, None values are ignored.
+    :param default: Value returned if there is no timestamp.
+    :return: The most recent timestamp.
+    """
+    values = [str(ts) for ts in timestamps if ts]
+    if default:
+        values.append(default)
+    return max(values, default=None)
@@ -0,0 +1,229 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
+from pydantic import Field
+
+from openstack_mcp_server import config
+
+from .base import cloud_selection, release_openstack_conn
+from .schema_cache import ToolSchemaCache
+from .tracing import span
+
+
+class ToolExecutor:
+    """Bounded worker pool running blocking OpenStack SDK calls"""
+
+    _executor: ThreadPoolExecutor | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """Worker pool shared by every registered tool"""
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=max(1, config.MCP_MAX_WORKERS),
+                        thread_name_prefix="openstack-mcp-worker",
+                    )
+        return cls._executor
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Shut down the worker pool. It is recreated on next use."""
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def _run_and_release(func: Callable[..., Any], *args, **kwargs) -> Any:
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # Hand the connection leased during the call back to the pool.
+        release_openstack_conn()
+
+
+async def run_in_worker(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking callable on the tool worker pool.
+
+    The caller's context variables are copied into the worker thread and
+    the OpenStack connection leased by the call is released afterwards.
+
+    :param func: The blocking callable to run.
+    :return: The value returned by the callable.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, _run_and_release, func, *args, **kwargs)
+    return await loop.run_in_executor(ToolExecutor.get_executor(), call)
+
+
+def fan_out(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int | None = None,
+) -> list[tuple[Any, BaseException | None]]:
+    """
+    Call a blocking function for every item concurrently.
+
+    Calls run on a short-lived pool rather than the tool worker pool, as
+    the calling tool already occupies a tool worker and waiting on the same
+    pool could deadlock. Each call gets a copy of the caller's context and
+    releases its OpenStack connection when done, so concurrency is also
+    bounded by CONN_POOL_SIZE. The caller should not hold a connection of
+    a pool of size one.
+
+    :param func: The function called with each item.
+    :param items: The items to process.
+    :param max_concurrency: Maximum number of concurrent calls, defaults
+        to BULK_CONCURRENCY.
+    :return: A (result, error) tuple per item, in the order of the items.
+        error is None on success and result is None on failure.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_concurrency is None:
+        max_concurrency = config.MCP_BULK_CONCURRENCY
+    workers = max(1, min(max_concurrency, len(items)))
+
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="openstack-mcp-fanout",
+    ) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _run_and_release,
+                func,
+                item,
+            )
+            for item in items
+        ]
+
+    results: list[tuple[Any, BaseException | None]] = []
+    for future in futures:
+        error = future.exception()
+        results.append((None if error else future.result(), error))
+    return results
+
+
+CLOUD_PARAMETERS = {
+    "cloud": Field(
+        default=None,
+        description="Name of the clouds.yaml entry to use. "
+        "Defaults to the cloud the server was started with.",
+    ),
+    "region": Field(
+        default=None,
+        description="Region of the cloud to use. "
+        "Defaults to the region configured for the cloud.",
+    ),
+}
+
+
+def to_async_tool(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a synchronous tool so that it runs on the tool worker pool.
+
+    The returned coroutine function keeps the name and docstring of the
+    wrapped tool. Its signature gains optional keyword-only ``cloud`` and
+    ``region`` parameters selecting the OpenStack cloud for the call.
+
+    :param func: The synchronous tool function.
+    :return: An async function dispatching to the worker pool.
+    """
+    signature = inspect.signature(func)
+    for name in CLOUD_PARAMETERS:
+        if name in signature.parameters:
+            raise ValueError(
+                f"Tool {func.__name__} already has a parameter named {name}",
+            )
+
+    @functools.wraps(func)
+    async def wrapper(*args, cloud=None, region=None, **kwargs):
+        with (
+            cloud_selection(cloud, region),
+            span(
+                f"tool {func.__name__}",
+                **{
+                    "mcp.tool.name": func.__name__,
+                    "openstack.cloud": cloud,
+                    "openstack.region": region,
+                },
+            ),
+        ):
+            return await run_in_worker(func, *args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            *signature.parameters.values(),
+            *(
+                inspect.Parameter(
+                    name,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=field,
+                    annotation=str | None,
+                )
+                for name, field in CLOUD_PARAMETERS.items()
+            ),
+        ],
+    )
+    wrapper.__annotations__ = {
+        **func.__annotations__,
+        **dict.fromkeys(CLOUD_PARAMETERS, str | None),
+    }
+    return wrapper
+
+
+class ToolRegistrar:
+    """
+    Registers tools on a FastMCP instance through the async execution path.
+
+    Exposes the same ``tool()`` decorator interface as FastMCP so the
+    ``register_tools`` methods of the tool classes can use it unchanged.
+    """
+
+    def __init__(self, mcp: FastMCP, schemas: ToolSchemaCache | None = None):
+        self.mcp = mcp
+        self.schemas = schemas
+
+    def tool(self, *args, **kwargs) -> Callable[[Callable[..., Any]], Any]:
+        """Return a decorator registering a tool on the worker pool."""
+        decorator = self.mcp.tool(*args, **kwargs)
+
+        def register(func: Callable[..., Any]):
+            wrapper = to_async_tool(func)
+            if self.schemas is None or args or kwargs:
+                return decorator(wrapper)
+            cached = self.schemas.get(wrapper.__name__)
+            if cached is None:
+                tool = decorator(wrapper)
+                self.schemas.put(tool)
+                return tool
+            # Arguments are still validated on call, against a model built
+            # from the signature the first time the tool is called.
+            tool = FunctionTool(
+                fn=wrapper,
+                name=wrapper.__name__,
+                description=cached["description"],
+                parameters=cached["parameters"],
+                output_schema=cached["output_schema"],
+                serializer=getattr(self.mcp, "_tool_serializer", None),
+            )
+            self.mcp.add_tool(tool)
+            return tool
+
+        return register
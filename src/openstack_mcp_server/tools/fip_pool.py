@@ -0,0 +1,147 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from openstack_mcp_server import config
+
+from .base import OpenStackConnectionManager
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+class _NetworkIndex:
+    """Free floating IPs of one external network"""
+
+    def __init__(self):
+        # Floating IP ID -> revision number, in claim order.
+        self.free: OrderedDict[str, int | None] = OrderedDict()
+        self.claimed: set[str] = set()
+        self.refreshed_at: float | None = None
+        self.lock = threading.Lock()
+
+
+class FloatingIPPool:
+    """
+    Local index of unassigned floating IPs per external network.
+
+    Claiming pops a floating IP from the index, so concurrent calls of
+    this process never pick the same one. The index is listed again only
+    when it is empty or older than FIP_POOL_TTL, and is kept up to date by
+    the floating IP tools in between.
+    """
+
+    def __init__(self):
+        self._indexes: dict[tuple, _NetworkIndex] = {}
+        self._lock = threading.Lock()
+
+    def claim(
+        self,
+        conn: "connection.Connection",
+        network_id: str,
+    ) -> tuple[str, int | None] | None:
+        """
+        Claim a free floating IP of an external network.
+
+        The claim must be ended with release() or forget().
+
+        :param conn: Connection used if the index must be listed.
+        :param network_id: ID of the external network.
+        :return: The floating IP ID and its revision number, or None if
+            the network has no free floating IP.
+        """
+        index = self._get_index(network_id)
+        with index.lock:
+            if not index.free or self._is_stale(index):
+                self._refresh(conn, network_id, index)
+            if not index.free:
+                return None
+            ip_id, revision = index.free.popitem(last=False)
+            index.claimed.add(ip_id)
+            return ip_id, revision
+
+    def release(
+        self,
+        network_id: str,
+        ip_id: str,
+        revision: int | None,
+    ) -> None:
+        """
+        Return a claimed floating IP to the index.
+
+        :param network_id: ID of the external network.
+        :param ip_id: ID of the claimed floating IP.
+        :param revision: Revision number of the floating IP.
+        """
+        index = self._get_index(network_id)
+        with index.lock:
+            index.claimed.discard(ip_id)
+            index.free[ip_id] = revision
+
+    def forget(self, ip_id: str) -> None:
+        """
+        Remove a floating IP from every index, e.g. once assigned.
+
+        :param ip_id: ID of the floating IP.
+        """
+        with self._lock:
+            indexes = list(self._indexes.values())
+        for index in indexes:
+            with index.lock:
+                index.claimed.discard(ip_id)
+                index.free.pop(ip_id, None)
+
+    def observe(self, ip: Any) -> None:
+        """
+        Update the index from a floating IP returned by the API.
+
+        :param ip: OpenStack floating IP object.
+        """
+        if ip.port_id:
+            self.forget(ip.id)
+            return
+        index = self._get_index(ip.floating_network_id)
+        with index.lock:
+            if ip.id not in index.claimed:
+                index.free[ip.id] = getattr(ip, "revision_number", None)
+
+    def clear(self) -> None:
+        """Drop every index."""
+        with self._lock:
+            self._indexes.clear()
+
+    def _get_index(self, network_id: str) -> _NetworkIndex:
+        key = (OpenStackConnectionManager.resolve(), network_id)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = _NetworkIndex()
+            return index
+
+    def _is_stale(self, index: _NetworkIndex) -> bool:
+        return (
+            index.refreshed_at is None
+            or time.monotonic() - index.refreshed_at > config.MCP_FIP_POOL_TTL
+        )
+
+    def _refresh(
+        self,
+        conn: "connection.Connection",
+        network_id: str,
+        index: _NetworkIndex,
+    ) -> None:
+        # Neutron cannot match an unset port, and the status of a free
+        # floating IP is not always DOWN, so the port is checked here.
+        # Floating IPs claimed in flight are skipped.
+        index.free = OrderedDict(
+            (ip.id, ip.revision_number)
+            for ip in conn.network.ips(floating_network_id=network_id)
+            if not ip.port_id and ip.id not in index.claimed
+        )
+        index.refreshed_at = time.monotonic()
+
+
+fip_pool = FloatingIPPool()
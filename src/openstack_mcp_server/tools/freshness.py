@@ -0,0 +1,64 @@
+from enum import Enum
+from typing import TypeVar
+
+from openstack_mcp_server import config
+
+from .delta import snapshot_store
+from .response.base import ResponseModel
+from .waiter import status_waiter
+
+
+class FreshnessEnum(str, Enum):
+    """available freshness modes of objects returned by write tools"""
+
+    # Built from the response of the write call only.
+    MINIMAL = "minimal"
+    # The latest locally known copy, falling back to MINIMAL.
+    CACHED = "cached"
+    # Refetched from the API after the write.
+    FULL = "full"
+
+
+M = TypeVar("M", bound=ResponseModel)
+
+
+def resolve_freshness(freshness: FreshnessEnum | None) -> FreshnessEnum:
+    """
+    Get the freshness mode of a write tool call.
+
+    :param freshness: The mode requested by the call, if any.
+    :return: The requested mode, else the RESPONSE_FRESHNESS setting.
+    """
+    if freshness is not None:
+        return FreshnessEnum(freshness)
+    return FreshnessEnum(config.MCP_RESPONSE_FRESHNESS)
+
+
+def known_state(
+    resource: str,
+    resource_id: str,
+    model: type[M],
+) -> M | None:
+    """
+    Get the latest locally known copy of a resource.
+
+    Copies come from the status waiter polls, then from the delta sync
+    snapshots. They are eventually consistent.
+
+    :param resource: The resource type, e.g. `servers`.
+    :param resource_id: ID of the resource.
+    :param model: The response model to return.
+    :return: The response model, None if the resource is unknown.
+    """
+    try:
+        item = status_waiter.last_seen(resource, resource_id)
+    except ValueError:
+        # Resource types the waiter does not poll.
+        item = None
+    if item is not None:
+        return model(**item)
+
+    item = snapshot_store.get(resource).items.get(resource_id)
+    if isinstance(item, model):
+        return item
+    return None
@@ -1,7 +1,10 @@
 from fastmcp import FastMCP
 
 from .base import get_openstack_conn
+from .cache import catalog_cache, invalidates
+from .response.base import CompactTable, project
 from .response.identity import Domain, Region
+from .table import OutputFormatEnum, table_output
 
 
 class IdentityTools:
@@ -26,27 +29,39 @@ class IdentityTools:
         mcp.tool()(self.delete_domain)
         mcp.tool()(self.update_domain)
 
-    def get_regions(self) -> list[Region]:
+    @table_output
+    def get_regions(
+        self,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Region] | CompactTable:
         """
         Get the list of Identity regions.
 
+        :param fields: Only return these fields (e.g., `["id", "description"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: A list of Region objects representing the regions.
         """
-        conn = get_openstack_conn()
 
-        region_list = []
-        for region in conn.identity.regions():
-            region_list.append(
-                Region(id=region.id, description=region.description),
-            )
+        def list_regions() -> list[Region]:
+            conn = get_openstack_conn()
+            return [
+                Region(id=region.id, description=region.description)
+                for region in conn.identity.regions()
+            ]
 
-        return region_list
+        region_list = catalog_cache.get("regions", list[Region], list_regions)
+        return project(region_list, fields)
 
-    def get_region(self, id: str) -> Region:
+    def get_region(self, id: str, fields: list[str] | None = None) -> Region:
         """
         Get a region.
 
         :param id: The ID of the region.
+        :param fields: Only return these fields (e.g., `["id", "description"]`)
 
         :return: The Region object.
         """
@@ -54,8 +69,12 @@ class IdentityTools:
 
         region = conn.identity.get_region(region=id)
 
-        return Region(id=region.id, description=region.description)
+        return project(
+            Region(id=region.id, description=region.description),
+            fields,
+        )
 
+    @invalidates("regions")
     def create_region(self, id: str, description: str | None = None) -> Region:
         """
         Create a new region.
@@ -71,6 +90,7 @@ class IdentityTools:
 
         return Region(id=region.id, description=region.description)
 
+    @invalidates("regions")
     def delete_region(self, id: str) -> None:
         """
         Delete a region.
@@ -86,6 +106,7 @@ class IdentityTools:
 
         return None
 
+    @invalidates("regions")
     def update_region(self, id: str, description: str | None = None) -> Region:
         """
         Update a region.
@@ -107,31 +128,44 @@ class IdentityTools:
             description=updated_region.description,
         )
 
-    def get_domains(self) -> list[Domain]:
+    @table_output
+    def get_domains(
+        self,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Domain] | CompactTable:
         """
         Get the list of Identity domains.
 
+        :param fields: Only return these fields (e.g., `["id", "description"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: A list of Domain objects representing the domains.
         """
-        conn = get_openstack_conn()
 
-        domain_list = []
-        for domain in conn.identity.domains():
-            domain_list.append(
+        def list_domains() -> list[Domain]:
+            conn = get_openstack_conn()
+            return [
                 Domain(
                     id=domain.id,
                     name=domain.name,
                     description=domain.description,
                     is_enabled=domain.is_enabled,
-                ),
-            )
-        return domain_list
+                )
+                for domain in conn.identity.domains()
+            ]
+
+        domain_list = catalog_cache.get("domains", list[Domain], list_domains)
+        return project(domain_list, fields)
 
-    def get_domain(self, name: str) -> Domain:
+    def get_domain(self, name: str, fields: list[str] | None = None) -> Domain:
         """
         Get a domain.
 
-        :param name: The name of the domain.
+        :param name: The name or ID of the domain.
+        :param fields: Only return these fields (e.g., `["id", "description"]`)
 
         :return: The Domain object.
         """
@@ -139,13 +173,17 @@ class IdentityTools:
 
         domain = conn.identity.find_domain(name_or_id=name)
 
-        return Domain(
-            id=domain.id,
-            name=domain.name,
-            description=domain.description,
-            is_enabled=domain.is_enabled,
+        return project(
+            Domain(
+                id=domain.id,
+                name=domain.name,
+                description=domain.description,
+                is_enabled=domain.is_enabled,
+            ),
+            fields,
         )
 
+    @invalidates("domains")
     def create_domain(
         self,
         name: str,
@@ -174,11 +212,12 @@ class IdentityTools:
             is_enabled=domain.is_enabled,
         )
 
+    @invalidates("domains")
     def delete_domain(self, name: str) -> None:
         """
         Delete a domain.
 
-        :param name: The name of the domain.
+        :param name: The name or ID of the domain.
         """
         conn = get_openstack_conn()
 
@@ -187,6 +226,7 @@ class IdentityTools:
 
         return None
 
+    @invalidates("domains")
     def update_domain(
         self,
         id: str,
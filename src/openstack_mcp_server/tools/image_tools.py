@@ -3,7 +3,10 @@ from fastmcp import FastMCP
 from openstack_mcp_server.tools.request.image import CreateImage
 from openstack_mcp_server.tools.response.image import Image
 
-from .base import get_openstack_conn
+from .base import get_openstack_conn, release_openstack_conn
+from .cache import cached, invalidates
+from .freshness import FreshnessEnum, resolve_freshness
+from .waiter import wait_for_status
 
 
 class ImageTools:
@@ -19,6 +22,7 @@ class ImageTools:
         mcp.tool()(self.get_image_images)
         mcp.tool()(self.create_image)
 
+    @cached("images")
     def get_image_images(self) -> str:
         """
         Get the list of Image images by invoking the registered tool.
@@ -37,7 +41,14 @@ class ImageTools:
 
         return "\n".join(image_list)
 
-    def create_image(self, image_data: CreateImage) -> Image:
+    @invalidates("images")
+    def create_image(
+        self,
+        image_data: CreateImage,
+        wait: bool = False,
+        timeout: int = 3600,
+        freshness: FreshnessEnum | None = None,
+    ) -> Image:
         """Create a new Openstack image.
         This method handles both cases of image creation:
         1. If a volume is provided, it creates an image from the volume.
@@ -52,6 +63,12 @@ class ImageTools:
             - must provide a glance_region and glance_image_id.
 
         :param image_data: An instance of CreateImage containing the image details.
+        :param wait: Wait until the image is active
+        :param timeout: Seconds to wait when `wait` is set
+        :param freshness: `full` fetches the created image, `minimal` skips
+            that call and returns the image record as created, `cached` is
+            the same as `minimal`, as no copy of a new image is known
+            (defaults to the RESPONSE_FRESHNESS setting)
         :return: An Image object representing the created image.
         """
         conn = get_openstack_conn()
@@ -93,5 +110,19 @@ class ImageTools:
                 remote_service_interface=image_data.import_options.glance_service_interface,
             )
 
-        image = conn.get_image(created_image.id)
+        freshness = resolve_freshness(freshness)
+        if wait:
+            # The waiter polls with its own connection.
+            release_openstack_conn()
+            image = wait_for_status(
+                "images",
+                created_image.id,
+                ["active"],
+                timeout,
+                failures=["killed", "deleted"],
+            )
+        elif freshness == FreshnessEnum.FULL:
+            image = conn.get_image(created_image.id)
+        else:
+            return Image(**created_image)
         return Image(**image)
@@ -0,0 +1,405 @@
+import bisect
+import contextvars
+import threading
+import time
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from .response.metrics import ServerMetrics, ToolMetrics
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Upper bounds of the response size histogram buckets, in bytes
+SIZE_BUCKETS = (1024, 10240, 102400, 1048576, 10485760)
+
+# Name of the tool being called, attributes upstream requests to it.
+_current_tool: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "openstack_current_tool",
+    default=None,
+)
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus sense"""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate a quantile as the upper bound of its bucket.
+
+        :param q: The quantile, between 0 and 1.
+        :return: The estimate, None without observations. Values beyond
+            the last bucket are reported as the last bucket bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+class _ToolStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        # (method, status) -> request count
+        self.upstream_requests: dict[tuple[str, int], int] = {}
+        self.upstream_latency = Histogram(LATENCY_BUCKETS)
+
+
+class MetricsRegistry:
+    """
+    Per-tool call and upstream OpenStack request metrics.
+
+    Upstream requests are attributed to the tool whose call made them, so
+    calls made outside of a tool call, e.g. the connection pre-warm, are
+    recorded under an empty tool name.
+    """
+
+    def __init__(self):
+        self._tools: dict[str, _ToolStats] = {}
+        self._lock = threading.Lock()
+
+    def record_call(
+        self,
+        tool: str,
+        duration: float,
+        response_bytes: int,
+        error: bool = False,
+    ) -> None:
+        """
+        Record a completed tool call.
+
+        :param tool: Name of the tool.
+        :param duration: Seconds the call took.
+        :param response_bytes: Size of the serialized result.
+        :param error: Whether the call failed.
+        """
+        with self._lock:
+            stats = self._get(tool)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.latency.observe(duration)
+            stats.response_bytes.observe(response_bytes)
+
+    def record_upstream(
+        self,
+        tool: str | None,
+        method: str,
+        status: int,
+        duration: float,
+    ) -> None:
+        """
+        Record an HTTP request to an OpenStack API.
+
+        :param tool: Name of the tool that made the request.
+        :param method: HTTP method.
+        :param status: HTTP status code.
+        :param duration: Seconds until the response headers arrived.
+        """
+        with self._lock:
+            stats = self._get(tool or "")
+            key = (method, status)
+            stats.upstream_requests[key] = (
+                stats.upstream_requests.get(key, 0) + 1
+            )
+            stats.upstream_latency.observe(duration)
+
+    def snapshot(self) -> ServerMetrics:
+        """
+        Summarize the metrics of every tool.
+
+        :return: The metrics, latencies in milliseconds.
+        """
+        with self._lock:
+            return ServerMetrics(
+                tools=[
+                    ToolMetrics(
+                        tool=tool,
+                        calls=stats.calls,
+                        errors=stats.errors,
+                        latency_ms_mean=_mean_ms(stats.latency),
+                        latency_ms_p50=_quantile_ms(stats.latency, 0.5),
+                        latency_ms_p99=_quantile_ms(stats.latency, 0.99),
+                        response_bytes=int(stats.response_bytes.sum),
+                        upstream_requests=stats.upstream_latency.count,
+                        upstream_errors=sum(
+                            count
+                            for (_, status), count in (
+                                stats.upstream_requests.items()
+                            )
+                            if status >= 400
+                        ),
+                        upstream_ms_mean=_mean_ms(stats.upstream_latency),
+                    )
+                    for tool, stats in sorted(self._tools.items())
+                ],
+            )
+
+    def render_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        :return: The metrics page.
+        """
+        lines = []
+        with self._lock:
+            tools = sorted(self._tools.items())
+            _family(
+                lines,
+                "openstack_mcp_tool_calls_total",
+                "counter",
+                "Tool calls",
+            )
+            for tool, stats in tools:
+                if stats.calls:
+                    for status, count in (
+                        ("ok", stats.calls - stats.errors),
+                        ("error", stats.errors),
+                    ):
+                        lines.append(
+                            "openstack_mcp_tool_calls_total"
+                            f"{_labels(tool=tool, status=status)} {count}",
+                        )
+            _histograms(
+                lines,
+                "openstack_mcp_tool_duration_seconds",
+                "Tool call latency",
+                [(tool, stats.latency) for tool, stats in tools],
+            )
+            _histograms(
+                lines,
+                "openstack_mcp_tool_response_bytes",
+                "Serialized tool result size",
+                [(tool, stats.response_bytes) for tool, stats in tools],
+            )
+            _family(
+                lines,
+                "openstack_mcp_upstream_requests_total",
+                "counter",
+                "OpenStack API requests made by tool calls",
+            )
+            for tool, stats in tools:
+                for (method, status), count in sorted(
+                    stats.upstream_requests.items(),
+                ):
+                    labels = _labels(tool=tool, method=method, status=status)
+                    lines.append(
+                        f"openstack_mcp_upstream_requests_total{labels} "
+                        f"{count}",
+                    )
+            _histograms(
+                lines,
+                "openstack_mcp_upstream_duration_seconds",
+                "OpenStack API request latency",
+                [(tool, stats.upstream_latency) for tool, stats in tools],
+            )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget every recorded metric."""
+        with self._lock:
+            self._tools.clear()
+
+    def _get(self, tool: str) -> _ToolStats:
+        stats = self._tools.get(tool)
+        if stats is None:
+            stats = self._tools[tool] = _ToolStats()
+        return stats
+
+
+def _mean_ms(histogram: Histogram) -> float | None:
+    if not histogram.count:
+        return None
+    return histogram.sum / histogram.count * 1000
+
+
+def _quantile_ms(histogram: Histogram, q: float) -> float | None:
+    value = histogram.quantile(q)
+    return None if value is None else value * 1000
+
+
+def _labels(**labels: Any) -> str:
+    values = ",".join(
+        f'{key}="{_escape(str(value))}"' for key, value in labels.items()
+    )
+    return "{" + values + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _family(lines: list[str], name: str, kind: str, help: str) -> None:
+    lines.append(f"# HELP {name} {help}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _histograms(
+    lines: list[str],
+    name: str,
+    help: str,
+    histograms: list[tuple[str, Histogram]],
+) -> None:
+    _family(lines, name, "histogram", help)
+    for tool, histogram in histograms:
+        if not histogram.count:
+            continue
+        cumulative = 0
+        for bound, count in zip(
+            (*histogram.buckets, "+Inf"),
+            histogram.counts,
+        ):
+            cumulative += count
+            lines.append(
+                f"{name}_bucket{_labels(tool=tool, le=bound)} {cumulative}",
+            )
+        lines.append(f"{name}_sum{_labels(tool=tool)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(tool=tool)} {histogram.count}")
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _on_response(response: Any, *args, **kwargs) -> None:
+    metrics_registry.record_upstream(
+        _current_tool.get(),
+        response.request.method,
+        response.status_code,
+        response.elapsed.total_seconds(),
+    )
+
+
+def track_upstream_requests(conn: "connection.Connection") -> None:
+    """
+    Record the HTTP requests of a connection in the metrics registry.
+
+    Hooks the requests session underneath the keystoneauth session, so
+    every API call, retries and token requests included, is counted.
+
+    :param conn: The OpenStack connection.
+    """
+    hooks = getattr(getattr(conn.session, "session", None), "hooks", None)
+    if isinstance(hooks, dict):
+        responses = hooks.setdefault("response", [])
+        if _on_response not in responses:
+            responses.append(_on_response)
+
+
+class MetricsMiddleware(Middleware):
+    """Records the latency, result size and outcome of every tool call"""
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        self.registry = registry or metrics_registry
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext,
+        call_next: Callable[..., Awaitable[Any]],
+    ) -> Any:
+        tool = context.message.name
+        token = _current_tool.set(tool)
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            self.registry.record_call(
+                tool, time.perf_counter() - start, 0, True
+            )
+            raise
+        finally:
+            _current_tool.reset(token)
+        self.registry.record_call(
+            tool,
+            time.perf_counter() - start,
+            _result_size(result),
+        )
+        return result
+
+
+def _result_size(result: Any) -> int:
+    # The structured content holds the same data, it is not measured again.
+    return sum(
+        len(block.text.encode())
+        for block in getattr(result, "content", None) or []
+        if getattr(block, "type", None) == "text"
+    )
+
+
+def get_server_metrics() -> ServerMetrics:
+    """
+    Get the call and OpenStack API request metrics of every tool.
+
+    Latencies are estimated from histogram buckets. Requests made outside
+    of tool calls are reported under an empty tool name.
+
+    :return: Call counts, latencies and upstream request counts per tool
+    """
+    return metrics_registry.snapshot()
+
+
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Serve the metrics to Prometheus."""
+    return PlainTextResponse(
+        metrics_registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def register_metrics(mcp: FastMCP, transport: str) -> None:
+    """
+    Collect metrics of every tool call.
+
+    The metrics are served on `/metrics` by the HTTP transports, and by
+    the get_server_metrics tool on stdio.
+
+    :param mcp: The FastMCP server.
+    :param transport: The transport the server runs with.
+    """
+    mcp.add_middleware(MetricsMiddleware())
+    if transport == "stdio":
+        mcp.tool()(get_server_metrics)
+    else:
+        mcp.custom_route("/metrics", methods=["GET"])(metrics_endpoint)
@@ -1,12 +1,210 @@
+import functools
+import importlib
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
 from fastmcp import FastMCP
 
-from .base import get_openstack_conn
+from openstack_mcp_server import config
+
+from .base import get_openstack_conn, logger
+from .cache import cached, invalidates
+from .delta import snapshot_store
+from .executor import fan_out
+from .fip_pool import fip_pool
+from .freshness import FreshnessEnum, known_state, resolve_freshness
+from .resolver import name_resolver
+from .response.base import BulkError, CompactTable, project
 from .response.network import (
     FloatingIP,
+    FloatingIPBulkResult,
     Network,
     Port,
+    PortDelta,
     Subnet,
 )
+from .retry import retry_with_backoff
+from .table import OutputFormatEnum, table_output
+from .tracing import span
+
+
+# Number of port IDs requested per listing, keeps query strings short.
+PORT_ID_BATCH_SIZE = 50
+
+# Port model fields whose Neutron attribute name differs.
+PORT_ATTRIBUTE_NAMES = {
+    "is_admin_state_up": "admin_state_up",
+    "security_group_ids": "security_groups",
+}
+
+
+# SDK resources whose query parameters a list plan pushes to Neutron.
+NEUTRON_RESOURCES = {
+    "networks": ("openstack.network.v2.network", "Network"),
+    "subnets": ("openstack.network.v2.subnet", "Subnet"),
+    "ports": ("openstack.network.v2.port", "Port"),
+    "floating_ips": ("openstack.network.v2.floating_ip", "FloatingIP"),
+}
+
+
+@functools.cache
+def _query_parameters(resource: str) -> frozenset[str]:
+    """
+    Get the query parameters the SDK sends to Neutron for a resource.
+
+    The SDK silently drops any other parameter, so a filter on it would
+    not filter at all.
+
+    :param resource: The resource type, e.g. `subnets`
+    :return: Client-side and Neutron names of the query parameters
+    """
+    module, name = NEUTRON_RESOURCES[resource]
+    resource_type = getattr(importlib.import_module(module), name)
+    mapping = resource_type._query_mapping._mapping
+    return frozenset(mapping) | frozenset(
+        value.get("name", key) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    )
+
+
+class ListPlan:
+    """
+    Execution plan of a filtered Neutron list.
+
+    Filters and field selection that Neutron supports for the resource are
+    sent with the list request, along with sorting. Other filters are
+    applied to the listed items, `explain()` reports which is which.
+    """
+
+    def __init__(self, resource: str):
+        self.resource = resource
+        self.supported = _query_parameters(resource)
+        self.query: dict[str, Any] = {}
+        # (description, attribute, predicate) applied to listed items
+        self.checks: list[tuple[str, str, Callable[[Any], bool]]] = []
+        self.fields: list[str] | None = None
+
+    def where(self, attribute: str, value: Any) -> "ListPlan":
+        """
+        Keep items whose attribute equals a value.
+
+        :param attribute: SDK or Neutron attribute name
+        :param value: The value, None or empty to not filter
+        :return: The plan
+        """
+        if value is None or value == "" or value == []:
+            return self
+        if attribute in self.supported:
+            self.query[attribute] = value
+        else:
+            self.checks.append(
+                (
+                    f"{attribute} == {value!r}",
+                    attribute,
+                    lambda item: getattr(item, attribute, None) == value,
+                ),
+            )
+        return self
+
+    def where_set(self, attribute: str, is_set: bool | None) -> "ListPlan":
+        """
+        Keep items whose attribute is set, or unset.
+
+        Neutron cannot match an unset attribute, so this is always
+        applied to the listed items.
+
+        :param attribute: SDK attribute name
+        :param is_set: True for set attributes, False for unset ones,
+            None to not filter
+        :return: The plan
+        """
+        if is_set is None:
+            return self
+        self.checks.append(
+            (
+                f"{attribute} is {'set' if is_set else 'unset'}",
+                attribute,
+                lambda item: bool(getattr(item, attribute, None)) == is_set,
+            ),
+        )
+        return self
+
+    def order_by(self, key: str | None, direction: str | None) -> "ListPlan":
+        """
+        Have Neutron sort the items.
+
+        :param key: Neutron attribute to sort by, None to keep the order
+        :param direction: `asc` or `desc`, defaults to `asc`
+        :return: The plan
+        """
+        if not key:
+            return self
+        direction = (direction or "asc").lower()
+        if direction not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort direction: {direction}")
+        self.query["sort_key"] = key
+        self.query["sort_dir"] = direction
+        return self
+
+    def select(self, fields: list[str] | None) -> "ListPlan":
+        """
+        Request only some attributes, if Neutron supports it.
+
+        Attributes checked on the listed items are requested too. Either
+        way, the response is still projected on the model fields.
+
+        :param fields: Neutron attribute names, None for all
+        :return: The plan
+        """
+        if fields and "fields" in self.supported:
+            self.fields = list(fields)
+        return self
+
+    def explain(self) -> dict[str, Any]:
+        """
+        Describe what is done by Neutron and what is done locally.
+
+        :return: The Neutron query, and the filters applied to the listed
+            items
+        """
+        return {
+            "resource": self.resource,
+            "query": self._build_query(),
+            "client_filters": [check[0] for check in self.checks],
+        }
+
+    def run(self, list_items: Callable[[dict], Iterable[Any]]) -> list[Any]:
+        """
+        List the items and apply what Neutron could not.
+
+        :param list_items: Lists the items given the Neutron query
+        :return: The matching items
+        """
+        plan = self.explain()
+        logger.debug(f"List plan: {plan}")
+        with span(
+            f"list {self.resource}",
+            **{
+                "neutron.query": ", ".join(sorted(plan["query"])),
+                "neutron.client_filters": "; ".join(plan["client_filters"]),
+            },
+        ):
+            return [
+                item
+                for item in list_items(plan["query"])
+                if all(check(item) for _, _, check in self.checks)
+            ]
+
+    def _build_query(self) -> dict[str, Any]:
+        query = dict(self.query)
+        if self.fields is not None:
+            query["fields"] = list(
+                dict.fromkeys(
+                    [*self.fields, *(check[1] for check in self.checks)],
+                ),
+            )
+        return query
 
 
 class NetworkTools:
@@ -30,6 +228,7 @@ class NetworkTools:
         mcp.tool()(self.update_subnet)
         mcp.tool()(self.delete_subnet)
         mcp.tool()(self.get_ports)
+        mcp.tool()(self.get_ports_delta)
         mcp.tool()(self.create_port)
         mcp.tool()(self.get_port_detail)
         mcp.tool()(self.update_port)
@@ -43,34 +242,41 @@ class NetworkTools:
         mcp.tool()(self.create_floating_ips_bulk)
         mcp.tool()(self.assign_first_available_floating_ip)
 
+    @table_output
+    @cached("networks")
     def get_networks(
         self,
         status_filter: str | None = None,
         shared_only: bool = False,
-    ) -> list[Network]:
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Network] | CompactTable:
         """
         Get the list of Networks with optional filtering.
 
         :param status_filter: Filter networks by status (e.g., `ACTIVE`, `DOWN`)
         :param shared_only: If True, only show shared networks
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: List of Network objects
         """
         conn = get_openstack_conn()
+        plan = (
+            ListPlan("networks")
+            .where("status", status_filter and status_filter.upper())
+            .where("shared", True if shared_only else None)
+        )
+        networks = plan.run(lambda query: conn.list_networks(filters=query))
 
-        filters = {}
-
-        if status_filter:
-            filters["status"] = status_filter.upper()
-
-        if shared_only:
-            filters["shared"] = True
-
-        networks = conn.list_networks(filters=filters)
-
-        return [
-            self._convert_to_network_model(network) for network in networks
-        ]
+        return project(
+            [self._convert_to_network_model(network) for network in networks],
+            fields,
+        )
 
+    @invalidates("networks")
     def create_network(
         self,
         name: str,
@@ -116,21 +322,28 @@ class NetworkTools:
             network_args["provider_segmentation_id"] = provider_segmentation_id
 
         network = conn.network.create_network(**network_args)
+        name_resolver.add("networks", network.id, network.name)
 
         return self._convert_to_network_model(network)
 
-    def get_network_detail(self, network_id: str) -> Network:
+    def get_network_detail(
+        self,
+        network_id: str,
+        fields: list[str] | None = None,
+    ) -> Network:
         """
         Get detailed information about a specific Network.
 
         :param network_id: ID of the network to retrieve
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
         :return: Network details
         """
         conn = get_openstack_conn()
 
         network = conn.network.get_network(network_id)
-        return self._convert_to_network_model(network)
+        return project(self._convert_to_network_model(network), fields)
 
+    @invalidates("networks")
     def update_network(
         self,
         network_id: str,
@@ -166,8 +379,10 @@ class NetworkTools:
             current = conn.network.get_network(network_id)
             return self._convert_to_network_model(current)
         network = conn.network.update_network(network_id, **update_args)
+        name_resolver.add("networks", network.id, network.name)
         return self._convert_to_network_model(network)
 
+    @invalidates("networks", "subnets", "ports")
     def delete_network(self, network_id: str) -> None:
         """
         Delete a Network.
@@ -177,6 +392,7 @@ class NetworkTools:
         """
         conn = get_openstack_conn()
         conn.network.delete_network(network_id, ignore_missing=False)
+        name_resolver.remove("networks", network_id)
 
         return None
 
@@ -204,6 +420,8 @@ class NetworkTools:
             project_id=openstack_network.project_id or None,
         )
 
+    @table_output
+    @cached("subnets")
     def get_subnets(
         self,
         network_id: str | None = None,
@@ -211,7 +429,13 @@ class NetworkTools:
         project_id: str | None = None,
         has_gateway: bool | None = None,
         is_dhcp_enabled: bool | None = None,
-    ) -> list[Subnet]:
+        tags: list[str] | None = None,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Subnet] | CompactTable:
         """
         Get the list of Subnets with optional filtering.
 
@@ -219,7 +443,9 @@ class NetworkTools:
         DHCP-enabled state.
 
         Notes:
-        - has_gateway is applied client-side after retrieval and checks whether `gateway_ip` is set.
+        - Every filter but has_gateway is applied by Neutron. Neutron cannot
+          match an unset `gateway_ip`, so has_gateway is checked on the listed
+          subnets.
         - `is_dhcp_enabled` maps to Neutron's `enable_dhcp` filter.
         - Combining filters further restricts the result (logical AND).
 
@@ -233,25 +459,33 @@ class NetworkTools:
         :param project_id: Filter by project ID
         :param has_gateway: True for subnets with a gateway, False for no gateway
         :param is_dhcp_enabled: True for DHCP-enabled subnets, False for disabled
+        :param tags: Only subnets with all these tags
+        :param sort_key: Neutron attribute to sort by (e.g., `cidr`)
+        :param sort_dir: `asc` or `desc`, defaults to `asc`
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: List of Subnet objects
         """
         conn = get_openstack_conn()
-        filters: dict = {}
-        if network_id:
-            filters["network_id"] = network_id
-        if ip_version is not None:
-            filters["ip_version"] = ip_version
-        if project_id:
-            filters["project_id"] = project_id
-        if is_dhcp_enabled is not None:
-            filters["enable_dhcp"] = is_dhcp_enabled
-        subnets = conn.list_subnets(filters=filters)
-        if has_gateway is not None:
-            subnets = [
-                s for s in subnets if (s.gateway_ip is not None) == has_gateway
-            ]
-        return [self._convert_to_subnet_model(subnet) for subnet in subnets]
+        plan = (
+            ListPlan("subnets")
+            .where("network_id", network_id)
+            .where("ip_version", ip_version)
+            .where("project_id", project_id)
+            .where("enable_dhcp", is_dhcp_enabled)
+            .where("tags", tags)
+            .where_set("gateway_ip", has_gateway)
+            .order_by(sort_key, sort_dir)
+        )
+        subnets = plan.run(lambda query: conn.list_subnets(filters=query))
+        return project(
+            [self._convert_to_subnet_model(subnet) for subnet in subnets],
+            fields,
+        )
 
+    @invalidates("subnets")
     def create_subnet(
         self,
         network_id: str,
@@ -302,17 +536,23 @@ class NetworkTools:
         subnet = conn.network.create_subnet(**subnet_args)
         return self._convert_to_subnet_model(subnet)
 
-    def get_subnet_detail(self, subnet_id: str) -> Subnet:
+    def get_subnet_detail(
+        self,
+        subnet_id: str,
+        fields: list[str] | None = None,
+    ) -> Subnet:
         """
         Get detailed information about a specific Subnet.
 
         :param subnet_id: ID of the subnet to retrieve
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
         :return: Subnet details
         """
         conn = get_openstack_conn()
         subnet = conn.network.get_subnet(subnet_id)
-        return self._convert_to_subnet_model(subnet)
+        return project(self._convert_to_subnet_model(subnet), fields)
 
+    @invalidates("subnets")
     def update_subnet(
         self,
         subnet_id: str,
@@ -382,6 +622,7 @@ class NetworkTools:
         subnet = conn.network.update_subnet(subnet_id, **update_args)
         return self._convert_to_subnet_model(subnet)
 
+    @invalidates("subnets", "ports")
     def delete_subnet(self, subnet_id: str) -> None:
         """
         Delete a Subnet.
@@ -418,30 +659,95 @@ class NetworkTools:
             host_routes=getattr(openstack_subnet, "host_routes", None),
         )
 
+    @table_output
+    @cached("ports")
     def get_ports(
         self,
         status_filter: str | None = None,
         device_id: str | None = None,
         network_id: str | None = None,
-    ) -> list[Port]:
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[Port] | CompactTable:
         """
         Get the list of Ports with optional filtering.
 
         :param status_filter: Filter by port status (e.g., `ACTIVE`, `DOWN`)
         :param device_id: Filter by device ID
         :param network_id: Filter by network ID
+        :param fields: Only return these fields (e.g., `["id", "status"]`),
+            only these attributes are requested from Neutron
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: List of Port objects
         """
         conn = get_openstack_conn()
-        filters: dict = {}
-        if status_filter:
-            filters["status"] = status_filter.upper()
-        if device_id:
-            filters["device_id"] = device_id
-        if network_id:
-            filters["network_id"] = network_id
-        ports = conn.list_ports(filters=filters)
-        return [self._convert_to_port_model(port) for port in ports]
+        plan = (
+            ListPlan("ports")
+            .where("status", status_filter and status_filter.upper())
+            .where("device_id", device_id)
+            .where("network_id", network_id)
+            .select(fields and self._port_attribute_names(fields))
+        )
+        ports = plan.run(lambda query: conn.list_ports(filters=query))
+        return project(
+            [self._convert_to_port_model(port) for port in ports],
+            fields,
+        )
+
+    def get_ports_delta(self, full_sync: bool = False) -> PortDelta:
+        """
+        Get the ports created, updated or deleted since the previous call.
+
+        Only the ID and revision number of every port are listed. Details
+        are fetched for the ports whose revision changed since the previous
+        sync, and ports missing from the listing are reported as deleted.
+
+        Every client session has its own sync state, so sessions do not
+        consume each other's changes.
+
+        :param full_sync: Fetch the details of every port again.
+        :return: A PortDelta with the changes.
+        """
+        snapshot = snapshot_store.get("ports")
+        with snapshot.lock:
+            full_sync = full_sync or not snapshot.items
+            conn = get_openstack_conn()
+            revisions = {
+                port.id: port.revision_number
+                for port in conn.network.ports(
+                    fields=["id", "revision_number"],
+                )
+            }
+            stale_ids = [
+                port_id
+                for port_id, revision in revisions.items()
+                if full_sync
+                or revision is None
+                or snapshot.revisions.get(port_id) != revision
+            ]
+
+            changed = {}
+            for i in range(0, len(stale_ids), PORT_ID_BATCH_SIZE):
+                batch = stale_ids[i : i + PORT_ID_BATCH_SIZE]
+                for port in conn.network.ports(id=batch):
+                    changed[port.id] = self._convert_to_port_model(port)
+
+            created, updated, deleted = snapshot.apply(
+                changed,
+                snapshot.items.keys() - revisions.keys(),
+            )
+            for port_id in changed:
+                snapshot.revisions[port_id] = revisions[port_id]
+
+            return PortDelta(
+                created=created,
+                updated=updated,
+                deleted=deleted,
+                full_sync=full_sync,
+            )
 
     def get_port_allowed_address_pairs(self, port_id: str) -> list[dict]:
         """
@@ -454,12 +760,14 @@ class NetworkTools:
         port = conn.network.get_port(port_id)
         return list(port.allowed_address_pairs or [])
 
+    @invalidates("ports")
     def set_port_binding(
         self,
         port_id: str,
         host_id: str | None = None,
         vnic_type: str | None = None,
         profile: dict | None = None,
+        freshness: FreshnessEnum | None = None,
     ) -> Port:
         """
         Set binding attributes for a port.
@@ -468,6 +776,9 @@ class NetworkTools:
         :param host_id: Binding host ID
         :param vnic_type: VNIC type
         :param profile: Binding profile
+        :param freshness: When nothing changes, `minimal` and `cached`
+            return the last known copy of the port instead of fetching it
+            (defaults to the RESPONSE_FRESHNESS setting)
         :return: Updated Port object
         """
         conn = get_openstack_conn()
@@ -479,11 +790,11 @@ class NetworkTools:
         if profile is not None:
             update_args["binding_profile"] = profile
         if not update_args:
-            current = conn.network.get_port(port_id)
-            return self._convert_to_port_model(current)
+            return self._get_unchanged_port(conn, port_id, freshness)
         updated = conn.network.update_port(port_id, **update_args)
         return self._convert_to_port_model(updated)
 
+    @invalidates("ports")
     def create_port(
         self,
         network_id: str,
@@ -524,17 +835,23 @@ class NetworkTools:
         port = conn.network.create_port(**port_args)
         return self._convert_to_port_model(port)
 
-    def get_port_detail(self, port_id: str) -> Port:
+    def get_port_detail(
+        self,
+        port_id: str,
+        fields: list[str] | None = None,
+    ) -> Port:
         """
         Get detailed information about a specific Port.
 
         :param port_id: ID of the port to retrieve
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
         :return: Port details
         """
         conn = get_openstack_conn()
         port = conn.network.get_port(port_id)
-        return self._convert_to_port_model(port)
+        return project(self._convert_to_port_model(port), fields)
 
+    @invalidates("ports")
     def update_port(
         self,
         port_id: str,
@@ -545,6 +862,7 @@ class NetworkTools:
         security_group_ids: list[str] | None = None,
         allowed_address_pairs: list[dict] | None = None,
         fixed_ips: list[dict] | None = None,
+        freshness: FreshnessEnum | None = None,
     ) -> Port:
         """
         Update an existing Port. Only provided parameters are changed; omitted parameters remain untouched.
@@ -580,6 +898,9 @@ class NetworkTools:
         :param security_group_ids: Security group ID list (replaces entire list)
         :param allowed_address_pairs: Allowed address pairs (replaces entire list)
         :param fixed_ips: Fixed IP assignments (replaces entire list)
+        :param freshness: When nothing changes, `minimal` and `cached`
+            return the last known copy of the port instead of fetching it
+            (defaults to the RESPONSE_FRESHNESS setting)
         :return: Updated Port object
         """
         conn = get_openstack_conn()
@@ -599,11 +920,11 @@ class NetworkTools:
         if fixed_ips is not None:
             update_args["fixed_ips"] = fixed_ips
         if not update_args:
-            current = conn.network.get_port(port_id)
-            return self._convert_to_port_model(current)
+            return self._get_unchanged_port(conn, port_id, freshness)
         port = conn.network.update_port(port_id, **update_args)
         return self._convert_to_port_model(port)
 
+    @invalidates("ports", "floating_ips")
     def delete_port(self, port_id: str) -> None:
         """
         Delete a Port.
@@ -615,6 +936,39 @@ class NetworkTools:
         conn.network.delete_port(port_id, ignore_missing=False)
         return None
 
+    def _port_attribute_names(self, fields: list[str]) -> list[str]:
+        """
+        Map Port model fields to Neutron attribute names.
+
+        Unknown fields are skipped here and rejected by the projection.
+
+        :param fields: Port model field names
+        :return: Neutron attribute names, always including `id`
+        """
+        names = ["id"]
+        for field in fields:
+            if field in Port.model_fields and field != "id":
+                names.append(PORT_ATTRIBUTE_NAMES.get(field, field))
+        return names
+
+    def _get_unchanged_port(
+        self,
+        conn,
+        port_id: str,
+        freshness: FreshnessEnum | None,
+    ) -> Port:
+        """
+        Get a port left unchanged by an update.
+
+        No write was sent, so `minimal` and `cached` both return the last
+        known copy of the port, and only fetch it if it is unknown.
+        """
+        if resolve_freshness(freshness) != FreshnessEnum.FULL:
+            known = known_state("ports", port_id, Port)
+            if known is not None:
+                return known
+        return self._convert_to_port_model(conn.network.get_port(port_id))
+
     def _convert_to_port_model(self, openstack_port) -> Port:
         """
         Convert an OpenStack Port object to a Port pydantic model.
@@ -639,6 +993,8 @@ class NetworkTools:
             else None,
         )
 
+    @table_output
+    @cached("floating_ips")
     def get_floating_ips(
         self,
         status_filter: str | None = None,
@@ -646,7 +1002,13 @@ class NetworkTools:
         port_id: str | None = None,
         floating_network_id: str | None = None,
         unassigned_only: bool | None = None,
-    ) -> list[FloatingIP]:
+        tags: list[str] | None = None,
+        sort_key: str | None = None,
+        sort_dir: str | None = None,
+        fields: list[str] | None = None,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+    ) -> list[FloatingIP] | CompactTable:
         """
         Get the list of Floating IPs with optional filtering.
 
@@ -654,24 +1016,35 @@ class NetworkTools:
         :param project_id: Filter by project ID
         :param port_id: Filter by attached port ID
         :param floating_network_id: Filter by external network ID
-        :param unassigned_only: If True, return only unassigned IPs
+        :param unassigned_only: If True, return only unassigned IPs. Neutron
+            cannot match an unset port, so this is checked on the listed IPs.
+        :param tags: Only IPs with all these tags
+        :param sort_key: Neutron attribute to sort by (e.g., `status`)
+        :param sort_dir: `asc` or `desc`, defaults to `asc`
+        :param fields: Only return these fields (e.g., `["id", "status"]`)
+        :param output_format: `table` returns a column header and rows instead
+            of one object per item, which is much smaller for long lists
+        :param cursor: Continuation cursor of a truncated table
         :return: List of FloatingIP objects
         """
         conn = get_openstack_conn()
-        filters: dict = {}
-        if status_filter:
-            filters["status"] = status_filter.upper()
-        if project_id:
-            filters["project_id"] = project_id
-        if port_id:
-            filters["port_id"] = port_id
-        if floating_network_id:
-            filters["floating_network_id"] = floating_network_id
-        ips = list(conn.network.ips(**filters))
-        if unassigned_only:
-            ips = [i for i in ips if not i.port_id]
-        return [self._convert_to_floating_ip_model(ip) for ip in ips]
+        plan = (
+            ListPlan("floating_ips")
+            .where("status", status_filter and status_filter.upper())
+            .where("project_id", project_id)
+            .where("port_id", port_id)
+            .where("floating_network_id", floating_network_id)
+            .where("tags", tags)
+            .where_set("port_id", False if unassigned_only else None)
+            .order_by(sort_key, sort_dir)
+        )
+        ips = plan.run(lambda query: conn.network.ips(**query))
+        return project(
+            [self._convert_to_floating_ip_model(ip) for ip in ips],
+            fields,
+        )
 
+    @invalidates("floating_ips")
     def create_floating_ip(
         self,
         floating_network_id: str,
@@ -706,8 +1079,10 @@ class NetworkTools:
         if project_id is not None:
             ip_args["project_id"] = project_id
         ip = conn.network.create_ip(**ip_args)
+        fip_pool.observe(ip)
         return self._convert_to_floating_ip_model(ip)
 
+    @invalidates("floating_ips")
     def attach_floating_ip_to_port(
         self,
         floating_ip_id: str,
@@ -727,8 +1102,10 @@ class NetworkTools:
         if fixed_ip_address is not None:
             update_args["fixed_ip_address"] = fixed_ip_address
         ip = conn.network.update_ip(floating_ip_id, **update_args)
+        fip_pool.observe(ip)
         return self._convert_to_floating_ip_model(ip)
 
+    @invalidates("floating_ips")
     def update_floating_ip(
         self,
         floating_ip_id: str,
@@ -776,8 +1153,10 @@ class NetworkTools:
             current = conn.network.get_ip(floating_ip_id)
             return self._convert_to_floating_ip_model(current)
         ip = conn.network.update_ip(floating_ip_id, **update_args)
+        fip_pool.observe(ip)
         return self._convert_to_floating_ip_model(ip)
 
+    @invalidates("floating_ips")
     def delete_floating_ip(self, floating_ip_id: str) -> None:
         """
         Delete a Floating IP.
@@ -787,29 +1166,87 @@ class NetworkTools:
         """
         conn = get_openstack_conn()
         conn.network.delete_ip(floating_ip_id, ignore_missing=False)
+        fip_pool.forget(floating_ip_id)
         return None
 
+    @invalidates("floating_ips")
     def create_floating_ips_bulk(
         self,
         floating_network_id: str,
         count: int,
-    ) -> list[FloatingIP]:
+        max_concurrency: int | None = None,
+        rollback_on_error: bool = False,
+    ) -> FloatingIPBulkResult:
         """
         Create multiple floating IPs on the specified external network.
 
+        Creates are issued concurrently. Conflict, rate limit and quota
+        errors are retried with backoff, and the remaining failures are
+        reported per item instead of aborting the whole batch.
+
         :param floating_network_id: External network ID
         :param count: Number of floating IPs to create (negative treated as 0)
-        :return: List of created FloatingIP objects
+        :param max_concurrency: Maximum number of concurrent creates
+            (defaults to the BULK_CONCURRENCY setting)
+        :param rollback_on_error: Delete the created floating IPs if any
+            create failed
+        :return: The created FloatingIP objects and the per-item errors
         """
-        conn = get_openstack_conn()
-        created = []
-        for _ in range(max(0, count)):
-            ip = conn.network.create_ip(
+
+        def create_ip(_index: int):
+            conn = get_openstack_conn()
+            ip = retry_with_backoff(
+                conn.network.create_ip,
                 floating_network_id=floating_network_id,
+                idempotent=False,
+            )
+            fip_pool.observe(ip)
+            return ip
+
+        created: list[tuple[int, FloatingIP]] = []
+        errors = []
+        results = fan_out(create_ip, range(max(0, count)), max_concurrency)
+        for index, (ip, error) in enumerate(results):
+            if error is None:
+                created.append((index, self._convert_to_floating_ip_model(ip)))
+            else:
+                errors.append(BulkError(index=index, error=str(error)))
+
+        if not (errors and rollback_on_error and created):
+            return FloatingIPBulkResult(
+                created=[ip for _, ip in created],
+                errors=errors,
+            )
+
+        def delete_ip(item: tuple[int, FloatingIP]):
+            conn = get_openstack_conn()
+            retry_with_backoff(
+                conn.network.delete_ip,
+                item[1].id,
+                ignore_missing=True,
             )
-            created.append(self._convert_to_floating_ip_model(ip))
-        return created
+            fip_pool.forget(item[1].id)
+
+        # Floating IPs that could not be deleted are still reported.
+        remaining = []
+        rollback = fan_out(delete_ip, created, max_concurrency)
+        for (index, ip), (_, error) in zip(created, rollback):
+            if error is not None:
+                remaining.append(ip)
+                errors.append(
+                    BulkError(
+                        index=index,
+                        id=ip.id,
+                        error=f"Rollback failed: {error}",
+                    ),
+                )
+        return FloatingIPBulkResult(
+            created=remaining,
+            errors=errors,
+            rolled_back=True,
+        )
 
+    @invalidates("floating_ips")
     def assign_first_available_floating_ip(
         self,
         floating_network_id: str,
@@ -819,26 +1256,47 @@ class NetworkTools:
         Assign the first available floating IP from a network to a port.
         If none are available, create a new one and assign it.
 
+        Free floating IPs are claimed from a local index, so concurrent calls
+        never pick the same one. The assignment is a compare-and-swap on the
+        revision number, and a floating IP taken by another client in the
+        meantime is skipped for the next free one.
+
         :param floating_network_id: External network ID
         :param port_id: Target port ID
         :return: Updated FloatingIP object
         """
+        from openstack import exceptions
+
         conn = get_openstack_conn()
-        existing = list(
-            conn.network.ips(floating_network_id=floating_network_id),
-        )
-        available = next(
-            (i for i in existing if not i.port_id),
-            None,
+        for _ in range(max(1, config.MCP_RETRY_ATTEMPTS)):
+            claim = fip_pool.claim(conn, floating_network_id)
+            if claim is None:
+                break
+            ip_id, revision = claim
+            try:
+                ip = conn.network.update_ip(
+                    ip_id,
+                    if_revision=revision,
+                    port_id=port_id,
+                )
+            except (
+                exceptions.ConflictException,
+                exceptions.PreconditionFailedException,
+                exceptions.NotFoundException,
+            ):
+                # Assigned or deleted by another client, try the next one.
+                fip_pool.forget(ip_id)
+                continue
+            except Exception:
+                fip_pool.release(floating_network_id, ip_id, revision)
+                raise
+            fip_pool.forget(ip_id)
+            return self._convert_to_floating_ip_model(ip)
+
+        ip = conn.network.create_ip(
+            floating_network_id=floating_network_id,
+            port_id=port_id,
         )
-        if available is None:
-            created = conn.network.create_ip(
-                floating_network_id=floating_network_id,
-            )
-            target_id = created.id
-        else:
-            target_id = available.id
-        ip = conn.network.update_ip(target_id, port_id=port_id)
         return self._convert_to_floating_ip_model(ip)
 
     def _convert_to_floating_ip_model(self, openstack_ip) -> FloatingIP:
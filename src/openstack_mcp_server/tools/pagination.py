@@ -0,0 +1,40 @@
+import base64
+import binascii
+import json
+
+from typing import Any
+
+
+def encode_cursor(marker: str, query: dict[str, Any]) -> str:
+    """
+    Encode an opaque continuation cursor.
+
+    The cursor carries the marker of the last returned item and the query
+    used for the page, so the next page is requested with the same filters.
+
+    :param marker: ID of the last item of the current page.
+    :param query: Query parameters of the listing.
+    :return: The continuation cursor.
+    """
+    payload = json.dumps(
+        {"marker": marker, "query": query},
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, dict[str, Any]]:
+    """
+    Decode a continuation cursor produced by encode_cursor().
+
+    :param cursor: The continuation cursor.
+    :return: The marker and query parameters carried by the cursor.
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(payload["marker"]), dict(payload["query"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,91 @@
+import time
+
+from collections.abc import Callable
+from typing import Any
+
+from openstack_mcp_server import config
+
+from .base import cloud_selection, get_openstack_conn, logger
+from .executor import fan_out
+
+
+# Services whose endpoint and supported versions are discovered ahead of
+# the first tool call, Nova microversions included.
+PREWARM_SERVICES = ("identity", "compute", "network", "block_storage", "image")
+
+
+def _list_tools() -> dict[str, Callable[..., Any]]:
+    from .compute_tools import ComputeTools
+    from .identity_tools import IdentityTools
+
+    # Lists that rarely change, primed into the catalog cache
+    return {
+        "flavors": ComputeTools().get_flavors,
+        "regions": IdentityTools().get_regions,
+    }
+
+
+def prime_cache(resource: str) -> None:
+    """
+    Fill the catalog cache snapshot of a list tool for the selected cloud.
+
+    The snapshot does not depend on the tool arguments, so every later call
+    of the tool is served from it.
+
+    :param resource: The resource type, e.g. `flavors`.
+    """
+    _list_tools()[resource]()
+
+
+def warm_up(
+    targets: list[str] | None = None,
+    caches: list[str] | None = None,
+) -> None:
+    """
+    Authenticate, discover services and prime caches of every cloud.
+
+    Clouds are warmed up concurrently. Failures are logged, a cloud that
+    could not be warmed up is set up by its first tool call instead.
+
+    :param targets: Cloud names, optionally suffixed with ``:<region>``,
+        defaults to PREWARM_CLOUDS.
+    :param caches: Resource types whose list is cached, defaults to
+        PREWARM_CACHES.
+    """
+    if targets is None:
+        targets = config.MCP_PREWARM_CLOUDS
+    if caches is None:
+        caches = config.MCP_PREWARM_CACHES
+    results = fan_out(lambda target: _warm_up(target, caches), targets)
+    for target, (_, error) in zip(targets, results):
+        if error is not None:
+            logger.error(f"Failed to pre-warm cloud {target}: {error}")
+
+
+def _warm_up(target: str, caches: list[str]) -> None:
+    start = time.perf_counter()
+    cloud, _, region = target.partition(":")
+    with cloud_selection(cloud, region or None):
+        conn = get_openstack_conn()
+        conn.authorize()
+        # Discovery is cached on the connection's session, which the first
+        # tool call reuses as the connection is released to the pool. The
+        # session is not shared with other threads, so services are
+        # discovered one after the other.
+        for service in PREWARM_SERVICES:
+            try:
+                getattr(conn, service).get_endpoint_data()
+            except Exception as error:
+                logger.warning(
+                    f"Failed to discover {service} of cloud {target}: {error}",
+                )
+        for resource in caches:
+            try:
+                prime_cache(resource)
+            except Exception as error:
+                logger.warning(
+                    f"Failed to prime {resource} of cloud {target}: {error}",
+                )
+    logger.info(
+        f"Pre-warmed cloud {target} in {time.perf_counter() - start:.2f}s",
+    )
@@ -0,0 +1,238 @@
+import re
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
+from openstack_mcp_server import config
+
+from .base import OpenStackConnectionManager
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+# Values of this shape are taken as IDs and never looked up.
+_UUID = re.compile(
+    r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+# An unknown name rebuilds an index at most this often, in seconds
+MISS_REBUILD_INTERVAL = 5.0
+
+
+def _list_resources(conn: "connection.Connection", resource: str):
+    listers = {
+        "images": lambda: conn.image.images(),
+        "flavors": lambda: conn.compute.flavors(details=False),
+        "networks": lambda: conn.network.networks(),
+    }
+    return listers[resource]()
+
+
+def _is_named(
+    conn: "connection.Connection",
+    resource: str,
+    id: str,
+    name: str,
+) -> bool:
+    from openstack import exceptions
+
+    getters = {
+        "images": conn.image.get_image,
+        "flavors": conn.compute.get_flavor,
+        "networks": conn.network.get_network,
+    }
+    try:
+        return getters[resource](id).name == name
+    except exceptions.NotFoundException:
+        return False
+
+
+def looks_like_id(resource: str, value: str | int) -> bool:
+    """
+    Tell whether a value is an ID rather than a name.
+
+    :param resource: The resource type, e.g. `images`.
+    :param value: The name or ID.
+    :return: True for UUIDs, and for integer flavor IDs.
+    """
+    if resource == "flavors" and str(value).isdigit():
+        return True
+    return bool(_UUID.match(str(value)))
+
+
+class _Index:
+    def __init__(self, built_at: float, names: dict[str, str]):
+        self.built_at = built_at
+        # ID -> name, and name -> IDs
+        self.names = names
+        self.ids: dict[str, set[str]] = {}
+        for id, name in names.items():
+            self.ids.setdefault(name, set()).add(id)
+
+    def lookup(self, resource: str, name_or_id: str) -> str | None:
+        if name_or_id in self.names:
+            return name_or_id
+        ids = self.ids.get(name_or_id)
+        if not ids:
+            return None
+        if len(ids) > 1:
+            raise ValueError(
+                f"Multiple {resource} are named {name_or_id}, "
+                f"use one of the IDs: {', '.join(sorted(ids))}",
+            )
+        return next(iter(ids))
+
+    def add(self, id: str, name: str) -> None:
+        self.remove(id)
+        self.names[id] = name
+        self.ids.setdefault(name, set()).add(id)
+
+    def remove(self, id: str) -> None:
+        name = self.names.pop(id, None)
+        if name is not None:
+            self.ids[name].discard(id)
+
+
+class NameResolver:
+    """
+    In-memory name to ID indexes of images, flavors and networks.
+
+    An index is built from a single list call per cloud and region, and
+    rebuilt after RESOLVER_TTL seconds. Write tools keep the indexes up to
+    date, and an unknown name rebuilds the index once, so resources created
+    by other clients are found too. Lookups for creates can verify the ID
+    of a name, so a renamed or replaced resource is not used.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # (resource, cloud, region) -> index
+        self._indexes: dict[tuple, _Index] = {}
+        self._lock = threading.Lock()
+
+    def resolve(
+        self,
+        conn: "connection.Connection",
+        resource: str,
+        name_or_id: str,
+        verify: bool = False,
+    ) -> str | None:
+        """
+        Resolve a resource name to its ID.
+
+        :param conn: Connection listing the resources if needed.
+        :param resource: The resource type, e.g. `images`.
+        :param name_or_id: The name or ID of the resource.
+        :param verify: Fetch the resource of a name found in an index that
+            was not just built, and list again if it was renamed or deleted.
+        :return: The ID, or None if no such resource is listed.
+        :raises ValueError: If several resources have the name.
+        """
+        key = (resource, *OpenStackConnectionManager.resolve())
+        now = time.monotonic()
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is None or now - index.built_at > self.ttl:
+            index = self._build(conn, key)
+        found = self._lookup(index, resource, name_or_id)
+        if found is None:
+            if now - index.built_at > MISS_REBUILD_INTERVAL:
+                index = self._build(conn, key)
+                found = self._lookup(index, resource, name_or_id)
+        # An index built by this call needs no check.
+        elif (
+            verify
+            and found != name_or_id
+            and index.built_at < now
+            and not _is_named(conn, resource, found, name_or_id)
+        ):
+            found = self._lookup(self._build(conn, key), resource, name_or_id)
+        return found
+
+    def resolve_id(
+        self,
+        conn: "connection.Connection",
+        resource: str,
+        name_or_id: str | int,
+        verify: bool = False,
+    ) -> str | int:
+        """
+        Resolve a name to an ID, leaving values shaped like IDs as is.
+
+        Names that are not found are passed through, so the API reports
+        them, as it would for a resource that is not listed.
+
+        :param conn: Connection listing the resources if needed.
+        :param resource: The resource type, e.g. `images`.
+        :param name_or_id: The name or ID of the resource.
+        :param verify: Check the ID of a name, see resolve().
+        :return: The ID.
+        :raises ValueError: If several resources have the name.
+        """
+        if looks_like_id(resource, name_or_id):
+            return name_or_id
+        return (
+            self.resolve(conn, resource, str(name_or_id), verify) or name_or_id
+        )
+
+    def add(self, resource: str, id: str, name: str | None) -> None:
+        """
+        Record a created or renamed resource in the index of the cloud.
+
+        :param resource: The resource type, e.g. `images`.
+        :param id: The ID of the resource.
+        :param name: The name of the resource.
+        """
+        key = (resource, *OpenStackConnectionManager.resolve())
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and name is not None:
+                index.add(id, name)
+
+    def remove(self, resource: str, id: str) -> None:
+        """
+        Forget a deleted resource.
+
+        :param resource: The resource type, e.g. `images`.
+        :param id: The ID of the resource.
+        """
+        key = (resource, *OpenStackConnectionManager.resolve())
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                index.remove(id)
+
+    def clear(self) -> None:
+        """Forget every index."""
+        with self._lock:
+            self._indexes.clear()
+
+    def _lookup(
+        self,
+        index: _Index,
+        resource: str,
+        name_or_id: str,
+    ) -> str | None:
+        # add() and remove() change indexes in place
+        with self._lock:
+            return index.lookup(resource, name_or_id)
+
+    def _build(self, conn: "connection.Connection", key: tuple) -> _Index:
+        index = _Index(
+            time.monotonic(),
+            {
+                item.id: item.name
+                for item in _list_resources(conn, key[0])
+                if item.name is not None
+            },
+        )
+        with self._lock:
+            self._indexes[key] = index
+        return index
+
+
+name_resolver = NameResolver(config.MCP_RESOLVER_TTL)
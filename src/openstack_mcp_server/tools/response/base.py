@@ -0,0 +1,87 @@
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, PrivateAttr, model_serializer
+
+
+class ResponseModel(BaseModel):
+    """
+    Base of response models that support sparse fieldsets.
+
+    A projected copy only serializes the selected fields. Required fields
+    are always kept, so the output still matches the tool output schema.
+    """
+
+    _projection: frozenset[str] | None = PrivateAttr(default=None)
+
+    # No return annotation: pydantic then keeps the model's own schema as
+    # the serialization schema, which tool output schemas are built from.
+    @model_serializer(mode="wrap")
+    def _serialize_projection(self, handler: Any):
+        data = handler(self)
+        if self._projection is None or not isinstance(data, dict):
+            return data
+        return {k: v for k, v in data.items() if k in self._projection}
+
+    def project(self, fields: list[str]) -> "ResponseModel":
+        """
+        Get a copy serializing only the given fields.
+
+        :param fields: Names of the fields to keep.
+        :return: The projected copy.
+        :raises ValueError: If a field does not exist on the model.
+        """
+        model_fields = type(self).model_fields
+        unknown = sorted(set(fields) - model_fields.keys())
+        if unknown:
+            raise ValueError(
+                f"Unknown fields for {type(self).__name__}: "
+                f"{', '.join(unknown)}. "
+                f"Available fields: {', '.join(model_fields)}",
+            )
+
+        keys = set()
+        for name, field in model_fields.items():
+            if name in fields or field.is_required():
+                # Serialized keys are aliases when dumping by alias.
+                keys.update({name, field.serialization_alias or name})
+                if field.alias:
+                    keys.add(field.alias)
+
+        projected = self.model_copy()
+        projected._projection = frozenset(keys)
+        return projected
+
+
+class CompactTable(BaseModel):
+    """List result as a column header and rows of values"""
+
+    columns: list[str]
+    rows: list[list[Any]]
+    total: int
+    next_cursor: str | None = None
+
+
+class BulkError(BaseModel):
+    """Failure of one item of a bulk operation"""
+
+    index: int
+    error: str
+    id: str | None = None
+
+
+T = TypeVar("T")
+
+
+def project(result: T, fields: list[str] | None) -> T:
+    """
+    Restrict the serialized fields of a tool result.
+
+    :param result: A response model or a list of response models.
+    :param fields: Names of the fields to keep, None keeps every field.
+    :return: The projected result.
+    """
+    if not fields:
+        return result
+    if isinstance(result, list):
+        return [project(item, fields) for item in result]
+    return result.project(fields)
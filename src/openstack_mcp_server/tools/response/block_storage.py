@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 
+from .base import ResponseModel
+
 
 class VolumeAttachment(BaseModel):
     server_id: str | None = None
@@ -7,7 +9,7 @@ class VolumeAttachment(BaseModel):
     attachment_id: str | None = None
 
 
-class Volume(BaseModel):
+class Volume(ResponseModel):
     id: str
     name: str | None = None
     status: str
@@ -19,3 +21,11 @@ class Volume(BaseModel):
     is_encrypted: bool | None = None
     description: str | None = None
     attachments: list[VolumeAttachment] = []
+
+
+class VolumeDelta(BaseModel):
+    created: list[Volume] = []
+    updated: list[Volume] = []
+    deleted: list[str] = []
+    full_sync: bool = False
+    since: str | None = None
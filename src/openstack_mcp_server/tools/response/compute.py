@@ -1,7 +1,9 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from .base import BulkError, ResponseModel
 
-class Server(BaseModel):
+
+class Server(ResponseModel):
     class Flavor(BaseModel):
         id: str | None = Field(default=None, exclude=True)
         name: str | None = Field(
@@ -37,7 +39,41 @@ class Server(BaseModel):
     accessIPv6: str | None = None
 
 
-class Flavor(BaseModel):
+class ServerPage(BaseModel):
+    servers: list[Server]
+    next_cursor: str | None = None
+
+
+class ServerDelta(BaseModel):
+    created: list[Server] = []
+    updated: list[Server] = []
+    deleted: list[str] = []
+    full_sync: bool = False
+    since: str | None = None
+
+
+class ServerBulkCreateResult(BaseModel):
+    reservation_id: str | None = None
+    servers: list[Server] = []
+    errors: list[BulkError] = []
+
+
+class ServerActionResult(BaseModel):
+    id: str
+    success: bool
+    status: str | None = None
+    error: str | None = None
+
+
+class ServerActionSummary(BaseModel):
+    action: str
+    total: int
+    succeeded: int
+    failed: int
+    results: list[ServerActionResult] = []
+
+
+class Flavor(ResponseModel):
     id: str
     name: str
     vcpus: int
@@ -1,14 +1,14 @@
-from pydantic import BaseModel
+from .base import ResponseModel
 
 
 # NOTE: In openstacksdk, all of the fields are optional.
 # In this case, we are only using description field as optional.
-class Region(BaseModel):
+class Region(ResponseModel):
     id: str
     description: str | None = None
 
 
-class Domain(BaseModel):
+class Domain(ResponseModel):
     id: str
     name: str
     description: str | None = None
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from .base import ResponseModel
+
 
 class OwnerSpecified(BaseModel):
     """Owner specified metadata for OpenStack images"""
@@ -20,7 +22,7 @@ class OwnerSpecified(BaseModel):
     model_config = ConfigDict(validate_by_name=True)
 
 
-class Image(BaseModel):
+class Image(ResponseModel):
     """OpenStack Glance Image Pydantic Model"""
 
     id: str
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class ToolMetrics(BaseModel):
+    tool: str
+    calls: int
+    errors: int
+    latency_ms_mean: float | None = None
+    latency_ms_p50: float | None = None
+    latency_ms_p99: float | None = None
+    response_bytes: int = 0
+    upstream_requests: int = 0
+    upstream_errors: int = 0
+    upstream_ms_mean: float | None = None
+
+
+class ServerMetrics(BaseModel):
+    tools: list[ToolMetrics]
@@ -1,7 +1,9 @@
 from pydantic import BaseModel
 
+from .base import BulkError, ResponseModel
 
-class Network(BaseModel):
+
+class Network(ResponseModel):
     id: str
     name: str
     status: str
@@ -15,7 +17,7 @@ class Network(BaseModel):
     project_id: str | None = None
 
 
-class Subnet(BaseModel):
+class Subnet(ResponseModel):
     id: str
     name: str | None = None
     status: str | None = None
@@ -31,7 +33,7 @@ class Subnet(BaseModel):
     host_routes: list[dict] | None = None
 
 
-class Port(BaseModel):
+class Port(ResponseModel):
     id: str
     name: str | None = None
     status: str | None = None
@@ -46,7 +48,14 @@ class Port(BaseModel):
     security_group_ids: list[str] | None = None
 
 
-class Router(BaseModel):
+class PortDelta(BaseModel):
+    created: list[Port] = []
+    updated: list[Port] = []
+    deleted: list[str] = []
+    full_sync: bool = False
+
+
+class Router(ResponseModel):
     id: str
     name: str | None = None
     status: str | None = None
@@ -59,7 +68,7 @@ class Router(BaseModel):
     routes: list[dict] | None = None
 
 
-class SecurityGroup(BaseModel):
+class SecurityGroup(ResponseModel):
     id: str
     name: str | None = None
     status: str | None = None
@@ -68,7 +77,7 @@ class SecurityGroup(BaseModel):
     security_group_rule_ids: list[str] | None = None
 
 
-class SecurityGroupRule(BaseModel):
+class SecurityGroupRule(ResponseModel):
     id: str
     name: str | None = None
     status: str | None = None
@@ -84,7 +93,7 @@ class SecurityGroupRule(BaseModel):
     security_group_id: str | None = None
 
 
-class FloatingIP(BaseModel):
+class FloatingIP(ResponseModel):
     id: str
     name: str | None = None
     status: str | None = None
@@ -95,3 +104,9 @@ class FloatingIP(BaseModel):
     fixed_ip_address: str | None = None
     port_id: str | None = None
     router_id: str | None = None
+
+
+class FloatingIPBulkResult(BaseModel):
+    created: list[FloatingIP] = []
+    errors: list[BulkError] = []
+    rolled_back: bool = False
@@ -0,0 +1,85 @@
+import random
+import time
+
+from collections.abc import Callable
+from typing import Any
+
+from openstack_mcp_server import config
+
+from .base import logger
+
+
+# Conflict (including Neutron quota errors) and rate limit, the request
+# was refused, so retrying it cannot create a resource twice
+RETRYABLE_STATUS_CODES = frozenset({409, 429})
+# Unavailable too, the request may have been carried out before it failed
+IDEMPOTENT_RETRYABLE_STATUS_CODES = RETRYABLE_STATUS_CODES | {503}
+
+
+def is_retryable(error: BaseException, idempotent: bool = True) -> bool:
+    """
+    Tell whether an API error is transient enough to retry.
+
+    :param error: The raised exception.
+    :param idempotent: Whether the failed call can safely be repeated.
+    :return: True for conflicts, rate limiting and quota errors, and for
+        unavailable services if the call is idempotent.
+    """
+    from openstack import exceptions
+
+    if isinstance(error, exceptions.ConflictException):
+        return True
+    if isinstance(error, exceptions.ForbiddenException):
+        # Nova reports exceeded quotas as 403 Forbidden.
+        return "quota" in str(error).lower()
+    status_codes = (
+        IDEMPOTENT_RETRYABLE_STATUS_CODES
+        if idempotent
+        else RETRYABLE_STATUS_CODES
+    )
+    return (
+        isinstance(error, exceptions.HttpException)
+        and error.status_code in status_codes
+    )
+
+
+def retry_with_backoff(
+    func: Callable[..., Any],
+    *args,
+    attempts: int | None = None,
+    base_delay: float | None = None,
+    idempotent: bool = True,
+    **kwargs,
+) -> Any:
+    """
+    Call a function, retrying retryable API errors with backoff.
+
+    The delay doubles after every attempt, with full jitter so concurrent
+    callers do not retry in lockstep.
+
+    :param func: The function to call.
+    :param attempts: Maximum number of calls, defaults to RETRY_ATTEMPTS.
+    :param base_delay: Delay before the first retry in seconds, defaults
+        to RETRY_BASE_DELAY.
+    :param idempotent: Whether the call can safely be repeated, creates
+        are not retried when the service was unavailable.
+    :return: The value returned by the function.
+    :raises Exception: The last error if every attempt failed.
+    """
+    if attempts is None:
+        attempts = config.MCP_RETRY_ATTEMPTS
+    if base_delay is None:
+        base_delay = config.MCP_RETRY_BASE_DELAY
+
+    for attempt in range(max(1, attempts)):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt + 1 >= attempts or not is_retryable(e, idempotent):
+                raise
+            delay = random.uniform(0, base_delay * 2**attempt)  # noqa: S311
+            logger.info(
+                f"Retrying {getattr(func, '__name__', func)} in "
+                f"{delay:.2f}s after error: {e}",
+            )
+            time.sleep(delay)
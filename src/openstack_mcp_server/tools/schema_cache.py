@@ -0,0 +1,102 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Any
+
+import fastmcp
+import pydantic
+
+from fastmcp.tools import Tool
+
+
+logger = logging.getLogger("openstack-mcp-server")
+
+# Tools registered from cached schemas skip the signature and model
+# inspection, which is most of the cost of registering a tool.
+_SOURCE_DIR = Path(__file__).parent
+
+
+def _fingerprint() -> str:
+    # Any change to the tool modules or to the schema generators
+    # invalidates the cache.
+    digest = hashlib.sha256()
+    digest.update(f"{fastmcp.__version__}:{pydantic.VERSION}".encode())
+    for path in sorted(_SOURCE_DIR.rglob("*.py")):
+        stat = path.stat()
+        digest.update(
+            f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+        )
+    return digest.hexdigest()
+
+
+class ToolSchemaCache:
+    """
+    Tool input and output schemas persisted to a directory.
+
+    The schemas are keyed by a fingerprint of the tool sources and of the
+    FastMCP and pydantic versions, so a stale file is never used.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.fingerprint = _fingerprint()
+        self.path = self.directory / f"{self.fingerprint[:16]}.json"
+        self._schemas: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("fingerprint") == self.fingerprint:
+            self._schemas = data.get("tools", {})
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """
+        Get the cached schemas of a tool.
+
+        :param name: Name of the tool.
+        :return: The description, parameters and output schema of the
+            tool, or None if not cached.
+        """
+        return self._schemas.get(name)
+
+    def put(self, tool: Tool) -> None:
+        """
+        Cache the schemas of a registered tool.
+
+        :param tool: The tool.
+        """
+        self._schemas[tool.name] = {
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "output_schema": tool.output_schema,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write newly cached schemas to the directory."""
+        if not self._dirty:
+            return
+        data = {"fingerprint": self.fingerprint, "tools": self._schemas}
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            # Atomic so concurrent servers never read a partial file.
+            os.replace(tmp_path, self.path)
+        except OSError:
+            logger.warning(
+                f"Failed to write tool schema cache in {self.directory}",
+                exc_info=True,
+            )
+            return
+        self._dirty = False
+        # Schemas of older sources are never read again.
+        for path in self.directory.glob("*.json"):
+            if path != self.path:
+                path.unlink(missing_ok=True)
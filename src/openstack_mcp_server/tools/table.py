@@ -0,0 +1,102 @@
+import functools
+
+from collections.abc import Callable
+from enum import Enum
+
+import pydantic_core
+
+from openstack_mcp_server import config
+
+from .pagination import decode_cursor, encode_cursor
+from .response.base import CompactTable, ResponseModel
+from .tracing import span
+
+
+class OutputFormatEnum(str, Enum):
+    """available output formats for list tools"""
+
+    JSON = "json"
+    TABLE = "table"
+
+
+def to_table(
+    items: list[ResponseModel],
+    cursor: str | None = None,
+    max_bytes: int | None = None,
+) -> CompactTable:
+    """
+    Convert list tool results to a compact table.
+
+    Keys are sent once as the column header instead of once per item. Rows
+    are truncated once their serialized size exceeds `max_bytes`, and the
+    returned `next_cursor` continues after the last row.
+
+    :param items: The response models, all of the same type.
+    :param cursor: Continuation cursor returned by a previous table.
+    :param max_bytes: Approximate size limit of the rows, defaults to
+        TABLE_MAX_BYTES.
+    :return: The table.
+    :raises ValueError: If the cursor is invalid or its row is gone.
+    """
+    if max_bytes is None:
+        max_bytes = config.MCP_TABLE_MAX_BYTES
+
+    start = 0
+    if cursor:
+        marker, _ = decode_cursor(cursor)
+        ids = [item.id for item in items]
+        if marker not in ids:
+            raise ValueError(f"Cursor row {marker} no longer exists")
+        start = ids.index(marker) + 1
+
+    # Serializing through pydantic keeps aliases and field projections.
+    records = pydantic_core.to_jsonable_python(items[start:])
+    columns: list[str] = []
+    for record in records[:1]:
+        columns.extend(record)
+
+    rows = []
+    size = 0
+    next_cursor = None
+    for index, record in enumerate(records):
+        row = [record.get(column) for column in columns]
+        size += len(pydantic_core.to_json(row))
+        if rows and size > max_bytes:
+            next_cursor = encode_cursor(items[start + index - 1].id, {})
+            break
+        rows.append(row)
+
+    return CompactTable(
+        columns=columns,
+        rows=rows,
+        total=len(items),
+        next_cursor=next_cursor,
+    )
+
+
+def table_output(func: Callable) -> Callable:
+    """
+    Add the compact table output mode to a list tool method.
+
+    The method declares `output_format` and `cursor` parameters for its
+    schema, they are handled here and never passed to it. Applied above
+    cached() so continuation pages are served from the same cached list.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        *args,
+        output_format: OutputFormatEnum = OutputFormatEnum.JSON,
+        cursor: str | None = None,
+        **kwargs,
+    ):
+        result = func(*args, **kwargs)
+        output_format = OutputFormatEnum(output_format)
+        if output_format == OutputFormatEnum.TABLE:
+            with span("to_table"):
+                return to_table(result, cursor)
+        if cursor:
+            raise ValueError("cursor is only supported with table output")
+        return result
+
+    return wrapper
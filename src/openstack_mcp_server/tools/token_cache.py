@@ -0,0 +1,180 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from openstack_mcp_server import config
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+logger = logging.getLogger("openstack-mcp-server")
+
+
+class TokenCache:
+    """
+    In-memory Keystone auth state cache.
+
+    The cached state is the serialized keystoneauth access info, which holds
+    both the token and the service catalog. It is shared by every connection
+    of the process authenticating with the same credentials.
+    """
+
+    def __init__(self):
+        self._states: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> str | None:
+        """
+        Load a cached auth state.
+
+        :param key: Cache key of the credentials.
+        :return: The serialized auth state, or None if not cached.
+        """
+        with self._lock:
+            return self._states.get(key)
+
+    def save(self, key: str, state: str) -> None:
+        """
+        Store an auth state.
+
+        :param key: Cache key of the credentials.
+        :param state: The serialized auth state.
+        """
+        with self._lock:
+            self._states[key] = state
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a cached auth state.
+
+        :param key: Cache key of the credentials.
+        """
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileTokenCache(TokenCache):
+    """
+    Keystone auth state cache persisted to a directory.
+
+    Tokens survive restarts and are shared between processes using the same
+    directory. Files are only readable by the current user.
+    """
+
+    def __init__(self, directory: Path):
+        super().__init__()
+        self.directory = Path(directory)
+
+    def load(self, key: str) -> str | None:
+        # The file wins over memory as another process may have refreshed it.
+        try:
+            return self._path(key).read_text()
+        except OSError:
+            return super().load(key)
+
+    def save(self, key: str, state: str) -> None:
+        super().save(key, state)
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "w") as f:
+                f.write(state)
+            # Atomic so concurrent processes never read a partial file.
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            logger.warning(
+                f"Failed to write token cache in {self.directory}",
+                exc_info=True,
+            )
+
+    def delete(self, key: str) -> None:
+        super().delete(key)
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+
+_token_cache: TokenCache | None = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache | None:
+    """
+    Get the configured token cache.
+
+    :return: The token cache, or None if token caching is disabled.
+    """
+    global _token_cache
+    if config.MCP_AUTH_CACHE == "none":
+        return None
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                if config.MCP_AUTH_CACHE == "file":
+                    _token_cache = FileTokenCache(config.MCP_AUTH_CACHE_DIR)
+                else:
+                    _token_cache = TokenCache()
+    return _token_cache
+
+
+def _cache_key(conn: "connection.Connection", cloud_name: str) -> str | None:
+    get_cache_id = getattr(conn.session.auth, "get_cache_id", None)
+    cache_id = get_cache_id() if get_cache_id else None
+    if not isinstance(cache_id, str):
+        return None
+    # Tokens and catalogs are not region specific, so the key is not either.
+    return f"{cloud_name}:{cache_id}"
+
+
+def ensure_fresh_token(
+    conn: "connection.Connection",
+    cloud_name: str,
+    cache: TokenCache | None,
+) -> None:
+    """
+    Make sure the connection holds a token that is not about to expire.
+
+    A cached auth state is installed if the connection has none. A token
+    expiring within TOKEN_REFRESH_MARGIN seconds is replaced, and a newly
+    obtained token is written back to the cache.
+
+    :param conn: The OpenStack connection.
+    :param cloud_name: Name of the cloud the connection belongs to.
+    :param cache: The token cache, or None if token caching is disabled.
+    """
+    if cache is None:
+        return
+    key = _cache_key(conn, cloud_name)
+    if key is None:
+        return
+
+    auth = conn.session.auth
+    if auth.auth_ref is None:
+        state = cache.load(key)
+        if state is not None:
+            try:
+                auth.set_auth_state(state)
+            except (ValueError, KeyError, TypeError):
+                cache.delete(key)
+
+    auth_ref = auth.auth_ref
+    if auth_ref is not None and not auth_ref.will_expire_soon(
+        config.MCP_TOKEN_REFRESH_MARGIN,
+    ):
+        return
+
+    if auth_ref is not None:
+        auth.invalidate()
+    conn.authorize()
+    state = auth.get_auth_state()
+    if state:
+        cache.save(key, state)
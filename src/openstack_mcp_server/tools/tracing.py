@@ -0,0 +1,128 @@
+import contextlib
+import functools
+import logging
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from openstack_mcp_server import config
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+try:
+    from opentelemetry import trace
+except ImportError:  # Tracing is an optional dependency
+    trace = None
+
+
+logger = logging.getLogger("openstack-mcp-server")
+
+# Set once the OTLP exporter is configured, spans are skipped otherwise.
+_tracer: Any = None
+
+
+def setup_tracing() -> bool:
+    """
+    Export OpenTelemetry spans over OTLP if TRACING is enabled.
+
+    Requires the `tracing` extra. The exporter endpoint is OTLP_ENDPOINT,
+    or the standard OTEL_EXPORTER_OTLP_* variables when unset.
+
+    :return: Whether spans are exported.
+    """
+    global _tracer
+    if not config.MCP_TRACING:
+        return False
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning(
+            "TRACING is enabled but OpenTelemetry is not installed, "
+            "install the `tracing` extra",
+        )
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": config.MCP_TRACING_SERVICE_NAME},
+        ),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=config.MCP_OTLP_ENDPOINT)
+        ),
+    )
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("openstack_mcp_server")
+    return True
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Trace a block as a child of the current span.
+
+    Spans follow the context variables, so work run on the tool worker
+    pool or by fan_out() is a child of the tool span.
+
+    :param name: Name of the span.
+    :param attributes: Span attributes, None values are left out.
+    :return: The span, None if tracing is disabled.
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(
+        name,
+        attributes={k: v for k, v in attributes.items() if v is not None},
+    ) as current:
+        yield current
+
+
+def trace_upstream_requests(conn: "connection.Connection") -> None:
+    """
+    Trace every HTTP request of a connection as a span.
+
+    Wraps `send` of the requests session underneath the keystoneauth
+    session, which is called once per request, token requests, retries
+    and pages included.
+
+    :param conn: The OpenStack connection.
+    """
+    if _tracer is None:
+        return
+    session = getattr(conn.session, "session", None)
+    send = getattr(session, "send", None)
+    if send is None or getattr(send, "traced", False) is True:
+        return
+
+    @functools.wraps(send)
+    def traced_send(request, **kwargs):
+        url = urlsplit(request.url)
+        with span(
+            request.method,
+            **{
+                "http.request.method": request.method,
+                "server.address": url.hostname,
+                "server.port": url.port,
+                "url.path": url.path,
+            },
+        ) as current:
+            response = send(request, **kwargs)
+            current.set_attribute(
+                "http.response.status_code",
+                response.status_code,
+            )
+            return response
+
+    traced_send.traced = True
+    session.send = traced_send
@@ -0,0 +1,471 @@
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from openstack_mcp_server import config
+
+from .base import (
+    OpenStackConnectionManager,
+    get_openstack_conn,
+    logger,
+    release_openstack_conn,
+)
+from .delta import latest_timestamp
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+
+# IDs per Glance `id=in:` filter, keeps query strings short.
+IMAGE_ID_BATCH_SIZE = 50
+
+# Up to this many awaited servers or volumes are polled with one GET
+# each, beyond that listing the changes is cheaper.
+PER_ID_POLL_MAX_IDS = 10
+
+# Status reported for resources that no longer exist.
+DELETED = "DELETED"
+
+# Resources remembered per poller for responses served from local state.
+RECENT_MAX_ENTRIES = 1024
+
+
+@dataclass
+class WaitResult:
+    """Outcome of waiting for one resource"""
+
+    status: str | None = None
+    resource: Any = None
+    error: str | None = None
+    timed_out: bool = False
+
+
+# A poll returns the status and resource of the IDs found, the timestamp the
+# next poll starts from, and whether IDs not found no longer exist.
+PollResult = tuple[dict[str, tuple[str, Any]], str | None, bool]
+
+
+def _get_each(
+    get: Callable[[str], Any],
+    ids: Iterable[str],
+    status: Callable[[Any], str],
+) -> dict[str, tuple[str, Any]]:
+    from openstack import exceptions
+
+    found = {}
+    for resource_id in ids:
+        try:
+            resource = get(resource_id)
+        except exceptions.NotFoundException:
+            found[resource_id] = (DELETED, None)
+        else:
+            found[resource_id] = (status(resource), resource)
+    return found
+
+
+def _server_status(server: Any) -> str:
+    return server["status"]
+
+
+def _volume_status(volume: Any) -> str:
+    return volume.status.upper()
+
+
+def _poll_servers(
+    conn: "connection.Connection",
+    ids: list[str],
+    since: str | None,
+    added: list[str],
+) -> PollResult:
+    if since is None and len(ids) <= PER_ID_POLL_MAX_IDS:
+        found = _get_each(conn.compute.get_server, ids, _server_status)
+        return found, None, True
+
+    # After a full listing only servers changed since the previous poll
+    # are listed. changes-since also returns deleted servers.
+    query = {"changes_since": since} if since else {}
+    found = {}
+    timestamps = []
+    for server in conn.compute.servers(**query):
+        timestamps.append(server.get("updated_at"))
+        found[server["id"]] = (server["status"], server)
+    if since:
+        # Servers awaited since the previous poll may not have changed.
+        found.update(
+            _get_each(
+                conn.compute.get_server,
+                [i for i in added if i not in found],
+                _server_status,
+            ),
+        )
+    return found, latest_timestamp(timestamps, since), since is None
+
+
+def _poll_volumes(
+    conn: "connection.Connection",
+    ids: list[str],
+    since: str | None,
+    added: list[str],
+) -> PollResult:
+    if since is None and len(ids) <= PER_ID_POLL_MAX_IDS:
+        found = _get_each(conn.block_storage.get_volume, ids, _volume_status)
+        return found, None, True
+
+    if since is None:
+        volumes = list(conn.block_storage.volumes())
+        found = {
+            volume.id: (_volume_status(volume), volume) for volume in volumes
+        }
+    else:
+        # Only volumes updated since the previous poll are detailed, a
+        # listing without details detects deleted volumes.
+        volumes = list(conn.block_storage.volumes(updated_at=f"gte:{since}"))
+        found = {
+            volume.id: (_volume_status(volume), volume) for volume in volumes
+        }
+        current_ids = {
+            volume.id for volume in conn.block_storage.volumes(details=False)
+        }
+        for volume_id in ids:
+            if volume_id not in current_ids:
+                found[volume_id] = (DELETED, None)
+        # Volumes still being created may not have updated_at yet.
+        found.update(
+            _get_each(
+                conn.block_storage.get_volume,
+                [i for i in added if i not in found],
+                _volume_status,
+            ),
+        )
+    next_since = latest_timestamp(
+        (volume.updated_at or volume.created_at for volume in volumes),
+        since,
+    )
+    return found, next_since, since is None
+
+
+def _poll_images(
+    conn: "connection.Connection",
+    ids: list[str],
+    since: str | None,
+    added: list[str],
+) -> PollResult:
+    found = {}
+    for i in range(0, len(ids), IMAGE_ID_BATCH_SIZE):
+        batch = ids[i : i + IMAGE_ID_BATCH_SIZE]
+        for image in conn.image.images(id=f"in:{','.join(batch)}"):
+            found[image.id] = (image.status.upper(), image)
+    return found, None, True
+
+
+POLLERS: dict[str, Callable[..., PollResult]] = {
+    "servers": _poll_servers,
+    "volumes": _poll_volumes,
+    "images": _poll_images,
+}
+
+
+class _Pending:
+    """One resource awaited by one caller"""
+
+    def __init__(self, statuses: set[str], failures: set[str]):
+        self.statuses = statuses
+        self.failures = failures
+        self.result: WaitResult | None = None
+        self.event = threading.Event()
+
+    def resolve(self, result: WaitResult) -> None:
+        self.result = result
+        self.event.set()
+
+
+class _Poller:
+    """Polls one resource type of one cloud for every pending wait"""
+
+    def __init__(self, cloud: str, region: str | None, resource: str):
+        self.cloud = cloud
+        self.region = region
+        self.resource = resource
+        self.pending: dict[str, list[_Pending]] = {}
+        self.last_status: dict[str, str] = {}
+        # Latest copy of polled resources, least recent first.
+        self.recent: OrderedDict[str, Any] = OrderedDict()
+        self.since: str | None = None
+        # IDs awaited since the previous poll started
+        self.added: set[str] = set()
+        self.cond = threading.Condition()
+        self.thread: threading.Thread | None = None
+
+    def add(self, waits: dict[str, _Pending]) -> None:
+        with self.cond:
+            for resource_id, pending in waits.items():
+                self.pending.setdefault(resource_id, []).append(pending)
+            # New resources may already be in their target status, which an
+            # incremental poll would not report. They are fetched one by
+            # one, unless there are so many that a full listing is cheaper.
+            self.added.update(waits)
+            if len(self.added) > PER_ID_POLL_MAX_IDS:
+                self.since = None
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._run,
+                    name=f"openstack-mcp-waiter-{self.resource}",
+                    daemon=True,
+                )
+                self.thread.start()
+            else:
+                self.cond.notify()
+
+    def remember(self, resource_id: str, resource: Any) -> None:
+        with self.cond:
+            self.recent[resource_id] = resource
+            self.recent.move_to_end(resource_id)
+            while len(self.recent) > RECENT_MAX_ENTRIES:
+                self.recent.popitem(last=False)
+
+    def remove(self, resource_id: str, pending: _Pending) -> str | None:
+        """Stop waiting, returns the last polled status."""
+        with self.cond:
+            status = self.last_status.get(resource_id)
+            waiters = self.pending.get(resource_id, [])
+            if pending in waiters:
+                waiters.remove(pending)
+            if not waiters:
+                self.pending.pop(resource_id, None)
+                self.last_status.pop(resource_id, None)
+            return status
+
+    def _run(self) -> None:
+        interval = config.MCP_WAIT_INTERVAL
+        while True:
+            with self.cond:
+                if not self.pending:
+                    self.thread = None
+                    return
+                ids = list(self.pending)
+                since = self.since
+                added = [i for i in self.added if i in self.pending]
+                self.added = set()
+
+            try:
+                conn = get_openstack_conn(self.cloud, self.region)
+                poll = POLLERS[self.resource](conn, ids, since, added)
+            except Exception:
+                logger.warning(
+                    f"Failed to poll {self.resource} status",
+                    exc_info=True,
+                )
+                poll = None
+            finally:
+                release_openstack_conn()
+
+            with self.cond:
+                if poll is None:
+                    self.added.update(added)
+                changed = poll is not None and self._apply(ids, since, *poll)
+                # Poll fast while statuses move, back off while they do not.
+                if changed:
+                    interval = config.MCP_WAIT_INTERVAL
+                else:
+                    interval = min(
+                        interval * 2,
+                        max(
+                            config.MCP_WAIT_INTERVAL,
+                            config.MCP_WAIT_MAX_INTERVAL,
+                        ),
+                    )
+                if self.pending:
+                    self.cond.wait(interval)
+
+    def _apply(
+        self,
+        ids: list[str],
+        since: str | None,
+        found: dict[str, tuple[str, Any]],
+        next_since: str | None,
+        complete: bool,
+    ) -> bool:
+        # Keep a full listing pending if resources were added meanwhile.
+        if self.since == since:
+            self.since = next_since
+
+        for resource_id, (_, resource) in found.items():
+            if resource is None:
+                self.recent.pop(resource_id, None)
+            else:
+                self.remember(resource_id, resource)
+
+        changed = False
+        for resource_id in ids:
+            if resource_id in found:
+                status, resource = found[resource_id]
+            elif complete:
+                status, resource = DELETED, None
+                self.recent.pop(resource_id, None)
+            else:
+                continue
+            if self.last_status.get(resource_id) != status:
+                self.last_status[resource_id] = status
+                changed = True
+
+            for pending in list(self.pending.get(resource_id, [])):
+                if status in pending.statuses:
+                    pending.resolve(WaitResult(status, resource))
+                elif status in pending.failures:
+                    pending.resolve(
+                        WaitResult(
+                            status,
+                            resource,
+                            f"{self.resource[:-1].capitalize()} "
+                            f"{resource_id} went to {status}",
+                        ),
+                    )
+                else:
+                    continue
+                self.pending[resource_id].remove(pending)
+            if not self.pending.get(resource_id):
+                self.pending.pop(resource_id, None)
+                self.last_status.pop(resource_id, None)
+        return changed
+
+
+class StatusWaiter:
+    """
+    Waits for resources to reach a status.
+
+    Concurrent waits on the same resource type and cloud share one polling
+    thread. A few servers or volumes are fetched one by one, more are
+    listed once, then only their changes since the previous poll are
+    listed. The interval starts at WAIT_INTERVAL, doubles while no status
+    changes, up to WAIT_MAX_INTERVAL.
+    """
+
+    def __init__(self):
+        self._pollers: dict[tuple, _Poller] = {}
+        self._lock = threading.Lock()
+
+    def wait(
+        self,
+        resource: str,
+        ids: Iterable[str],
+        statuses: Iterable[str],
+        timeout: float,
+        failures: Iterable[str] = ("ERROR",),
+    ) -> dict[str, WaitResult]:
+        """
+        Wait until resources reach one of the given statuses.
+
+        :param resource: The resource type, one of `servers`, `volumes`
+            or `images`.
+        :param ids: IDs of the resources.
+        :param statuses: Target statuses, e.g. `ACTIVE`. `DELETED` waits for
+            the resources to be gone.
+        :param timeout: Seconds to wait for all the resources.
+        :param failures: Statuses ending the wait with an error.
+        :return: The outcome of every resource keyed by ID. A resource
+            that failed or timed out has an error set.
+        """
+        cloud, region = OpenStackConnectionManager.resolve()
+        poller = self._get_poller(cloud, region, resource)
+        statuses = {status.upper() for status in statuses}
+        failures = {status.upper() for status in failures} - statuses
+
+        waits = {
+            resource_id: _Pending(statuses, failures)
+            for resource_id in dict.fromkeys(ids)
+        }
+        poller.add(waits)
+
+        deadline = time.monotonic() + timeout
+        results = {}
+        for resource_id, pending in waits.items():
+            pending.event.wait(max(0.0, deadline - time.monotonic()))
+            status = poller.remove(resource_id, pending)
+            if pending.result is None:
+                pending.result = WaitResult(
+                    status,
+                    error=f"Timed out after {timeout}s "
+                    f"waiting for {resource_id} (status {status})",
+                    timed_out=True,
+                )
+            results[resource_id] = pending.result
+        return results
+
+    def last_seen(self, resource: str, resource_id: str) -> Any | None:
+        """
+        Get the latest polled copy of a resource.
+
+        The copy may be out of date, it is only as fresh as the last poll.
+
+        :param resource: The resource type.
+        :param resource_id: ID of the resource.
+        :return: The resource object, None if it is unknown.
+        """
+        cloud, region = OpenStackConnectionManager.resolve()
+        poller = self._get_poller(cloud, region, resource)
+        with poller.cond:
+            return poller.recent.get(resource_id)
+
+    def clear(self) -> None:
+        """Forget every remembered resource."""
+        with self._lock:
+            pollers = list(self._pollers.values())
+        for poller in pollers:
+            with poller.cond:
+                poller.recent.clear()
+
+    def _get_poller(
+        self,
+        cloud: str,
+        region: str | None,
+        resource: str,
+    ) -> _Poller:
+        if resource not in POLLERS:
+            raise ValueError(f"Unsupported resource type: {resource}")
+        key = (cloud, region, resource)
+        with self._lock:
+            poller = self._pollers.get(key)
+            if poller is None:
+                poller = self._pollers[key] = _Poller(cloud, region, resource)
+            return poller
+
+
+status_waiter = StatusWaiter()
+
+
+def wait_for_status(
+    resource: str,
+    resource_id: str,
+    statuses: Iterable[str],
+    timeout: float,
+    failures: Iterable[str] = ("ERROR",),
+) -> Any:
+    """
+    Wait until a single resource reaches one of the given statuses.
+
+    :param resource: The resource type, see StatusWaiter.wait().
+    :param resource_id: ID of the resource.
+    :param statuses: Target statuses.
+    :param timeout: Seconds to wait.
+    :param failures: Statuses raising RuntimeError.
+    :return: The resource object from the last poll.
+    :raises TimeoutError: If no target status was reached in time.
+    :raises RuntimeError: If the resource went to a failure status.
+    """
+    result = status_waiter.wait(
+        resource,
+        [resource_id],
+        statuses,
+        timeout,
+        failures,
+    )[resource_id]
+    if result.error is None:
+        return result.resource
+    if result.timed_out:
+        raise TimeoutError(result.error)
+    raise RuntimeError(result.error)
@@ -2,11 +2,63 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from openstack_mcp_server.tools.cache import catalog_cache, response_cache
+from openstack_mcp_server.tools.delta import snapshot_store
+from openstack_mcp_server.tools.fip_pool import fip_pool
+from openstack_mcp_server.tools.resolver import name_resolver
+from openstack_mcp_server.tools.waiter import status_waiter
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with empty list tool caches and snapshots."""
+    response_cache.clear()
+    catalog_cache.clear()
+    yield
+    response_cache.clear()
+    catalog_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshot_store():
+    """Start every test without delta sync snapshots."""
+    snapshot_store.clear()
+    yield
+    snapshot_store.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_fip_pool():
+    """Start every test without indexed free floating IPs."""
+    fip_pool.clear()
+    yield
+    fip_pool.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_status_waiter():
+    """Start every test without remembered polled resources."""
+    status_waiter.clear()
+    yield
+    status_waiter.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_name_resolver():
+    """Start every test without name to ID indexes."""
+    name_resolver.clear()
+    yield
+    name_resolver.clear()
+
 
 @pytest.fixture
 def mock_get_openstack_conn():
     """Mock get_openstack_conn function for compute_tools."""
     mock_conn = Mock()
+    # Nothing is listed, so image, flavor and network names pass through.
+    mock_conn.image.images.return_value = []
+    mock_conn.compute.flavors.return_value = []
+    mock_conn.network.networks.return_value = []
 
     with patch(
         "openstack_mcp_server.tools.compute_tools.get_openstack_conn",
@@ -73,3 +125,19 @@ def mock_get_openstack_conn_block_storage():
         return_value=mock_conn,
     ):
         yield mock_conn
+
+
+@pytest.fixture
+def mock_get_openstack_conn_waiter():
+    """Mock get_openstack_conn function for the status waiter."""
+    mock_conn = Mock()
+
+    with (
+        patch(
+            "openstack_mcp_server.tools.waiter.get_openstack_conn",
+            return_value=mock_conn,
+        ),
+        patch("openstack_mcp_server.config.MCP_WAIT_INTERVAL", 0.01),
+        patch("openstack_mcp_server.config.MCP_WAIT_MAX_INTERVAL", 0.05),
+    ):
+        yield mock_conn
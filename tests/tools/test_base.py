@@ -0,0 +1,155 @@
+import threading
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack_mcp_server.tools.base import (
+    OpenStackConnectionManager,
+    OpenStackConnectionPool,
+    cloud_selection,
+    get_connection_pool_stats,
+    get_openstack_conn,
+    release_openstack_conn,
+)
+
+
+@pytest.fixture
+def mock_openstack_connect():
+    """Mock openstack.connect returning a new connection per call."""
+    with patch(
+        "openstack.connect",
+        side_effect=lambda **kwargs: Mock(),
+    ) as mock_connect:
+        yield mock_connect
+
+
+class TestOpenStackConnectionPool:
+    """Test cases for OpenStackConnectionPool class."""
+
+    def test_acquire_creates_and_reuses(self, mock_openstack_connect):
+        """Test connections are created lazily and reused after release."""
+        pool = OpenStackConnectionPool("openstack", 2, 300, 3600)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second.connection is first.connection
+        mock_openstack_connect.assert_called_once_with(cloud="openstack")
+        assert pool.stats() == {
+            "cloud": "openstack",
+            "region": None,
+            "size": 2,
+            "in_use": 1,
+            "idle": 0,
+            "created": 1,
+            "reused": 1,
+            "expired": 0,
+        }
+
+    def test_acquire_times_out_when_exhausted(self, mock_openstack_connect):
+        """Test acquire raises when every connection is leased."""
+        pool = OpenStackConnectionPool("openstack", 1, 300, 3600)
+        pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+    def test_acquire_waits_for_release(self, mock_openstack_connect):
+        """Test a waiting caller gets the connection released by another."""
+        pool = OpenStackConnectionPool("openstack", 1, 300, 3600)
+        first = pool.acquire()
+
+        timer = threading.Timer(0.05, pool.release, args=(first,))
+        timer.start()
+        second = pool.acquire(timeout=5)
+        timer.join()
+
+        assert second.connection is first.connection
+
+    def test_idle_connections_expire(self, mock_openstack_connect):
+        """Test idle connections past the idle timeout are closed."""
+        pool = OpenStackConnectionPool("openstack", 2, 0, 3600)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second.connection is not first.connection
+        first.connection.close.assert_called_once()
+        assert pool.stats()["expired"] == 1
+
+    def test_old_connections_are_retired(self, mock_openstack_connect):
+        """Test connections past the max age are not returned to the pool."""
+        pool = OpenStackConnectionPool("openstack", 2, 300, 0)
+
+        first = pool.acquire()
+        pool.release(first)
+
+        first.connection.close.assert_called_once()
+        assert pool.stats()["idle"] == 0
+
+    def test_failed_connect_frees_slot(self):
+        """Test a failing connect does not leak a pool slot."""
+        pool = OpenStackConnectionPool("openstack", 1, 300, 3600)
+
+        with patch(
+            "openstack.connect",
+            side_effect=Exception("auth failed"),
+        ):
+            with pytest.raises(Exception, match="auth failed"):
+                pool.acquire()
+
+        assert pool.stats()["in_use"] == 0
+
+
+class TestOpenStackConnectionManager:
+    """Test cases for OpenStackConnectionManager class."""
+
+    def teardown_method(self):
+        release_openstack_conn()
+        OpenStackConnectionManager.close()
+
+    def test_connection_is_leased_per_thread(self, mock_openstack_connect):
+        """Test each thread gets its own connection until release."""
+        conn = get_openstack_conn()
+        assert get_openstack_conn() is conn
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(get_openstack_conn()),
+        )
+        thread.start()
+        thread.join()
+
+        assert other[0] is not conn
+
+    def test_release_returns_connection(self, mock_openstack_connect):
+        """Test a released connection is reused by the next lease."""
+        conn = get_openstack_conn()
+        release_openstack_conn()
+
+        assert get_openstack_conn() is conn
+        assert OpenStackConnectionManager.get_stats()[0]["reused"] == 1
+
+    def test_pools_are_kept_per_cloud_and_region(
+        self,
+        mock_openstack_connect,
+    ):
+        """Test each cloud and region gets its own cached pool."""
+        default = get_openstack_conn()
+        other = get_openstack_conn(cloud="other")
+        with cloud_selection("other", "r1"):
+            regional = get_openstack_conn()
+
+        assert len({id(default), id(other), id(regional)}) == 3
+        assert get_openstack_conn(cloud="other") is other
+        mock_openstack_connect.assert_any_call(
+            cloud="other",
+            region_name="r1",
+        )
+        assert sorted(
+            (stats["cloud"], stats["region"] or "")
+            for stats in get_connection_pool_stats()
+        ) == [("openstack", ""), ("other", ""), ("other", "r1")]
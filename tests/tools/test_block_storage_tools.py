@@ -2,6 +2,8 @@ from unittest.mock import Mock
 
 import pytest
 
+from openstack.exceptions import NotFoundException
+
 from openstack_mcp_server.tools.block_storage_tools import BlockStorageTools
 from openstack_mcp_server.tools.response.block_storage import (
     Volume,
@@ -94,6 +96,97 @@ class TestBlockStorageTools:
 
         mock_conn.block_storage.volumes.assert_called_once()
 
+    def test_get_volumes_delta(self, mock_get_openstack_conn_block_storage):
+        """Test only volumes updated since the last sync are returned."""
+        mock_conn = mock_get_openstack_conn_block_storage
+
+        def make_volume(volume_id: str, status: str, updated_at: str) -> Mock:
+            volume = Mock()
+            volume.id = volume_id
+            volume.name = volume_id
+            volume.status = status
+            volume.size = 1
+            volume.volume_type = None
+            volume.availability_zone = "nova"
+            volume.created_at = "2025-01-01T00:00:00.000000"
+            volume.updated_at = updated_at
+            volume.is_bootable = False
+            volume.is_encrypted = False
+            volume.description = None
+            volume.attachments = []
+            return volume
+
+        mock_conn.block_storage.volumes.side_effect = [
+            [
+                make_volume(
+                    "vol-1", "available", "2025-01-01T00:00:00.000000"
+                ),
+                make_volume(
+                    "vol-2", "available", "2025-01-02T00:00:00.000000"
+                ),
+            ],
+            [
+                make_volume("vol-2", "in-use", None),
+                make_volume("vol-3", "", None),
+            ],
+            [make_volume("vol-2", "in-use", "2025-01-03T00:00:00.000000")],
+        ]
+        mock_conn.block_storage.get_volume.return_value = make_volume(
+            "vol-3",
+            "creating",
+            None,
+        )
+
+        block_storage_tools = BlockStorageTools()
+        first = block_storage_tools.get_volumes_delta()
+        second = block_storage_tools.get_volumes_delta()
+
+        assert [v.id for v in first.created] == ["vol-1", "vol-2"]
+        assert [v.id for v in second.created] == ["vol-3"]
+        assert [v.status for v in second.updated] == ["in-use"]
+        assert second.deleted == ["vol-1"]
+        assert second.since == "2025-01-03T00:00:00.000000"
+        mock_conn.block_storage.volumes.assert_any_call(
+            updated_at="gte:2025-01-02T00:00:00.000000",
+        )
+        mock_conn.block_storage.get_volume.assert_called_once_with("vol-3")
+
+    def test_get_volumes_delta_volume_deleted_meanwhile(
+        self,
+        mock_get_openstack_conn_block_storage,
+    ):
+        """Test a volume deleted before it is fetched does not fail."""
+        mock_conn = mock_get_openstack_conn_block_storage
+        volume = Mock(
+            id="vol-1",
+            status="available",
+            size=1,
+            volume_type=None,
+            availability_zone="nova",
+            created_at="2025-01-01T00:00:00.000000",
+            updated_at="2025-01-01T00:00:00.000000",
+            is_bootable=False,
+            is_encrypted=False,
+            description=None,
+            attachments=[],
+        )
+        volume.name = "vol-1"
+        mock_conn.block_storage.volumes.side_effect = [
+            [volume],
+            [Mock(id="vol-1"), Mock(id="vol-2")],
+            [],
+        ]
+        mock_conn.block_storage.get_volume.side_effect = NotFoundException()
+
+        block_storage_tools = BlockStorageTools()
+        block_storage_tools.get_volumes_delta()
+        delta = block_storage_tools.get_volumes_delta()
+
+        assert delta.created == []
+        assert delta.updated == []
+        assert delta.deleted == []
+        mock_conn.block_storage.get_volume.assert_called_once_with("vol-2")
+
     def test_get_volumes_single_volume(
         self,
         mock_get_openstack_conn_block_storage,
@@ -614,7 +707,7 @@ class TestBlockStorageTools:
         block_storage_tools.register_tools(mock_mcp)
 
         # Verify mcp.tool() was called for each method
-        assert mock_mcp.tool.call_count == 5
+        assert mock_mcp.tool.call_count == 6
 
         # Verify all methods were registered
         registered_methods = [
@@ -622,6 +715,7 @@ class TestBlockStorageTools:
         ]
         expected_methods = [
             block_storage_tools.get_volumes,
+            block_storage_tools.get_volumes_delta,
             block_storage_tools.get_volume_details,
             block_storage_tools.create_volume,
             block_storage_tools.delete_volume,
@@ -0,0 +1,278 @@
+import threading
+import time
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack_mcp_server.tools.base import cloud_selection
+from openstack_mcp_server.tools.cache import (
+    CatalogCache,
+    ResponseCache,
+    TTLCache,
+    get_cache_stats,
+    invalidates,
+)
+from openstack_mcp_server.tools.network_tools import NetworkTools
+from openstack_mcp_server.tools.response.compute import Flavor
+
+
+def make_network(network_id: str) -> Mock:
+    """Build an OpenStack network object."""
+    network = Mock()
+    network.id = network_id
+    network.name = network_id
+    network.status = "ACTIVE"
+    network.description = None
+    network.is_admin_state_up = True
+    network.is_shared = False
+    network.mtu = 1500
+    network.provider_network_type = None
+    network.provider_physical_network = None
+    network.provider_segmentation_id = None
+    network.project_id = "proj-1"
+    return network
+
+
+class TestTTLCache:
+    """Test cases for TTLCache class."""
+
+    def test_get_and_set(self):
+        """Test cached values are returned and counted as hits."""
+        cache = TTLCache(ttl=60, max_entries=10, max_bytes=1024)
+
+        assert cache.get("a") == (False, None)
+        cache.set("a", [1, 2])
+
+        assert cache.get("a") == (True, [1, 2])
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_expire(self):
+        """Test entries are dropped after the TTL."""
+        cache = TTLCache(ttl=60, max_entries=10, max_bytes=1024)
+
+        with patch(
+            "openstack_mcp_server.tools.cache.time.monotonic",
+            side_effect=[0, 61],
+        ):
+            cache.set("a", 1)
+            assert cache.get("a") == (False, None)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_zero_ttl_disables_caching(self):
+        """Test nothing is stored when the TTL is zero."""
+        cache = TTLCache(ttl=0, max_entries=10, max_bytes=1024)
+        cache.set("a", 1)
+
+        assert cache.get("a") == (False, None)
+
+    def test_lru_eviction_by_entries(self):
+        """Test the least recently used entry is evicted first."""
+        cache = TTLCache(ttl=60, max_entries=2, max_bytes=1024)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test entries are evicted to stay under the memory cap."""
+        cache = TTLCache(ttl=60, max_entries=10, max_bytes=20)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y" * 10)
+
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["bytes"] <= 20
+
+    def test_oversized_values_are_not_cached(self):
+        """Test values larger than the memory cap are skipped."""
+        cache = TTLCache(ttl=60, max_entries=10, max_bytes=5)
+        cache.set("a", "x" * 10)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_stale_generation_is_dropped(self):
+        """Test values fetched before a clear are not stored."""
+        cache = TTLCache(ttl=60, max_entries=10, max_bytes=1024)
+        generation = cache.generation
+        cache.clear()
+        cache.set("a", 1, generation)
+
+        assert cache.get("a") == (False, None)
+
+
+class TestResponseCache:
+    """Test cases for the list tool read-through cache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self):
+        """Cache list tool responses, which is off by default."""
+        with (
+            patch("openstack_mcp_server.tools.cache.config.MCP_CACHE_TTL", 30),
+            patch(
+                "openstack_mcp_server.tools.cache.response_cache",
+                ResponseCache(),
+            ),
+        ):
+            yield
+
+    def test_list_tool_results_are_cached(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test repeated list calls hit the API once."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.list_networks.return_value = [make_network("net-1")]
+
+        network_tools = NetworkTools()
+        first = network_tools.get_networks()
+        second = network_tools.get_networks()
+
+        assert first == second
+        mock_conn.list_networks.assert_called_once()
+        assert get_cache_stats()["networks"]["hits"] == 1
+
+    def test_cache_keyed_by_arguments_and_cloud(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test different filters and clouds are cached separately."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.list_networks.return_value = [make_network("net-1")]
+
+        network_tools = NetworkTools()
+        network_tools.get_networks()
+        network_tools.get_networks(status_filter="active")
+        with cloud_selection("other"):
+            network_tools.get_networks()
+
+        assert mock_conn.list_networks.call_count == 3
+
+    def test_write_invalidates_cache(self, mock_openstack_connect_network):
+        """Test create_network drops the cached network list."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.list_networks.return_value = [make_network("net-1")]
+        mock_conn.network.create_network.return_value = make_network("net-2")
+
+        network_tools = NetworkTools()
+        network_tools.get_networks()
+        network_tools.create_network(name="net-2")
+        network_tools.get_networks()
+
+        assert mock_conn.list_networks.call_count == 2
+
+    def test_failed_write_invalidates_cache(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test the cache is dropped even if the write fails."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.list_networks.return_value = [make_network("net-1")]
+        mock_conn.network.delete_network.side_effect = Exception("conflict")
+
+        network_tools = NetworkTools()
+        network_tools.get_networks()
+        with pytest.raises(Exception, match="conflict"):
+            network_tools.delete_network("net-1")
+        network_tools.get_networks()
+
+        assert mock_conn.list_networks.call_count == 2
+
+
+def make_flavor(flavor_id: str) -> Flavor:
+    """Build a flavor response model."""
+    return Flavor(
+        id=flavor_id,
+        name=f"m1.{flavor_id}",
+        vcpus=1,
+        ram=512,
+        disk=1,
+        is_public=True,
+    )
+
+
+class TestCatalogCache:
+    """Test cases for CatalogCache class."""
+
+    def test_snapshots_are_served_and_refreshed_in_background(self):
+        """Test stale snapshots are served while a refresh runs."""
+        cache = CatalogCache(refresh_after=60, max_age=3600)
+        fetch = Mock(side_effect=[["a"], ["b"]])
+
+        assert cache.get("flavors", list[str], fetch) == ["a"]
+        assert cache.get("flavors", list[str], fetch) == ["a"]
+        with patch(
+            "openstack_mcp_server.tools.cache.time.time",
+            return_value=time.time() + 61,
+        ):
+            assert cache.get("flavors", list[str], fetch) == ["a"]
+            for thread in threading.enumerate():
+                if thread.name == "openstack-mcp-catalog-refresh":
+                    thread.join()
+
+        assert cache.get("flavors", list[str], fetch) == ["b"]
+        assert fetch.call_count == 2
+
+    def test_expired_snapshots_are_fetched_again(self):
+        """Test snapshots older than the max age are not served."""
+        cache = CatalogCache(refresh_after=60, max_age=3600)
+        fetch = Mock(side_effect=[["a"], ["b"]])
+
+        cache.get("regions", list[str], fetch)
+        with patch(
+            "openstack_mcp_server.tools.cache.time.time",
+            return_value=time.time() + 3601,
+        ):
+            assert cache.get("regions", list[str], fetch) == ["b"]
+
+    def test_snapshots_are_keyed_by_cloud(self):
+        """Test every cloud and region has its own snapshot."""
+        cache = CatalogCache(refresh_after=60, max_age=3600)
+
+        with cloud_selection("other", "r1"):
+            cache.get("regions", list[str], lambda: ["r1"])
+        cache.get("regions", list[str], lambda: ["default"])
+
+        with cloud_selection("other", "r1"):
+            assert cache.get("regions", list[str], Mock()) == ["r1"]
+
+    def test_snapshots_survive_restarts(self, tmp_path):
+        """Test snapshots written to files are read by a new cache."""
+        flavors = [make_flavor("1"), make_flavor("2")]
+        CatalogCache(60, 3600, tmp_path).get(
+            "flavors",
+            list[Flavor],
+            lambda: flavors,
+        )
+
+        fetch = Mock()
+        restarted = CatalogCache(60, 3600, tmp_path)
+
+        assert restarted.get("flavors", list[Flavor], fetch) == flavors
+        fetch.assert_not_called()
+
+    def test_writes_invalidate_snapshots(self, tmp_path):
+        """Test write tools drop the snapshots of their resource type."""
+        cache = CatalogCache(60, 3600, tmp_path)
+        cache.get("domains", list[str], lambda: ["a"])
+
+        with patch("openstack_mcp_server.tools.cache.catalog_cache", cache):
+            invalidates("domains")(Mock())()
+
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get("domains", list[str], lambda: ["b"]) == ["b"]
+
+    def test_zero_max_age_disables_snapshots(self):
+        """Test every call is fetched when the cache is disabled."""
+        cache = CatalogCache(refresh_after=60, max_age=0)
+        fetch = Mock(return_value=["a"])
+
+        cache.get("images", list[str], fetch)
+        cache.get("images", list[str], fetch)
+
+        assert fetch.call_count == 2
@@ -1,10 +1,19 @@
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 
-from openstack.exceptions import ConflictException, NotFoundException
-
-from openstack_mcp_server.tools.compute_tools import ComputeTools
+from openstack.compute.v2 import server
+from openstack.exceptions import (
+    ConflictException,
+    HttpException,
+    NotFoundException,
+)
+
+from openstack_mcp_server.tools.compute_tools import (
+    ComputeTools,
+    ServerActionEnum,
+)
+from openstack_mcp_server.tools.freshness import FreshnessEnum
 from openstack_mcp_server.tools.response.compute import Flavor, Server
 
 
@@ -133,6 +142,145 @@ class TestComputeTools:
 
         mock_conn.compute.servers.assert_called_once()
 
+    def test_get_servers_with_filters(self, mock_get_openstack_conn):
+        """Test server filters are passed through to Nova."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = []
+
+        compute_tools = ComputeTools()
+        compute_tools.get_servers(
+            status="active",
+            name="^web-",
+            host="compute-1",
+            flavor="flavor-1",
+            image="image-1",
+            changes_since="2025-01-01T00:00:00Z",
+        )
+
+        mock_conn.compute.servers.assert_called_once_with(
+            status="ACTIVE",
+            name="^web-",
+            compute_host="compute-1",
+            flavor="flavor-1",
+            image="image-1",
+            changes_since="2025-01-01T00:00:00Z",
+        )
+
+    def test_get_servers_page_with_next_token(self, mock_get_openstack_conn):
+        """Test a full page returns a token for the next page."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = iter(
+            [{"id": f"server-{i}", "name": f"vm-{i}"} for i in range(3)],
+        )
+
+        compute_tools = ComputeTools()
+        page = compute_tools.get_servers_page(limit=2, status="active")
+
+        assert [server.id for server in page.servers] == [
+            "server-0",
+            "server-1",
+        ]
+        assert page.next_cursor is not None
+        mock_conn.compute.servers.assert_called_once_with(
+            status="ACTIVE",
+            limit=3,
+        )
+
+        mock_conn.compute.servers.return_value = iter(
+            [{"id": "server-2", "name": "vm-2"}],
+        )
+        next_page = compute_tools.get_servers_page(
+            limit=2,
+            cursor=page.next_cursor,
+        )
+
+        assert [server.id for server in next_page.servers] == ["server-2"]
+        assert next_page.next_cursor is None
+        mock_conn.compute.servers.assert_called_with(
+            status="ACTIVE",
+            limit=3,
+            marker="server-1",
+        )
+
+    def test_get_servers_page_stops_reading(self, mock_get_openstack_conn):
+        """Test paging does not consume more servers than needed."""
+        mock_conn = mock_get_openstack_conn
+        servers = iter(
+            [{"id": f"server-{i}", "name": f"vm-{i}"} for i in range(10)],
+        )
+        mock_conn.compute.servers.return_value = servers
+
+        compute_tools = ComputeTools()
+        compute_tools.get_servers_page(limit=2)
+
+        assert len(list(servers)) == 7
+
+    def test_get_servers_page_invalid_arguments(self, mock_get_openstack_conn):
+        """Test invalid limits and tokens are rejected."""
+        compute_tools = ComputeTools()
+
+        with pytest.raises(ValueError, match="limit"):
+            compute_tools.get_servers_page(limit=0)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            compute_tools.get_servers_page(cursor="not-a-token")
+
+    def test_get_servers_delta(self, mock_get_openstack_conn):
+        """Test only servers changed since the last sync are returned."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.side_effect = [
+            [
+                {
+                    "id": "s1",
+                    "name": "vm-1",
+                    "updated_at": "2025-01-01T00:00:00Z",
+                },
+                {
+                    "id": "s2",
+                    "name": "vm-2",
+                    "updated_at": "2025-01-02T00:00:00Z",
+                },
+            ],
+            [
+                {
+                    "id": "s2",
+                    "name": "vm-2",
+                    "updated_at": "2025-01-02T00:00:00Z",
+                },
+                {
+                    "id": "s1",
+                    "name": "vm-1",
+                    "status": "DELETED",
+                    "updated_at": "2025-01-03T00:00:00Z",
+                },
+                {
+                    "id": "s3",
+                    "name": "vm-3",
+                    "updated_at": "2025-01-03T00:00:00Z",
+                },
+                {
+                    "id": "s2",
+                    "name": "renamed",
+                    "updated_at": "2025-01-03T00:00:00Z",
+                },
+            ],
+        ]
+
+        compute_tools = ComputeTools()
+        first = compute_tools.get_servers_delta()
+        second = compute_tools.get_servers_delta()
+
+        assert first.full_sync is True
+        assert [s.id for s in first.created] == ["s1", "s2"]
+        assert second.full_sync is False
+        assert [s.id for s in second.created] == ["s3"]
+        assert [s.name for s in second.updated] == ["renamed"]
+        assert second.deleted == ["s1"]
+        assert second.since == "2025-01-03T00:00:00Z"
+        assert mock_conn.compute.servers.call_args_list == [
+            call(),
+            call(changes_since="2025-01-02T00:00:00Z"),
+        ]
+
     def test_get_server_success(self, mock_get_openstack_conn):
         """Test getting a specific server successfully."""
         mock_conn = mock_get_openstack_conn
@@ -262,15 +410,19 @@ class TestComputeTools:
         mock_tool_decorator.assert_has_calls(
             [
                 call(compute_tools.get_servers),
+                call(compute_tools.get_servers_page),
+                call(compute_tools.get_servers_delta),
                 call(compute_tools.get_server),
                 call(compute_tools.create_server),
+                call(compute_tools.create_servers),
                 call(compute_tools.get_flavors),
                 call(compute_tools.action_server),
+                call(compute_tools.action_servers),
                 call(compute_tools.update_server),
                 call(compute_tools.delete_server),
             ],
         )
-        assert mock_tool_decorator.call_count == 7
+        assert mock_tool_decorator.call_count == 11
 
     def test_compute_tools_instantiation(self):
         """Test ComputeTools can be instantiated."""
@@ -435,6 +587,409 @@ class TestComputeTools:
 
         mock_conn.compute.start_server.assert_called_once_with(server_id)
 
+    def test_action_servers_by_ids(self, mock_get_openstack_conn):
+        """Test an action is applied to every server with a summary."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.stop_server.side_effect = [
+            None,
+            ConflictException("Cannot stop while in state shutoff"),
+            None,
+        ]
+
+        compute_tools = ComputeTools()
+        result = compute_tools.action_servers(
+            ServerActionEnum.STOP,
+            ids=["s1", "s2", "s3"],
+            max_concurrency=1,
+        )
+
+        assert result.action == "stop"
+        assert (result.total, result.succeeded, result.failed) == (3, 2, 1)
+        assert [r.success for r in result.results] == [True, False, True]
+        assert "shutoff" in result.results[1].error
+        mock_conn.compute.servers.assert_not_called()
+
+    def test_action_servers_by_filter_and_wait(
+        self,
+        mock_get_openstack_conn,
+    ):
+        """Test filtered servers are shelved and waited for."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = [
+            {"id": "s1", "status": "SHELVED"},
+        ]
+        mock_conn.compute.get_server.return_value = {
+            "id": "s1",
+            "status": "SHELVED_OFFLOADED",
+        }
+
+        compute_tools = ComputeTools()
+        with patch(
+            "openstack_mcp_server.tools.waiter.get_openstack_conn",
+            return_value=mock_conn,
+        ):
+            result = compute_tools.action_servers(
+                ServerActionEnum.SHELVE,
+                name_prefix="web.",
+                tag="maint",
+                wait=True,
+            )
+
+        assert result.results[0].status == "SHELVED_OFFLOADED"
+        assert result.succeeded == 1
+        # The selection query, then one get per poll for the wait.
+        mock_conn.compute.servers.assert_called_once_with(
+            name="^web\\.",
+            tags="maint",
+        )
+        mock_conn.compute.shelve_server.assert_called_once_with("s1")
+        mock_conn.compute.get_server.assert_called_once_with("s1")
+
+    def test_create_servers_single_request(self, mock_get_openstack_conn):
+        """Test identical servers take one create and one list call."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.post.return_value = Mock(
+            status_code=202,
+            json=Mock(return_value={"reservation_id": "r-1"}),
+        )
+        mock_conn.compute.servers.return_value = [
+            {"id": f"s{i}", "name": f"web-{i}", "status": "BUILD"}
+            for i in range(1, 4)
+        ]
+
+        compute_tools = ComputeTools()
+        result = compute_tools.create_servers(
+            name="web",
+            image="img",
+            flavor=1,
+            network="net",
+            count=3,
+            min_count=2,
+        )
+
+        assert result.reservation_id == "r-1"
+        assert [s.name for s in result.servers] == ["web-1", "web-2", "web-3"]
+        assert result.errors == []
+        mock_conn.compute.post.assert_called_once_with(
+            "/servers",
+            json={
+                "server": {
+                    "name": "web",
+                    "flavorRef": 1,
+                    "imageRef": "img",
+                    "networks": [{"uuid": "net"}],
+                    "min_count": 2,
+                    "max_count": 3,
+                    "return_reservation_id": True,
+                },
+            },
+        )
+        mock_conn.compute.servers.assert_called_once_with(
+            reservation_id="r-1",
+        )
+        mock_conn.compute.create_server.assert_not_called()
+        mock_conn.compute.get_server.assert_not_called()
+
+    def test_create_servers_wait_releases_connection(
+        self,
+        mock_get_openstack_conn,
+    ):
+        """Test the reservation's servers are awaited without a lease."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.post.return_value = Mock(
+            status_code=202,
+            json=Mock(return_value={"reservation_id": "r-1"}),
+        )
+        mock_conn.compute.servers.return_value = [
+            {"id": "s1", "name": "web-1", "status": "BUILD"},
+        ]
+
+        calls = Mock()
+        calls.status_waiter.wait.return_value = {}
+        compute_tools = ComputeTools()
+        with (
+            patch(
+                "openstack_mcp_server.tools.compute_tools.release_openstack_conn",
+                calls.release_openstack_conn,
+            ),
+            patch(
+                "openstack_mcp_server.tools.compute_tools.status_waiter",
+                calls.status_waiter,
+            ),
+        ):
+            compute_tools.create_servers(
+                name="web",
+                image="img",
+                flavor=1,
+                network="net",
+                wait=True,
+            )
+
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "release_openstack_conn",
+            "status_waiter.wait",
+        ]
+
+    def test_create_servers_invalid_count(self, mock_get_openstack_conn):
+        """Test min_count above count is refused."""
+        compute_tools = ComputeTools()
+
+        with pytest.raises(ValueError, match="min_count"):
+            compute_tools.create_servers(
+                name="web",
+                image="img",
+                flavor=1,
+                network="net",
+                count=2,
+                min_count=3,
+            )
+
+    def test_create_servers_by_names(self, mock_get_openstack_conn):
+        """Test named servers are created concurrently and waited for."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.side_effect = [
+            Mock(id="s1"),
+            ConflictException("Quota exceeded"),
+            Mock(id="s3"),
+        ]
+        servers = {
+            "s1": {"id": "s1", "name": "db.1", "status": "ACTIVE"},
+            "s3": {"id": "s3", "name": "db.3", "status": "ERROR"},
+        }
+        mock_conn.compute.get_server.side_effect = servers.get
+
+        compute_tools = ComputeTools()
+        with (
+            patch(
+                "openstack_mcp_server.tools.waiter.get_openstack_conn",
+                return_value=mock_conn,
+            ),
+            patch("openstack_mcp_server.tools.retry.time.sleep"),
+            patch(
+                "openstack_mcp_server.config.MCP_RETRY_ATTEMPTS",
+                1,
+            ),
+        ):
+            result = compute_tools.create_servers(
+                name="db",
+                image="img",
+                flavor=1,
+                network="net",
+                names=["db.1", "db.2", "db.3"],
+                max_concurrency=1,
+                wait=True,
+            )
+
+        assert [s.id for s in result.servers] == ["s1"]
+        assert [(e.index, e.id) for e in result.errors] == [
+            (1, None),
+            (2, "s3"),
+        ]
+        assert "went to ERROR" in result.errors[1].error
+        # The wait polls also provide the server details.
+        assert mock_conn.compute.get_server.call_count == 2
+        mock_conn.compute.servers.assert_not_called()
+
+    def test_create_servers_by_names_unavailable_not_retried(
+        self,
+        mock_get_openstack_conn,
+    ):
+        """Test a create failing with 503 is not sent again."""
+        mock_conn = mock_get_openstack_conn
+        unavailable = HttpException("Service Unavailable")
+        unavailable.status_code = 503
+        mock_conn.compute.create_server.side_effect = unavailable
+
+        compute_tools = ComputeTools()
+        with patch("openstack_mcp_server.tools.retry.time.sleep"):
+            result = compute_tools.create_servers(
+                name="db",
+                image="img",
+                flavor=1,
+                network="net",
+                names=["db.1"],
+            )
+
+        # Nova may have booted the server before failing the request.
+        mock_conn.compute.create_server.assert_called_once()
+        assert [e.index for e in result.errors] == [0]
+
+    def test_create_servers_by_names_listed_once(
+        self,
+        mock_get_openstack_conn,
+    ):
+        """Test named servers are fetched with one listing by name."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.side_effect = [
+            Mock(id="s1"),
+            Mock(id="s2"),
+        ]
+        mock_conn.compute.servers.return_value = [
+            {"id": "s1", "name": "db.1", "status": "BUILD"},
+            {"id": "s2", "name": "db.2", "status": "BUILD"},
+            {"id": "other", "name": "db.1", "status": "ACTIVE"},
+        ]
+
+        compute_tools = ComputeTools()
+        result = compute_tools.create_servers(
+            name="db",
+            image="img",
+            flavor=1,
+            network="net",
+            names=["db.1", "db.2"],
+        )
+
+        assert [s.id for s in result.servers] == ["s1", "s2"]
+        mock_conn.compute.servers.assert_called_once_with(
+            name="^(db\\.1|db\\.2)$",
+        )
+
+    def test_create_servers_minimal(self, mock_get_openstack_conn):
+        """Test the listing is skipped with minimal freshness."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.post.return_value = Mock(
+            status_code=202,
+            json=Mock(return_value={"reservation_id": "r-1"}),
+        )
+
+        compute_tools = ComputeTools()
+        result = compute_tools.create_servers(
+            name="web",
+            image="img",
+            flavor=1,
+            network="net",
+            count=100,
+            freshness=FreshnessEnum.MINIMAL,
+        )
+
+        assert result.reservation_id == "r-1"
+        assert result.servers == []
+        mock_conn.compute.servers.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "freshness",
+        [FreshnessEnum.MINIMAL, FreshnessEnum.CACHED],
+    )
+    def test_create_server_without_refetch(
+        self,
+        mock_get_openstack_conn,
+        freshness,
+    ):
+        """Test the created server is not fetched again."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.return_value = server.Server(
+            id="s1",
+            name="web",
+        )
+
+        compute_tools = ComputeTools()
+        result = compute_tools.create_server(
+            name="web",
+            image="img",
+            flavor=1,
+            network="net",
+            freshness=freshness,
+        )
+
+        assert result == Server(id="s1", name="web")
+        mock_conn.compute.get_server.assert_not_called()
+
+    def test_create_server_freshness_setting(self, mock_get_openstack_conn):
+        """Test the freshness mode defaults to the configured one."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.return_value = server.Server(
+            id="s1",
+            name="web",
+        )
+
+        compute_tools = ComputeTools()
+        with patch(
+            "openstack_mcp_server.config.MCP_RESPONSE_FRESHNESS",
+            "minimal",
+        ):
+            compute_tools.create_server(
+                name="web",
+                image="img",
+                flavor=1,
+                network="net",
+            )
+
+        mock_conn.compute.get_server.assert_not_called()
+
+    def test_create_server_wait(self, mock_get_openstack_conn):
+        """Test a created server is returned once ACTIVE."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.return_value = Mock(id="s1")
+        mock_conn.compute.get_server.return_value = {
+            "id": "s1",
+            "name": "web",
+            "status": "ACTIVE",
+        }
+
+        compute_tools = ComputeTools()
+        with patch(
+            "openstack_mcp_server.tools.waiter.get_openstack_conn",
+            return_value=mock_conn,
+        ):
+            result = compute_tools.create_server(
+                name="web",
+                image="img",
+                flavor=1,
+                network="net",
+                wait=True,
+            )
+
+        assert result.status == "ACTIVE"
+        # The server polled by the wait is returned, not fetched again.
+        mock_conn.compute.get_server.assert_called_once_with("s1")
+
+    def test_create_server_wait_releases_connection(
+        self,
+        mock_get_openstack_conn,
+    ):
+        """Test the connection is back in the pool before waiting."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.return_value = Mock(id="s1")
+
+        calls = Mock()
+        calls.wait_for_status.return_value = {
+            "id": "s1",
+            "name": "web",
+            "status": "ACTIVE",
+        }
+        compute_tools = ComputeTools()
+        with (
+            patch(
+                "openstack_mcp_server.tools.compute_tools.release_openstack_conn",
+                calls.release_openstack_conn,
+            ),
+            patch(
+                "openstack_mcp_server.tools.compute_tools.wait_for_status",
+                calls.wait_for_status,
+            ),
+        ):
+            compute_tools.create_server(
+                name="web",
+                image="img",
+                flavor=1,
+                network="net",
+                wait=True,
+            )
+
+        # The poller leases from the same pool, so holding the connection
+        # while waiting could block it.
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "release_openstack_conn",
+            "wait_for_status",
+        ]
+
+    def test_action_servers_requires_selection(self, mock_get_openstack_conn):
+        """Test acting on every server without a filter is refused."""
+        compute_tools = ComputeTools()
+
+        with pytest.raises(ValueError, match="at least one filter"):
+            compute_tools.action_servers(ServerActionEnum.STOP)
+
     def test_update_server_success(self, mock_get_openstack_conn):
         """Test updating a server successfully with all parameters."""
         mock_conn = mock_get_openstack_conn
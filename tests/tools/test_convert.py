@@ -0,0 +1,64 @@
+from openstack.compute.v2 import flavor, server
+
+from openstack_mcp_server.tools.convert import ModelConverter
+from openstack_mcp_server.tools.response.compute import Flavor, Server
+from openstack_mcp_server.tools.response.image import Image
+
+
+SERVER_BODY = {
+    "id": "s1",
+    "name": "web",
+    "status": "ACTIVE",
+    "flavor": {"original_name": "m1.small", "vcpus": 1},
+    "image": {"id": "img-1"},
+    "addresses": {
+        "net": [
+            {"addr": "10.0.0.5", "version": 4, "OS-EXT-IPS:type": "fixed"},
+        ],
+    },
+    "key_name": "key",
+    "security_groups": [{"name": "default"}],
+}
+
+
+class TestModelConverter:
+    """Test cases for the SDK resource to response model converter."""
+
+    def test_server_matches_keyword_conversion(self):
+        """Test a converted server equals Server(**resource)."""
+        resource = server.Server.existing(**SERVER_BODY)
+
+        converted = ModelConverter(Server)(resource)
+
+        assert converted == Server(**resource)
+        assert converted.flavor.name == "m1.small"
+        assert converted.addresses["net"][0].type == "fixed"
+
+    def test_sdk_defaults(self):
+        """Test attributes defaulted by the SDK are converted."""
+        resource = flavor.Flavor.existing(
+            id="f1",
+            name="m1.small",
+            vcpus=1,
+            ram=512,
+            disk=1,
+        )
+
+        converted = ModelConverter(Flavor)(resource)
+
+        assert converted == Flavor(**resource)
+        assert converted.is_public is True
+
+    def test_aliases(self):
+        """Test keys matching a field alias are converted."""
+        converted = ModelConverter(Image)(
+            {"id": "i1", "schema": "/v2/schemas/image"},
+        )
+
+        assert converted.schema_ == "/v2/schemas/image"
+
+    def test_convert_all_dicts(self):
+        """Test plain dicts are converted like resources."""
+        converter = ModelConverter(Server)
+
+        assert converter.convert_all([SERVER_BODY]) == [Server(**SERVER_BODY)]
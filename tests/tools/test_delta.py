@@ -0,0 +1,89 @@
+import asyncio
+
+from fastmcp import Client, FastMCP
+
+from openstack_mcp_server.tools.base import cloud_selection
+from openstack_mcp_server.tools.compute_tools import ComputeTools
+from openstack_mcp_server.tools.delta import (
+    Snapshot,
+    SnapshotStore,
+    latest_timestamp,
+)
+from openstack_mcp_server.tools.executor import ToolExecutor, ToolRegistrar
+from openstack_mcp_server.tools.response.network import Port
+
+
+class TestSnapshot:
+    """Test cases for the delta sync snapshots."""
+
+    def test_apply_reports_changes(self):
+        """Test created, updated and deleted items are detected."""
+        snapshot = Snapshot()
+        snapshot.apply({"a": Port(id="a"), "b": Port(id="b")})
+
+        created, updated, deleted = snapshot.apply(
+            {"a": Port(id="a"), "b": Port(id="b", name="new")},
+            deleted=["c"],
+        )
+
+        assert created == []
+        assert updated == [Port(id="b", name="new")]
+        assert deleted == []
+
+    def test_complete_listing_detects_deletions(self):
+        """Test items missing from a full listing are deleted."""
+        snapshot = Snapshot()
+        snapshot.apply({"a": Port(id="a"), "b": Port(id="b")})
+
+        _, _, deleted = snapshot.apply({"a": Port(id="a")}, complete=True)
+
+        assert deleted == ["b"]
+        assert list(snapshot.items) == ["a"]
+
+    def test_store_is_keyed_by_cloud(self):
+        """Test each cloud has its own snapshot."""
+        store = SnapshotStore()
+
+        default = store.get("servers")
+        with cloud_selection("other"):
+            other = store.get("servers")
+
+        assert default is not other
+        assert store.get("servers") is default
+
+    def test_client_sessions_sync_independently(
+        self,
+        mock_get_openstack_conn,
+    ):
+        """Test a session does not consume the changes of another one."""
+        mock_get_openstack_conn.compute.servers.return_value = [
+            {"id": "s1", "name": "vm", "updated_at": "2025-01-01T00:00:00Z"},
+        ]
+        mcp = FastMCP("test")
+        ComputeTools().register_tools(ToolRegistrar(mcp))
+
+        async def sync(calls: int) -> list:
+            async with Client(mcp) as client:
+                return [
+                    (await client.call_tool("get_servers_delta", {})).data
+                    for _ in range(calls)
+                ]
+
+        try:
+            first = asyncio.run(sync(2))
+            other = asyncio.run(sync(1))
+        finally:
+            ToolExecutor.shutdown()
+
+        assert [d.full_sync for d in first] == [True, False]
+        assert [len(d.created) for d in first] == [1, 0]
+        assert other[0].full_sync is True
+        assert len(other[0].created) == 1
+
+    def test_latest_timestamp(self):
+        """Test the most recent timestamp is kept."""
+        assert latest_timestamp(["2025-01-02", None, "2025-01-01"]) == (
+            "2025-01-02"
+        )
+        assert latest_timestamp([], "2025-01-01") == "2025-01-01"
+        assert latest_timestamp([]) is None
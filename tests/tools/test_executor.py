@@ -0,0 +1,196 @@
+import asyncio
+import inspect
+import threading
+import time
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from fastmcp import Client, FastMCP
+
+from openstack_mcp_server.tools.base import (
+    OpenStackConnectionManager,
+    cloud_selection,
+)
+from openstack_mcp_server.tools.executor import (
+    ToolExecutor,
+    ToolRegistrar,
+    fan_out,
+    run_in_worker,
+    to_async_tool,
+)
+
+
+class TestToolExecutor:
+    """Test cases for the async tool execution layer."""
+
+    def teardown_method(self):
+        ToolExecutor.shutdown()
+
+    def test_run_in_worker_uses_worker_thread(self):
+        """Test blocking calls are dispatched off the event loop thread."""
+        loop_thread = threading.current_thread().name
+
+        result = asyncio.run(
+            run_in_worker(lambda: threading.current_thread().name),
+        )
+
+        assert result != loop_thread
+        assert result.startswith("openstack-mcp-worker")
+
+    def test_run_in_worker_propagates_exception(self):
+        """Test exceptions raised in the worker reach the caller."""
+
+        def failing():
+            raise ValueError("boom")
+
+        async def call():
+            try:
+                await run_in_worker(failing)
+            except ValueError as e:
+                return str(e)
+
+        assert asyncio.run(call()) == "boom"
+
+    def test_run_in_worker_releases_connection(self):
+        """Test the leased OpenStack connection is released after a call."""
+        with patch(
+            "openstack_mcp_server.tools.executor.release_openstack_conn",
+        ) as mock_release:
+            asyncio.run(run_in_worker(lambda: None))
+
+        mock_release.assert_called_once_with()
+
+    def test_to_async_tool_preserves_metadata(self):
+        """Test wrapped tools keep name, docstring and signature."""
+
+        def get_things(name: str, limit: int | None = None) -> list[str]:
+            """Get things."""
+            return [name] * (limit or 1)
+
+        wrapped = to_async_tool(get_things)
+
+        assert inspect.iscoroutinefunction(wrapped)
+        assert wrapped.__name__ == "get_things"
+        assert wrapped.__doc__ == "Get things."
+        assert list(inspect.signature(wrapped).parameters) == [
+            "name",
+            "limit",
+            "cloud",
+            "region",
+        ]
+        assert asyncio.run(wrapped("a", limit=2)) == ["a", "a"]
+
+    def test_to_async_tool_selects_cloud(self):
+        """Test the cloud and region arguments select the connection."""
+
+        def get_cloud() -> tuple[str, str | None]:
+            """Get the resolved cloud."""
+            return OpenStackConnectionManager.resolve()
+
+        wrapped = to_async_tool(get_cloud)
+
+        assert asyncio.run(wrapped()) == ("openstack", None)
+        assert asyncio.run(wrapped(cloud="other", region="r1")) == (
+            "other",
+            "r1",
+        )
+        assert OpenStackConnectionManager.resolve() == ("openstack", None)
+
+    def test_to_async_tool_rejects_cloud_parameter(self):
+        """Test tools already taking a cloud parameter are rejected."""
+
+        def get_things(cloud: str) -> list[str]:
+            """Get things."""
+            return [cloud]
+
+        with pytest.raises(ValueError, match="cloud"):
+            to_async_tool(get_things)
+
+    def test_registrar_wraps_tools(self):
+        """Test the registrar hands async wrappers to FastMCP."""
+        mock_mcp = Mock()
+        mock_tool_decorator = Mock()
+        mock_mcp.tool.return_value = mock_tool_decorator
+
+        def get_things() -> list[str]:
+            """Get things."""
+            return []
+
+        ToolRegistrar(mock_mcp).tool()(get_things)
+
+        mock_mcp.tool.assert_called_once_with()
+        registered = mock_tool_decorator.call_args[0][0]
+        assert inspect.iscoroutinefunction(registered)
+        assert registered.__wrapped__ is get_things
+
+    def test_concurrent_tool_calls_do_not_block(self):
+        """Test slow tools run concurrently through FastMCP."""
+        mcp = FastMCP("test")
+
+        def slow_tool(delay: float) -> float:
+            """Sleep for the given delay."""
+            time.sleep(delay)
+            return delay
+
+        ToolRegistrar(mcp).tool()(slow_tool)
+
+        async def call_many():
+            async with Client(mcp) as client:
+                start = time.perf_counter()
+                await asyncio.gather(
+                    *[
+                        client.call_tool(
+                            "slow_tool",
+                            {"delay": 0.2, "cloud": "openstack"},
+                        )
+                        for _ in range(4)
+                    ],
+                )
+                return time.perf_counter() - start
+
+        assert asyncio.run(call_many()) < 0.6
+
+
+class TestFanOut:
+    """Test cases for the concurrent fan-out helper."""
+
+    def test_results_keep_item_order(self):
+        """Test results and errors are returned per item in order."""
+
+        def square(value: int) -> int:
+            if value == 2:
+                raise ValueError("boom")
+            time.sleep(0.01 * (4 - value))
+            return value * value
+
+        results = fan_out(square, range(4), max_concurrency=4)
+
+        assert [result for result, _ in results] == [0, 1, None, 9]
+        assert isinstance(results[2][1], ValueError)
+
+    def test_calls_run_concurrently(self):
+        """Test calls overlap up to the concurrency limit."""
+        start = time.perf_counter()
+        fan_out(lambda _: time.sleep(0.2), range(4), max_concurrency=4)
+
+        assert time.perf_counter() - start < 0.6
+
+    def test_context_is_copied_and_connections_released(self):
+        """Test workers see the cloud selection and release leases."""
+        with (
+            patch(
+                "openstack_mcp_server.tools.executor.release_openstack_conn",
+            ) as mock_release,
+            cloud_selection("other", "RegionTwo"),
+        ):
+            results = fan_out(
+                lambda _: OpenStackConnectionManager.resolve(),
+                range(3),
+            )
+
+        assert [result for result, _ in results] == [
+            ("other", "RegionTwo"),
+        ] * 3
+        assert mock_release.call_count == 3
@@ -0,0 +1,71 @@
+import threading
+
+from unittest.mock import Mock
+
+from openstack_mcp_server.tools.fip_pool import FloatingIPPool
+
+
+def make_ip(ip_id: str, port_id: str | None = None) -> Mock:
+    """Build an OpenStack floating IP object."""
+    ip = Mock()
+    ip.id = ip_id
+    ip.port_id = port_id
+    ip.revision_number = 1
+    ip.floating_network_id = "ext-net"
+    return ip
+
+
+class TestFloatingIPPool:
+    """Test cases for the free floating IP index."""
+
+    def test_claims_are_unique_and_listed_once(self):
+        """Test concurrent claims get distinct IPs from one listing."""
+        conn = Mock()
+        conn.network.ips.return_value = [
+            make_ip(f"fip-{i}") for i in range(20)
+        ] + [make_ip("used", port_id="port-1")]
+        pool = FloatingIPPool()
+        claims = []
+
+        def claim():
+            claims.append(pool.claim(conn, "ext-net"))
+
+        threads = [threading.Thread(target=claim) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({ip_id for ip_id, _ in claims}) == 20
+        conn.network.ips.assert_called_once_with(floating_network_id="ext-net")
+
+    def test_empty_network_returns_none(self):
+        """Test None is returned when no floating IP is free."""
+        conn = Mock()
+        conn.network.ips.return_value = [make_ip("used", port_id="port-1")]
+
+        assert FloatingIPPool().claim(conn, "ext-net") is None
+
+    def test_release_and_observe_update_index(self):
+        """Test released and detached IPs can be claimed again."""
+        conn = Mock()
+        conn.network.ips.return_value = [make_ip("fip-1")]
+        pool = FloatingIPPool()
+
+        claim = pool.claim(conn, "ext-net")
+        pool.release("ext-net", *claim)
+        assert pool.claim(conn, "ext-net") == ("fip-1", 1)
+
+        pool.forget("fip-1")
+        pool.observe(make_ip("fip-2"))
+        assert pool.claim(conn, "ext-net") == ("fip-2", 1)
+        assert conn.network.ips.call_count == 1
+
+    def test_claimed_ips_are_not_listed_again(self):
+        """Test a refresh does not return IPs claimed in flight."""
+        conn = Mock()
+        conn.network.ips.return_value = [make_ip("fip-1")]
+        pool = FloatingIPPool()
+
+        assert pool.claim(conn, "ext-net") == ("fip-1", 1)
+        assert pool.claim(conn, "ext-net") is None
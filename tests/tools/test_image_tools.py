@@ -2,6 +2,9 @@ import uuid
 
 from unittest.mock import Mock
 
+from openstack.image.v2 import image
+
+from openstack_mcp_server.tools.freshness import FreshnessEnum
 from openstack_mcp_server.tools.image_tools import ImageTools
 from openstack_mcp_server.tools.request.image import CreateImage
 from openstack_mcp_server.tools.response.image import Image
@@ -93,6 +96,26 @@ class TestImageTools:
 
         mock_conn.image.images.assert_called_once()
 
+    def test_get_image_images_current_status(
+        self,
+        mock_get_openstack_conn_image,
+    ):
+        """Test image statuses are listed again on every call."""
+        mock_conn = mock_get_openstack_conn_image
+        mock_image = Mock()
+        mock_image.name = "ubuntu"
+        mock_image.id = "img-1"
+        mock_image.status = "queued"
+        mock_conn.image.images.return_value = [mock_image]
+
+        image_tools = ImageTools()
+        image_tools.get_image_images()
+        mock_image.status = "active"
+        result = image_tools.get_image_images()
+
+        assert result == "ubuntu (img-1) - Status: active"
+        assert mock_conn.image.images.call_count == 2
+
     def test_get_image_images_with_empty_name(
         self,
         mock_get_openstack_conn_image,
@@ -230,3 +253,56 @@ class TestImageTools:
         assert mock_get_openstack_conn_image.get_image.called_once_with(
             mock_image["id"],
         )
+
+    def test_create_image_minimal_freshness(
+        self,
+        mock_get_openstack_conn_image,
+    ):
+        """Test the created image is returned without fetching it again."""
+        mock_image = self.image_factory(status="queued")
+        mock_get_openstack_conn_image.image.create_image.return_value = (
+            mock_image
+        )
+        create_image_data = CreateImage(
+            name=mock_image["name"],
+            import_options=CreateImage.ImportOptions(
+                import_method="web-download",
+                uri="https://example.com/image.qcow2",
+            ),
+        )
+
+        image_tools = ImageTools()
+        created_image = image_tools.create_image(
+            create_image_data,
+            freshness=FreshnessEnum.MINIMAL,
+        )
+
+        assert created_image == Image(**mock_image)
+        mock_get_openstack_conn_image.get_image.assert_not_called()
+
+    def test_create_image_wait(
+        self,
+        mock_get_openstack_conn_image,
+        mock_get_openstack_conn_waiter,
+    ):
+        """Test the created image is returned once active."""
+        mock_image = self.image_factory(status="active")
+        mock_get_openstack_conn_image.image.create_image.return_value = Mock(
+            id=mock_image["id"],
+        )
+        mock_get_openstack_conn_waiter.image.images.return_value = [
+            image.Image(**mock_image),
+        ]
+        create_image_data = CreateImage(
+            name=mock_image["name"],
+            import_options=CreateImage.ImportOptions(
+                import_method="web-download",
+                uri="https://example.com/image.qcow2",
+            ),
+        )
+
+        image_tools = ImageTools()
+        created_image = image_tools.create_image(create_image_data, wait=True)
+
+        assert created_image.status == "active"
+        mock_get_openstack_conn_image.get_image.assert_not_called()
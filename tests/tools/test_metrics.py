@@ -0,0 +1,145 @@
+import asyncio
+import datetime
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from fastmcp import Client, FastMCP
+from starlette.testclient import TestClient
+
+from openstack_mcp_server.tools import metrics
+from openstack_mcp_server.tools.executor import ToolRegistrar
+from openstack_mcp_server.tools.metrics import (
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+    register_metrics,
+    track_upstream_requests,
+)
+
+
+def make_response(method: str = "GET", status: int = 200) -> Mock:
+    """Build a requests response as seen by a response hook."""
+    response = Mock()
+    response.request.method = method
+    response.status_code = status
+    response.elapsed = datetime.timedelta(milliseconds=20)
+    return response
+
+
+@pytest.fixture
+def registry():
+    """Replace the global metrics registry by an empty one."""
+    registry = MetricsRegistry()
+    with patch.object(metrics, "metrics_registry", registry):
+        yield registry
+
+
+class TestMetrics:
+    """Test cases for the tool call metrics."""
+
+    def test_histogram_quantiles(self):
+        """Test quantiles are estimated from bucket bounds."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.75) == 1.0
+        assert histogram.quantile(0.99) == 1.0
+        assert Histogram((1.0,)).quantile(0.5) is None
+
+    def test_calls_and_upstream_requests_are_recorded(self, registry):
+        """Test upstream requests made on workers count for their tool."""
+        mcp = FastMCP("test")
+        mcp.add_middleware(MetricsMiddleware(registry))
+
+        def get_things() -> list[str]:
+            """Get things."""
+            metrics._on_response(make_response())
+            metrics._on_response(make_response("POST", 409))
+            return ["a", "b"]
+
+        def fail() -> str:
+            """Fail."""
+            raise RuntimeError("boom")
+
+        registrar = ToolRegistrar(mcp)
+        registrar.tool()(get_things)
+        registrar.tool()(fail)
+
+        async def call():
+            async with Client(mcp) as client:
+                await client.call_tool("get_things", {})
+                await client.call_tool("fail", {}, raise_on_error=False)
+
+        asyncio.run(call())
+        metrics._on_response(make_response())
+
+        by_tool = {m.tool: m for m in registry.snapshot().tools}
+        assert by_tool["get_things"].calls == 1
+        assert by_tool["get_things"].errors == 0
+        assert by_tool["get_things"].response_bytes > 0
+        assert by_tool["get_things"].upstream_requests == 2
+        assert by_tool["get_things"].upstream_errors == 1
+        assert by_tool["get_things"].upstream_ms_mean == pytest.approx(20)
+        assert by_tool["fail"].errors == 1
+        # Requests made outside of tool calls
+        assert by_tool[""].upstream_requests == 1
+
+    def test_prometheus_format(self):
+        """Test the exposition format of counters and histograms."""
+        registry = MetricsRegistry()
+        registry.record_call("get_servers", 0.2, 2048)
+        registry.record_upstream("get_servers", "GET", 200, 0.02)
+
+        page = registry.render_prometheus()
+
+        assert (
+            'openstack_mcp_tool_calls_total{tool="get_servers",status="ok"} 1'
+        ) in page
+        assert (
+            "openstack_mcp_tool_duration_seconds_bucket"
+            '{tool="get_servers",le="0.1"} 0'
+        ) in page
+        assert (
+            "openstack_mcp_tool_duration_seconds_bucket"
+            '{tool="get_servers",le="+Inf"} 1'
+        ) in page
+        assert (
+            "openstack_mcp_upstream_requests_total"
+            '{tool="get_servers",method="GET",status="200"} 1'
+        ) in page
+        assert "# TYPE openstack_mcp_tool_response_bytes histogram" in page
+
+    def test_track_upstream_requests_hooks_session_once(self):
+        """Test the response hook is installed on the requests session."""
+        mock_conn = Mock()
+        mock_conn.session.session = requests.Session()
+
+        track_upstream_requests(mock_conn)
+        track_upstream_requests(mock_conn)
+
+        assert mock_conn.session.session.hooks["response"] == [
+            metrics._on_response,
+        ]
+
+    def test_register_metrics_per_transport(self, registry):
+        """Test metrics are a tool on stdio and a route on HTTP."""
+        stdio = FastMCP("stdio")
+        register_metrics(stdio, "stdio")
+        assert "get_server_metrics" in asyncio.run(stdio.get_tools())
+
+        http = FastMCP("http")
+        register_metrics(http, "streamable-http")
+        assert "get_server_metrics" not in asyncio.run(http.get_tools())
+        registry.record_call("get_servers", 0.2, 10)
+
+        response = TestClient(http.http_app()).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'tool="get_servers"' in response.text
@@ -1,6 +1,15 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
-from openstack_mcp_server.tools.network_tools import NetworkTools
+from openstack.exceptions import (
+    NotFoundException,
+    PreconditionFailedException,
+)
+from openstack.network.v2 import floating_ip as network_floating_ip
+from openstack.network.v2 import port as network_port
+
+from openstack_mcp_server.tools.delta import snapshot_store
+from openstack_mcp_server.tools.freshness import FreshnessEnum
+from openstack_mcp_server.tools.network_tools import ListPlan, NetworkTools
 from openstack_mcp_server.tools.response.network import (
     FloatingIP,
     Network,
@@ -518,6 +527,80 @@ class TestNetworkTools:
             },
         )
 
+    def test_get_ports_with_fields(self, mock_openstack_connect_network):
+        """Test only the requested attributes are fetched and returned."""
+        mock_conn = mock_openstack_connect_network
+
+        # Attributes not requested from Neutron are None on SDK resources.
+        port = Mock()
+        for attr in Port.model_fields:
+            setattr(port, attr, None)
+        port.id = "port-1"
+        port.is_admin_state_up = True
+        port.security_group_ids = ["sg-1"]
+        mock_conn.list_ports.return_value = [port]
+
+        tools = self.get_network_tools()
+        result = tools.get_ports(
+            fields=["is_admin_state_up", "security_group_ids"],
+        )
+
+        assert [p.model_dump() for p in result] == [
+            {
+                "id": "port-1",
+                "is_admin_state_up": True,
+                "security_group_ids": ["sg-1"],
+            },
+        ]
+        mock_conn.list_ports.assert_called_once_with(
+            filters={"fields": ["id", "admin_state_up", "security_groups"]},
+        )
+
+    def test_get_ports_delta(self, mock_openstack_connect_network):
+        """Test only ports with a new revision are fetched."""
+        mock_conn = mock_openstack_connect_network
+
+        def make_port(port_id: str, revision: int, name: str) -> Mock:
+            port = Mock()
+            port.id = port_id
+            port.revision_number = revision
+            port.name = name
+            port.status = "ACTIVE"
+            port.description = None
+            port.project_id = "proj-1"
+            port.network_id = "net-1"
+            port.is_admin_state_up = True
+            port.device_id = None
+            port.device_owner = None
+            port.mac_address = None
+            port.fixed_ips = []
+            port.security_group_ids = []
+            return port
+
+        p1 = make_port("port-1", 1, "p1")
+        p2 = make_port("port-2", 1, "p2")
+        p2_renamed = make_port("port-2", 2, "renamed")
+        mock_conn.network.ports.side_effect = [
+            [p1, p2],
+            [p1, p2],
+            [p2_renamed],
+            [p2_renamed],
+        ]
+
+        tools = self.get_network_tools()
+        first = tools.get_ports_delta()
+        second = tools.get_ports_delta()
+
+        assert first.full_sync is True
+        assert [p.id for p in first.created] == ["port-1", "port-2"]
+        assert second.full_sync is False
+        assert second.created == []
+        assert [p.name for p in second.updated] == ["renamed"]
+        assert second.deleted == ["port-1"]
+        assert mock_conn.network.ports.call_args_list[3] == call(
+            id=["port-2"],
+        )
+
     def test_create_port_success(self, mock_openstack_connect_network):
         mock_conn = mock_openstack_connect_network
 
@@ -805,6 +888,35 @@ class TestNetworkTools:
         )
         assert res_toggle.is_admin_state_up is True
 
+    def test_update_port_unchanged_uses_known_state(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test a no-op update returns the synced copy of the port."""
+        mock_conn = mock_openstack_connect_network
+        port = Port(id="port-1", name="p1")
+        snapshot_store.get("ports").apply({"port-1": port})
+        mock_conn.network.get_port.return_value = network_port.Port(
+            id="port-2",
+            name="p2",
+            network_id="net-1",
+        )
+
+        tools = self.get_network_tools()
+        cached = tools.update_port("port-1", freshness=FreshnessEnum.CACHED)
+        binding = tools.set_port_binding(
+            "port-2",
+            freshness=FreshnessEnum.MINIMAL,
+        )
+        mock_conn.network.get_port.assert_called_once_with("port-2")
+        full = tools.update_port("port-1", freshness=FreshnessEnum.FULL)
+
+        assert cached is port
+        assert isinstance(binding, Port)
+        assert isinstance(full, Port)
+        assert mock_conn.network.get_port.call_count == 2
+        mock_conn.network.update_port.assert_not_called()
+
     def test_get_subnets_filters_and_has_gateway_true(
         self,
         mock_openstack_connect_network,
@@ -1194,6 +1306,70 @@ class TestNetworkTools:
             ),
         ]
 
+    def test_get_floating_ips_unassigned_any_status(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test unassigned IPs of any status are checked client-side."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.ips.return_value = [
+            network_floating_ip.FloatingIP(
+                id="fip-1",
+                status="ACTIVE",
+                floating_ip_address="203.0.113.10",
+            ),
+            network_floating_ip.FloatingIP(
+                id="fip-2",
+                status="DOWN",
+                floating_ip_address="203.0.113.11",
+                port_id="port-1",
+            ),
+        ]
+
+        tools = self.get_network_tools()
+        result = tools.get_floating_ips(
+            unassigned_only=True,
+            tags=["team-a"],
+            sort_key="floating_ip_address",
+            sort_dir="DESC",
+        )
+
+        assert [ip.id for ip in result] == ["fip-1"]
+        mock_conn.network.ips.assert_called_once_with(
+            tags=["team-a"],
+            sort_key="floating_ip_address",
+            sort_dir="desc",
+        )
+
+    def test_list_plan_explain(self):
+        """Test the plan reports what Neutron does and what is left."""
+        plan = (
+            ListPlan("subnets")
+            .where("network_id", "net-1")
+            .where("name", None)
+            .where("host_routes", [])
+            .where("dns_nameservers", ["10.0.0.2"])
+            .where_set("gateway_ip", True)
+        )
+        assert plan.explain() == {
+            "resource": "subnets",
+            "query": {"network_id": "net-1"},
+            "client_filters": [
+                "dns_nameservers == ['10.0.0.2']",
+                "gateway_ip is set",
+            ],
+        }
+
+        ports = (
+            ListPlan("ports")
+            .where("binding_host", "compute-1")
+            .select(["id", "status"])
+        )
+        assert ports.explain()["query"] == {
+            "fields": ["id", "status", "binding_host"],
+        }
+        assert ListPlan("subnets").select(["id"]).explain()["query"] == {}
+
     def test_create_attach_detach_delete_floating_ip(
         self,
         mock_openstack_connect_network,
@@ -1248,6 +1424,121 @@ class TestNetworkTools:
             ignore_missing=False,
         )
 
+    def make_floating_ip(self, ip_id: str) -> Mock:
+        """Build an OpenStack floating IP object."""
+        ip = Mock()
+        ip.id = ip_id
+        ip.name = None
+        ip.status = "DOWN"
+        ip.description = None
+        ip.project_id = None
+        ip.floating_ip_address = "203.0.113.30"
+        ip.floating_network_id = "ext-net"
+        ip.fixed_ip_address = None
+        ip.port_id = None
+        ip.router_id = None
+        return ip
+
+    def test_create_floating_ips_bulk_partial_success(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test failed creates are reported next to the created IPs."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.create_ip.side_effect = [
+            self.make_floating_ip("fip-1"),
+            NotFoundException("no such network"),
+            self.make_floating_ip("fip-3"),
+        ]
+
+        tools = self.get_network_tools()
+        result = tools.create_floating_ips_bulk(
+            "ext-net",
+            3,
+            max_concurrency=1,
+        )
+
+        assert [ip.id for ip in result.created] == ["fip-1", "fip-3"]
+        assert [e.index for e in result.errors] == [1]
+        assert "no such network" in result.errors[0].error
+        assert result.rolled_back is False
+        mock_conn.network.delete_ip.assert_not_called()
+
+    def test_assign_first_available_floating_ip_skips_taken(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test an IP taken by another client is skipped for the next."""
+        mock_conn = mock_openstack_connect_network
+        taken = self.make_floating_ip("fip-1")
+        taken.revision_number = 3
+        free = self.make_floating_ip("fip-2")
+        free.revision_number = 5
+        mock_conn.network.ips.return_value = [taken, free]
+        assigned = self.make_floating_ip("fip-2")
+        assigned.port_id = "port-9"
+        mock_conn.network.update_ip.side_effect = [
+            PreconditionFailedException(),
+            assigned,
+        ]
+
+        tools = self.get_network_tools()
+        result = tools.assign_first_available_floating_ip("ext-net", "port-9")
+
+        assert result.id == "fip-2"
+        assert mock_conn.network.update_ip.call_args_list == [
+            call("fip-1", if_revision=3, port_id="port-9"),
+            call("fip-2", if_revision=5, port_id="port-9"),
+        ]
+        mock_conn.network.create_ip.assert_not_called()
+
+    def test_assign_first_available_floating_ip_creates_when_empty(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test a floating IP is created on the port when none is free."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.ips.return_value = []
+        created = self.make_floating_ip("fip-new")
+        created.port_id = "port-9"
+        mock_conn.network.create_ip.return_value = created
+
+        tools = self.get_network_tools()
+        result = tools.assign_first_available_floating_ip("ext-net", "port-9")
+
+        assert result.port_id == "port-9"
+        mock_conn.network.create_ip.assert_called_once_with(
+            floating_network_id="ext-net",
+            port_id="port-9",
+        )
+        mock_conn.network.update_ip.assert_not_called()
+
+    def test_create_floating_ips_bulk_rollback(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test created IPs are deleted when rollback is requested."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.create_ip.side_effect = [
+            self.make_floating_ip("fip-1"),
+            NotFoundException("no such network"),
+        ]
+
+        tools = self.get_network_tools()
+        result = tools.create_floating_ips_bulk(
+            "ext-net",
+            2,
+            max_concurrency=1,
+            rollback_on_error=True,
+        )
+
+        assert result.created == []
+        assert result.rolled_back is True
+        mock_conn.network.delete_ip.assert_called_once_with(
+            "fip-1",
+            ignore_missing=True,
+        )
+
     def test_update_reassign_bulk_and_auto_assign_floating_ip(
         self,
         mock_openstack_connect_network,
@@ -1288,7 +1579,7 @@ class TestNetworkTools:
         f1.router_id = None
         mock_conn.network.create_ip.side_effect = [f1]
         bulk = tools.create_floating_ips_bulk("ext-net", 1)
-        assert len(bulk) == 1
+        assert len(bulk.created) == 1
 
         exists = Mock()
         exists.id = "fip-b"
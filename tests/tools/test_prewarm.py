@@ -0,0 +1,117 @@
+import asyncio
+import threading
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from fastmcp import Client, FastMCP
+
+from openstack_mcp_server.tools.compute_tools import ComputeTools
+from openstack_mcp_server.tools.executor import ToolExecutor, ToolRegistrar
+from openstack_mcp_server.tools.prewarm import PREWARM_SERVICES, warm_up
+
+
+@pytest.fixture
+def mock_prewarm_conn(mock_get_openstack_conn):
+    """Use the compute tools connection for the pre-warm too."""
+    with patch(
+        "openstack_mcp_server.tools.prewarm.get_openstack_conn",
+        return_value=mock_get_openstack_conn,
+    ):
+        yield mock_get_openstack_conn
+
+
+class TestPrewarm:
+    """Test cases for the background pre-warm."""
+
+    def teardown_method(self):
+        ToolExecutor.shutdown()
+
+    def test_warm_up_discovers_services_and_primes_caches(
+        self,
+        mock_prewarm_conn,
+    ):
+        """Test the first tool call after the pre-warm uses the snapshot."""
+        mock_prewarm_conn.compute.flavors.return_value = [
+            {
+                "id": "1",
+                "name": "m1.tiny",
+                "vcpus": 1,
+                "ram": 512,
+                "disk": 1,
+                "swap": 0,
+                "os-flavor-access:is_public": True,
+            },
+        ]
+
+        warm_up(["openstack", "other:r1"], ["flavors"])
+
+        assert mock_prewarm_conn.authorize.call_count == 2
+        for service in PREWARM_SERVICES:
+            proxy = getattr(mock_prewarm_conn, service)
+            assert proxy.get_endpoint_data.call_count == 2
+        assert mock_prewarm_conn.compute.flavors.call_count == 2
+
+        mcp = FastMCP("test")
+        ComputeTools().register_tools(ToolRegistrar(mcp))
+
+        async def call():
+            async with Client(mcp) as client:
+                await client.call_tool("get_flavors", {})
+                await client.call_tool(
+                    "get_flavors",
+                    {"cloud": "other", "region": "r1"},
+                )
+
+        asyncio.run(call())
+
+        assert mock_prewarm_conn.compute.flavors.call_count == 2
+
+    def test_failures_do_not_stop_the_warm_up(self, mock_prewarm_conn):
+        """Test a failed step is logged and the others still run."""
+        mock_prewarm_conn.compute.get_endpoint_data.side_effect = Exception(
+            "unreachable",
+        )
+        mock_prewarm_conn.compute.flavors.return_value = []
+
+        with patch("openstack_mcp_server.tools.prewarm.logger") as mock_log:
+            warm_up(["openstack"], ["flavors", "unknown"])
+
+        mock_prewarm_conn.network.get_endpoint_data.assert_called_once_with()
+        mock_prewarm_conn.compute.flavors.assert_called_once_with()
+        warnings = [call.args[0] for call in mock_log.warning.call_args_list]
+        assert any("discover compute" in message for message in warnings)
+        assert any("prime unknown" in message for message in warnings)
+
+    def test_discovery_runs_on_the_leasing_thread(self):
+        """Test the leased connection is not used by other threads."""
+        mock_conn = Mock()
+        threads = []
+        for service in PREWARM_SERVICES:
+            getattr(mock_conn, service).get_endpoint_data.side_effect = (
+                lambda: threads.append(threading.get_ident())
+            )
+
+        def lease():
+            threads.append(threading.get_ident())
+            return mock_conn
+
+        with patch(
+            "openstack_mcp_server.tools.prewarm.get_openstack_conn",
+            side_effect=lease,
+        ):
+            warm_up(["openstack"], [])
+
+        assert len(threads) == len(PREWARM_SERVICES) + 1
+        assert len(set(threads)) == 1
+
+    def test_warm_up_without_targets(self):
+        """Test nothing is done without clouds to pre-warm."""
+        with patch(
+            "openstack_mcp_server.tools.prewarm.get_openstack_conn",
+            Mock(),
+        ) as mock_get_conn:
+            warm_up([])
+
+        mock_get_conn.assert_not_called()
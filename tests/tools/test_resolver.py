@@ -0,0 +1,183 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack.exceptions import NotFoundException
+
+from openstack_mcp_server.tools import resolver
+from openstack_mcp_server.tools.base import cloud_selection
+from openstack_mcp_server.tools.compute_tools import ComputeTools
+from openstack_mcp_server.tools.resolver import NameResolver, looks_like_id
+
+
+IMAGE_ID = "a6c3a174-b3d1-4019-8023-fef9518fbaff"
+NETWORK_ID = "49173e57-f96e-474b-b36b-2f3f432ef7aa"
+
+
+def make_resource(resource_id: str, name: str) -> Mock:
+    """Build a listed OpenStack resource."""
+    resource = Mock()
+    resource.id = resource_id
+    resource.name = name
+    return resource
+
+
+class TestNameResolver:
+    """Test cases for the name to ID indexes."""
+
+    def test_ids_are_not_looked_up(self):
+        """Test values shaped like IDs never list resources."""
+        assert looks_like_id("images", IMAGE_ID)
+        assert looks_like_id("images", "d01a81393377480cbd75c0210442e687")
+        assert looks_like_id("flavors", 1)
+        assert looks_like_id("flavors", "42")
+        assert not looks_like_id("images", "42")
+        assert not looks_like_id("flavors", "m1.small")
+
+        mock_conn = Mock()
+        assert NameResolver(300).resolve_id(mock_conn, "images", IMAGE_ID) == (
+            IMAGE_ID
+        )
+        mock_conn.image.images.assert_not_called()
+
+    def test_names_are_resolved_from_one_list(self):
+        """Test the index is listed once for every lookup of the cloud."""
+        mock_conn = Mock()
+        mock_conn.compute.flavors.return_value = [
+            make_resource("f1", "m1.small"),
+            make_resource("f2", "m1.large"),
+        ]
+        names = NameResolver(300)
+
+        assert names.resolve_id(mock_conn, "flavors", "m1.small") == "f1"
+        assert names.resolve_id(mock_conn, "flavors", "m1.large") == "f2"
+        assert names.resolve(mock_conn, "flavors", "f2") == "f2"
+
+        mock_conn.compute.flavors.assert_called_once_with(details=False)
+        with cloud_selection("other"):
+            names.resolve(mock_conn, "flavors", "m1.small")
+        assert mock_conn.compute.flavors.call_count == 2
+
+    def test_ambiguous_names_are_rejected(self):
+        """Test a name shared by several resources raises."""
+        mock_conn = Mock()
+        mock_conn.network.networks.return_value = [
+            make_resource("n1", "private"),
+            make_resource("n2", "private"),
+        ]
+
+        with pytest.raises(ValueError, match="n1, n2"):
+            NameResolver(300).resolve(mock_conn, "networks", "private")
+
+    def test_unknown_names_rebuild_the_index(self):
+        """Test a missing name lists again, at most every interval."""
+        mock_conn = Mock()
+        mock_conn.image.images.side_effect = [
+            [],
+            [make_resource("i1", "cirros")],
+        ]
+        names = NameResolver(300)
+
+        assert names.resolve_id(mock_conn, "images", "cirros") == "cirros"
+        assert mock_conn.image.images.call_count == 1
+
+        with patch.object(resolver, "MISS_REBUILD_INTERVAL", -1):
+            assert names.resolve_id(mock_conn, "images", "cirros") == "i1"
+        assert mock_conn.image.images.call_count == 2
+
+    def test_verified_names_follow_renames(self):
+        """Test a stale ID of a name is replaced by a fresh lookup."""
+        mock_conn = Mock()
+        mock_conn.image.images.side_effect = [
+            [make_resource("i1", "cirros"), make_resource("i2", "ubuntu")],
+            [make_resource("i3", "cirros"), make_resource("i2", "ubuntu")],
+            [make_resource("i3", "cirros"), make_resource("i4", "ubuntu")],
+        ]
+        names = NameResolver(300)
+        names.resolve(mock_conn, "images", "cirros")
+
+        # i1 was renamed and a new image took its name.
+        mock_conn.image.get_image.return_value = make_resource(
+            "i1",
+            "cirros-old",
+        )
+        assert names.resolve_id(mock_conn, "images", "cirros", True) == "i3"
+        mock_conn.image.get_image.assert_called_once_with("i1")
+
+        # i2 was deleted and replaced by a new image of the same name.
+        mock_conn.image.get_image.side_effect = NotFoundException()
+        assert names.resolve(mock_conn, "images", "ubuntu", True) == "i4"
+        assert mock_conn.image.images.call_count == 3
+
+    def test_verified_names_keep_current_ids(self):
+        """Test an unchanged resource is fetched but not listed again."""
+        mock_conn = Mock()
+        mock_conn.network.networks.return_value = [
+            make_resource("n1", "private"),
+        ]
+        mock_conn.network.get_network.return_value = make_resource(
+            "n1",
+            "private",
+        )
+        names = NameResolver(300)
+
+        # The index built by the first lookup is current.
+        assert names.resolve(mock_conn, "networks", "private", True) == "n1"
+        mock_conn.network.get_network.assert_not_called()
+
+        assert names.resolve(mock_conn, "networks", "private", True) == "n1"
+        mock_conn.network.get_network.assert_called_once_with("n1")
+        mock_conn.network.networks.assert_called_once_with()
+
+    def test_writes_update_the_index(self):
+        """Test created, renamed and deleted resources are tracked."""
+        mock_conn = Mock()
+        mock_conn.network.networks.return_value = [
+            make_resource("n1", "private"),
+        ]
+        names = NameResolver(300)
+        names.resolve(mock_conn, "networks", "private")
+
+        names.add("networks", "n2", "public")
+        names.add("networks", "n1", "internal")
+        names.remove("networks", "n2")
+
+        with patch.object(resolver, "MISS_REBUILD_INTERVAL", 3600):
+            assert names.resolve(mock_conn, "networks", "internal") == "n1"
+            assert names.resolve(mock_conn, "networks", "private") is None
+            assert names.resolve(mock_conn, "networks", "public") is None
+        mock_conn.network.networks.assert_called_once_with()
+
+    def test_create_server_by_names(self, mock_get_openstack_conn):
+        """Test create_server resolves image, flavor and network names."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.image.images.return_value = [
+            make_resource(IMAGE_ID, "cirros"),
+        ]
+        mock_conn.compute.flavors.return_value = [
+            make_resource("2", "m1.small"),
+        ]
+        mock_conn.network.networks.return_value = [
+            make_resource(NETWORK_ID, "private"),
+        ]
+        mock_conn.compute.create_server.return_value = {
+            "id": "s1",
+            "name": "vm",
+        }
+
+        ComputeTools().create_server(
+            name="vm",
+            image="cirros",
+            flavor="m1.small",
+            network="private",
+            security_groups=["default"],
+            freshness="minimal",
+        )
+
+        mock_conn.compute.create_server.assert_called_once_with(
+            name="vm",
+            flavorRef="2",
+            imageRef=IMAGE_ID,
+            networks=[{"uuid": NETWORK_ID}],
+            security_groups=["default"],
+        )
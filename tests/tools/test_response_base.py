@@ -0,0 +1,65 @@
+import asyncio
+
+import pydantic_core
+import pytest
+
+from fastmcp import Client, FastMCP
+
+from openstack_mcp_server.tools.compute_tools import ComputeTools
+from openstack_mcp_server.tools.executor import ToolRegistrar
+from openstack_mcp_server.tools.response.base import project
+from openstack_mcp_server.tools.response.compute import Server
+from openstack_mcp_server.tools.response.image import Image
+
+
+class TestProjection:
+    """Test cases for sparse fieldsets on response models."""
+
+    def test_only_selected_and_required_fields_are_serialized(self):
+        """Test projected models drop unselected optional fields."""
+        server = Server(id="s1", name="vm", status="ACTIVE", key_name="k")
+
+        projected = project(server, ["status"])
+
+        assert projected.model_dump() == {
+            "id": "s1",
+            "name": "vm",
+            "status": "ACTIVE",
+        }
+        assert server.model_dump()["key_name"] == "k"
+
+    def test_list_projection_uses_aliases(self):
+        """Test aliased fields are kept when dumping by alias."""
+        images = [Image(id="i1", schema_="/v2/schemas/image", size=1)]
+
+        projected = project(images, ["schema_"])
+
+        assert pydantic_core.to_jsonable_python(projected) == [
+            {"id": "i1", "schema": "/v2/schemas/image"},
+        ]
+
+    def test_no_fields_returns_result_unchanged(self):
+        """Test the result is returned as is without fields."""
+        servers = [Server(id="s1", name="vm")]
+
+        assert project(servers, None) is servers
+
+    def test_unknown_field_is_rejected(self):
+        """Test unknown field names raise a ValueError."""
+        with pytest.raises(ValueError, match="Unknown fields for Server"):
+            project(Server(id="s1", name="vm"), ["bogus"])
+
+    def test_output_schema_lists_model_properties(self):
+        """Test tool output schemas still describe the response models."""
+        mcp = FastMCP("test")
+        ComputeTools().register_tools(ToolRegistrar(mcp))
+
+        async def list_tools():
+            async with Client(mcp) as client:
+                return await client.list_tools()
+
+        tools = {tool.name: tool for tool in asyncio.run(list_tools())}
+        server = tools["get_server"].outputSchema
+
+        assert set(Server.model_fields) <= set(server["properties"])
+        assert "key_name" in server["properties"]
@@ -0,0 +1,91 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack import exceptions
+
+from openstack_mcp_server.tools.retry import is_retryable, retry_with_backoff
+
+
+def make_http_error(status_code: int) -> exceptions.HttpException:
+    """Build an API error with the given HTTP status."""
+    error = exceptions.HttpException()
+    error.status_code = status_code
+    return error
+
+
+class TestRetry:
+    """Test cases for retrying API errors with backoff."""
+
+    def test_retryable_errors(self):
+        """Test conflicts, rate limits and quota errors are retried."""
+        assert is_retryable(exceptions.ConflictException())
+        assert is_retryable(make_http_error(429))
+        assert is_retryable(
+            exceptions.ForbiddenException("Quota exceeded for instances"),
+        )
+        assert not is_retryable(exceptions.ForbiddenException("Denied"))
+        assert not is_retryable(exceptions.NotFoundException())
+        assert not is_retryable(ValueError())
+
+    def test_unavailable_retried_for_idempotent_calls(self):
+        """Test 503 is only retried when repeating the call is safe."""
+        assert is_retryable(make_http_error(503))
+        assert not is_retryable(make_http_error(503), idempotent=False)
+        assert is_retryable(make_http_error(429), idempotent=False)
+        assert is_retryable(exceptions.ConflictException(), idempotent=False)
+        assert is_retryable(
+            exceptions.ForbiddenException("Quota exceeded for instances"),
+            idempotent=False,
+        )
+
+    def test_retries_until_success(self):
+        """Test a transient error is retried with growing delays."""
+        func = Mock(
+            side_effect=[
+                make_http_error(429),
+                exceptions.ConflictException(),
+                "ok",
+            ],
+        )
+
+        with patch(
+            "openstack_mcp_server.tools.retry.time.sleep",
+        ) as mock_sleep:
+            assert retry_with_backoff(func, 1, key="v", base_delay=1) == "ok"
+
+        assert func.call_count == 3
+        func.assert_called_with(1, key="v")
+        first, second = (c.args[0] for c in mock_sleep.call_args_list)
+        assert 0 <= first <= 1
+        assert 0 <= second <= 2
+
+    def test_gives_up_after_attempts(self):
+        """Test the last error is raised once attempts run out."""
+        func = Mock(side_effect=exceptions.ConflictException())
+
+        with (
+            patch("openstack_mcp_server.tools.retry.time.sleep"),
+            pytest.raises(exceptions.ConflictException),
+        ):
+            retry_with_backoff(func, attempts=3)
+
+        assert func.call_count == 3
+
+    def test_other_errors_are_not_retried(self):
+        """Test non-retryable errors are raised immediately."""
+        func = Mock(side_effect=exceptions.NotFoundException())
+
+        with pytest.raises(exceptions.NotFoundException):
+            retry_with_backoff(func)
+
+        func.assert_called_once_with()
+
+    def test_create_not_retried_when_unavailable(self):
+        """Test a failed create is not repeated after a 503."""
+        func = Mock(side_effect=make_http_error(503))
+
+        with pytest.raises(exceptions.HttpException):
+            retry_with_backoff(func, name="ip", idempotent=False)
+
+        func.assert_called_once_with(name="ip")
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+from unittest.mock import patch
+
+from fastmcp import Client, FastMCP
+
+from openstack_mcp_server.tools.executor import ToolRegistrar
+from openstack_mcp_server.tools.schema_cache import ToolSchemaCache
+
+
+def get_things(limit: int = 10) -> list[str]:
+    """Get things."""
+    return ["thing"] * limit
+
+
+def register(schemas: ToolSchemaCache) -> FastMCP:
+    """Register get_things on a new server."""
+    mcp = FastMCP("test")
+    ToolRegistrar(mcp, schemas).tool()(get_things)
+    schemas.save()
+    return mcp
+
+
+class TestToolSchemaCache:
+    """Test cases for the persisted tool schemas."""
+
+    def test_tools_are_registered_from_cached_schemas(self, tmp_path):
+        """Test a restart reuses the schemas without inspecting tools."""
+        cold = register(ToolSchemaCache(tmp_path))
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        with patch(
+            "fastmcp.tools.tool.ParsedFunction.from_function",
+        ) as mock_parse:
+            warm = register(ToolSchemaCache(tmp_path))
+        mock_parse.assert_not_called()
+
+        async def call(mcp: FastMCP):
+            async with Client(mcp) as client:
+                tools = await client.list_tools()
+                result = await client.call_tool("get_things", {"limit": 2})
+                invalid = await client.call_tool(
+                    "get_things",
+                    {"limit": "many"},
+                    raise_on_error=False,
+                )
+                return tools, result.data, invalid.is_error
+
+        assert asyncio.run(call(warm)) == asyncio.run(call(cold))
+        assert asyncio.run(call(warm))[1:] == (["thing", "thing"], True)
+
+    def test_stale_schemas_are_ignored(self, tmp_path):
+        """Test schemas cached for other sources are not used."""
+        schemas = ToolSchemaCache(tmp_path)
+        schemas.path.write_text(
+            json.dumps(
+                {
+                    "fingerprint": "other",
+                    "tools": {"get_things": {"description": "Stale"}},
+                },
+            ),
+        )
+
+        assert ToolSchemaCache(tmp_path).get("get_things") is None
@@ -0,0 +1,71 @@
+import pytest
+
+from openstack_mcp_server.tools.response.base import project
+from openstack_mcp_server.tools.response.network import Port
+from openstack_mcp_server.tools.table import (
+    OutputFormatEnum,
+    table_output,
+    to_table,
+)
+
+
+def make_ports(count: int) -> list[Port]:
+    """Build Port models with sequential IDs."""
+    return [Port(id=f"port-{i}", status="ACTIVE") for i in range(count)]
+
+
+class TestTable:
+    """Test cases for the compact table output."""
+
+    def test_columns_are_sent_once(self):
+        """Test keys become a header and items become rows."""
+        table = to_table(project(make_ports(2), ["status"]))
+
+        assert table.columns == ["id", "status"]
+        assert table.rows == [["port-0", "ACTIVE"], ["port-1", "ACTIVE"]]
+        assert table.total == 2
+        assert table.next_cursor is None
+
+    def test_truncated_table_continues_from_cursor(self):
+        """Test rows beyond the size limit are returned by the next call."""
+        ports = project(make_ports(5), ["status"])
+
+        first = to_table(ports, max_bytes=40)
+        second = to_table(ports, first.next_cursor, max_bytes=1000)
+
+        assert [row[0] for row in first.rows] == ["port-0", "port-1"]
+        assert [row[0] for row in second.rows] == [
+            "port-2",
+            "port-3",
+            "port-4",
+        ]
+        assert second.next_cursor is None
+
+    def test_at_least_one_row_is_returned(self):
+        """Test a row larger than the limit is still returned."""
+        table = to_table(make_ports(2), max_bytes=1)
+
+        assert len(table.rows) == 1
+        assert table.next_cursor is not None
+
+    def test_cursor_of_removed_row_is_rejected(self):
+        """Test a cursor pointing to a vanished row raises."""
+        cursor = to_table(make_ports(3), max_bytes=1).next_cursor
+
+        with pytest.raises(ValueError, match="no longer exists"):
+            to_table(make_ports(3)[1:], cursor)
+
+    def test_table_output_decorator(self):
+        """Test the decorator handles the format and cursor arguments."""
+
+        @table_output
+        def list_ports(output_format=None, cursor=None):
+            assert output_format is None
+            assert cursor is None
+            return make_ports(1)
+
+        assert list_ports() == make_ports(1)
+        table = list_ports(output_format=OutputFormatEnum.TABLE)
+        assert table.rows[0][0] == "port-0"
+        with pytest.raises(ValueError, match="table output"):
+            list_ports(cursor="abc")
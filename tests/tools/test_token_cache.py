@@ -0,0 +1,143 @@
+import datetime
+import json
+import stat
+
+from unittest.mock import Mock
+
+from keystoneauth1 import access
+from keystoneauth1.identity import v3
+
+from openstack_mcp_server.tools.token_cache import (
+    FileTokenCache,
+    TokenCache,
+    ensure_fresh_token,
+)
+
+
+NEW_TOKEN = "new-token"  # noqa: S105
+CACHED_TOKEN = "cached-token"  # noqa: S105
+
+
+def make_auth_body(expires_in: datetime.timedelta) -> dict:
+    """Build a Keystone v3 token body expiring after the given delta."""
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + expires_in
+    return {
+        "token": {
+            "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+            "catalog": [
+                {
+                    "type": "compute",
+                    "name": "nova",
+                    "endpoints": [],
+                },
+            ],
+        },
+    }
+
+
+def make_conn(expires_in: datetime.timedelta) -> Mock:
+    """Build a connection whose authorize() issues a new token."""
+    auth = v3.Password(
+        auth_url="https://keystone.example.com/v3",
+        username="demo",
+        password="secret",  # noqa: S106
+        project_name="demo",
+        user_domain_name="Default",
+        project_domain_name="Default",
+    )
+    conn = Mock()
+    conn.session.auth = auth
+
+    def authorize():
+        auth.auth_ref = access.create(
+            body=make_auth_body(expires_in),
+            auth_token=NEW_TOKEN,
+        )
+
+    conn.authorize.side_effect = authorize
+    return conn
+
+
+def make_state(token: str, expires_in: datetime.timedelta) -> str:
+    """Build a serialized keystoneauth auth state."""
+    return json.dumps(
+        {"auth_token": token, "body": make_auth_body(expires_in)},
+    )
+
+
+class TestTokenCache:
+    """Test cases for the Keystone token cache."""
+
+    def test_file_cache_shared_between_instances(self, tmp_path):
+        """Test a state saved by one process is loaded by another."""
+        FileTokenCache(tmp_path).save("key", "state")
+
+        assert FileTokenCache(tmp_path).load("key") == "state"
+        (path,) = tmp_path.iterdir()
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_file_cache_delete(self, tmp_path):
+        """Test deleted states are removed from memory and disk."""
+        cache = FileTokenCache(tmp_path)
+        cache.save("key", "state")
+        cache.delete("key")
+
+        assert cache.load("key") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_new_connection_authenticates_and_saves(self):
+        """Test a connection without cached state authenticates once."""
+        cache = TokenCache()
+        conn = make_conn(datetime.timedelta(hours=1))
+
+        ensure_fresh_token(conn, "openstack", cache)
+
+        conn.authorize.assert_called_once_with()
+        key = f"openstack:{conn.session.auth.get_cache_id()}"
+        assert json.loads(cache.load(key))["auth_token"] == NEW_TOKEN
+
+    def test_cached_token_is_reused(self):
+        """Test a valid cached token avoids authentication."""
+        cache = TokenCache()
+        conn = make_conn(datetime.timedelta(hours=1))
+        key = f"openstack:{conn.session.auth.get_cache_id()}"
+        cache.save(key, make_state(CACHED_TOKEN, datetime.timedelta(hours=1)))
+
+        ensure_fresh_token(conn, "openstack", cache)
+
+        conn.authorize.assert_not_called()
+        assert conn.session.auth.auth_ref.auth_token == CACHED_TOKEN
+        assert conn.session.auth.auth_ref.service_catalog.get_endpoints()
+
+    def test_expiring_token_is_refreshed(self):
+        """Test a token expiring within the margin is replaced."""
+        cache = TokenCache()
+        conn = make_conn(datetime.timedelta(hours=1))
+        key = f"openstack:{conn.session.auth.get_cache_id()}"
+        cache.save(key, make_state("stale", datetime.timedelta(seconds=30)))
+
+        ensure_fresh_token(conn, "openstack", cache)
+
+        conn.authorize.assert_called_once_with()
+        assert conn.session.auth.auth_ref.auth_token == NEW_TOKEN
+        assert json.loads(cache.load(key))["auth_token"] == NEW_TOKEN
+
+    def test_corrupt_state_is_dropped(self):
+        """Test an unreadable cached state is discarded."""
+        cache = TokenCache()
+        conn = make_conn(datetime.timedelta(hours=1))
+        key = f"openstack:{conn.session.auth.get_cache_id()}"
+        cache.save(key, "not json")
+
+        ensure_fresh_token(conn, "openstack", cache)
+
+        conn.authorize.assert_called_once_with()
+        assert json.loads(cache.load(key))["auth_token"] == NEW_TOKEN
+
+    def test_disabled_cache_is_noop(self):
+        """Test nothing happens when token caching is disabled."""
+        conn = make_conn(datetime.timedelta(hours=1))
+
+        ensure_fresh_token(conn, "openstack", None)
+
+        conn.authorize.assert_not_called()
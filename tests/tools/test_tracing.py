@@ -0,0 +1,93 @@
+import asyncio
+import sys
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+
+from openstack_mcp_server.tools import tracing
+from openstack_mcp_server.tools.executor import to_async_tool
+from openstack_mcp_server.tools.tracing import (
+    setup_tracing,
+    span,
+    trace_upstream_requests,
+)
+
+
+@pytest.fixture
+def mock_tracer():
+    """Enable tracing with a mock tracer."""
+    tracer = Mock()
+    tracer.start_as_current_span.return_value = MagicMock()
+    with patch.object(tracing, "_tracer", tracer):
+        yield tracer
+
+
+class TestTracing:
+    """Test cases for the OpenTelemetry instrumentation."""
+
+    def test_spans_are_skipped_when_disabled(self):
+        """Test no span is created without setup."""
+        with span("anything", key="value") as current:
+            assert current is None
+
+    def test_setup_requires_opentelemetry(self):
+        """Test tracing stays off if the SDK is missing."""
+        with patch.object(tracing.config, "MCP_TRACING", False):
+            assert setup_tracing() is False
+
+        with (
+            patch.object(tracing.config, "MCP_TRACING", True),
+            patch.dict(sys.modules, {"opentelemetry.sdk.trace": None}),
+        ):
+            assert setup_tracing() is False
+        assert tracing._tracer is None
+
+    def test_tool_calls_are_traced(self, mock_tracer):
+        """Test a span is created per tool invocation."""
+
+        def get_things() -> list[str]:
+            """Get things."""
+            return []
+
+        asyncio.run(to_async_tool(get_things)(cloud="other"))
+
+        mock_tracer.start_as_current_span.assert_called_once_with(
+            "tool get_things",
+            attributes={
+                "mcp.tool.name": "get_things",
+                "openstack.cloud": "other",
+            },
+        )
+
+    def test_upstream_requests_are_traced(self, mock_tracer):
+        """Test every HTTP request of a connection gets a span."""
+        session = requests.Session()
+        session.send = Mock(return_value=Mock(status_code=200))
+        mock_conn = Mock()
+        mock_conn.session.session = session
+
+        trace_upstream_requests(mock_conn)
+        trace_upstream_requests(mock_conn)
+        request = requests.Request(
+            "GET",
+            "http://nova.example:8774/v2.1/servers/detail?limit=10",
+        ).prepare()
+        response = session.send(request)
+
+        assert response.status_code == 200
+        mock_tracer.start_as_current_span.assert_called_once_with(
+            "GET",
+            attributes={
+                "http.request.method": "GET",
+                "server.address": "nova.example",
+                "server.port": 8774,
+                "url.path": "/v2.1/servers/detail",
+            },
+        )
+        current = mock_tracer.start_as_current_span.return_value.__enter__()
+        current.set_attribute.assert_called_once_with(
+            "http.response.status_code",
+            200,
+        )
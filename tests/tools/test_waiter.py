@@ -0,0 +1,204 @@
+import threading
+
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from openstack.exceptions import NotFoundException
+
+from openstack_mcp_server.tools.waiter import (
+    StatusWaiter,
+    wait_for_status,
+)
+
+
+class TestStatusWaiter:
+    """Test cases for the shared wait-for-status engine."""
+
+    def test_many_servers_share_listings(
+        self,
+        mock_get_openstack_conn_waiter,
+    ):
+        """Test many servers are awaited with one listing per poll."""
+        mock_conn = mock_get_openstack_conn_waiter
+        patch_max_ids = patch(
+            "openstack_mcp_server.tools.waiter.PER_ID_POLL_MAX_IDS",
+            1,
+        )
+        mock_conn.compute.servers.side_effect = [
+            [
+                {"id": "s1", "status": "BUILD", "updated_at": "t1"},
+                {"id": "s2", "status": "ACTIVE", "updated_at": "t1"},
+            ],
+            [{"id": "s1", "status": "ACTIVE", "updated_at": "t2"}],
+        ]
+
+        with patch_max_ids:
+            results = StatusWaiter().wait(
+                "servers",
+                ["s1", "s2"],
+                ["ACTIVE"],
+                5,
+            )
+
+        assert {k: r.status for k, r in results.items()} == {
+            "s1": "ACTIVE",
+            "s2": "ACTIVE",
+        }
+        assert all(r.error is None for r in results.values())
+        # A full listing, then only the servers changed since.
+        assert mock_conn.compute.servers.call_args_list == [
+            call(),
+            call(changes_since="t1"),
+        ]
+        mock_conn.compute.get_server.assert_not_called()
+
+    def test_added_servers_do_not_restart_listings(
+        self,
+        mock_get_openstack_conn_waiter,
+    ):
+        """Test servers awaited later are fetched, not listed again."""
+        mock_conn = mock_get_openstack_conn_waiter
+        mock_conn.compute.servers.side_effect = [
+            [
+                {"id": "s1", "status": "ACTIVE", "updated_at": "t1"},
+                {"id": "s2", "status": "ACTIVE", "updated_at": "t1"},
+            ],
+            [],
+        ]
+        mock_conn.compute.get_server.return_value = {
+            "id": "s3",
+            "status": "ACTIVE",
+        }
+        waiter = StatusWaiter()
+
+        with patch("openstack_mcp_server.tools.waiter.PER_ID_POLL_MAX_IDS", 1):
+            waiter.wait("servers", ["s1", "s2"], ["ACTIVE"], 5)
+            result = waiter.wait("servers", ["s3"], ["ACTIVE"], 5)
+
+        assert result["s3"].status == "ACTIVE"
+        assert mock_conn.compute.servers.call_args_list == [
+            call(),
+            call(changes_since="t1"),
+        ]
+        mock_conn.compute.get_server.assert_called_once_with("s3")
+
+    def test_few_servers_are_fetched_by_id(
+        self,
+        mock_get_openstack_conn_waiter,
+    ):
+        """Test a few awaited servers are not found by listing them all."""
+        mock_conn = mock_get_openstack_conn_waiter
+        mock_conn.compute.get_server.side_effect = lambda server_id: {
+            "id": server_id,
+            "status": "ACTIVE",
+        }
+
+        results = StatusWaiter().wait("servers", ["s1", "s2"], ["ACTIVE"], 5)
+
+        assert {r.status for r in results.values()} == {"ACTIVE"}
+        assert mock_conn.compute.get_server.call_args_list == [
+            call("s1"),
+            call("s2"),
+        ]
+        mock_conn.compute.servers.assert_not_called()
+
+    def test_concurrent_waits_are_merged(
+        self,
+        mock_get_openstack_conn_waiter,
+    ):
+        """Test waits from several threads are served by the same poll."""
+        mock_conn = mock_get_openstack_conn_waiter
+        listed = threading.Event()
+
+        def volumes():
+            listed.wait(5)
+            return [
+                Mock(
+                    id=volume_id,
+                    status="available",
+                    updated_at=None,
+                    created_at=None,
+                )
+                for volume_id in ("v1", "v2")
+            ]
+
+        mock_conn.block_storage.volumes.side_effect = volumes
+        waiter = StatusWaiter()
+        results = {}
+        threads = [
+            threading.Thread(
+                target=lambda v=volume_id: results.update(
+                    waiter.wait("volumes", [v], ["available"], 5),
+                ),
+            )
+            for volume_id in ("v1", "v2")
+        ]
+        with patch("openstack_mcp_server.tools.waiter.PER_ID_POLL_MAX_IDS", 0):
+            for thread in threads:
+                thread.start()
+            while (
+                len(waiter._pollers[("openstack", None, "volumes")].pending)
+                < 2
+            ):
+                pass
+            listed.set()
+            for thread in threads:
+                thread.join()
+
+        assert results["v1"].status == results["v2"].status == "AVAILABLE"
+        assert mock_conn.block_storage.volumes.call_count <= 2
+
+    def test_failure_status(self, mock_get_openstack_conn_waiter):
+        """Test a failure status ends the wait with an error."""
+        mock_conn = mock_get_openstack_conn_waiter
+        mock_conn.image.images.return_value = [Mock(id="i1", status="killed")]
+
+        with pytest.raises(RuntimeError, match="went to KILLED"):
+            wait_for_status("images", "i1", ["active"], 5, ["killed"])
+        mock_conn.image.images.assert_called_once_with(id="in:i1")
+
+    def test_missing_resource_is_deleted(
+        self,
+        mock_get_openstack_conn_waiter,
+    ):
+        """Test waiting for deletion resolves once the resource is gone."""
+        mock_conn = mock_get_openstack_conn_waiter
+        mock_conn.block_storage.get_volume.side_effect = [
+            Mock(id="v1", status="deleting"),
+            NotFoundException("gone"),
+        ]
+
+        result = StatusWaiter().wait("volumes", ["v1"], ["DELETED"], 5)
+
+        assert result["v1"].status == "DELETED"
+        assert result["v1"].error is None
+        mock_conn.block_storage.volumes.assert_not_called()
+
+    def test_timeout(self, mock_get_openstack_conn_waiter):
+        """Test the last polled status is reported on timeout."""
+        mock_conn = mock_get_openstack_conn_waiter
+        mock_conn.compute.get_server.return_value = {
+            "id": "s1",
+            "status": "BUILD",
+        }
+
+        with pytest.raises(TimeoutError, match="status BUILD"):
+            wait_for_status("servers", "s1", ["ACTIVE"], 0.2)
+
+    def test_poll_errors_are_retried(self, mock_get_openstack_conn_waiter):
+        """Test a failed poll does not end the wait."""
+        mock_conn = mock_get_openstack_conn_waiter
+        mock_conn.compute.get_server.side_effect = [
+            Exception("boom"),
+            {"id": "s1", "status": "ACTIVE"},
+        ]
+
+        server = wait_for_status("servers", "s1", ["ACTIVE"], 5)
+
+        assert server["status"] == "ACTIVE"
+
+    def test_unsupported_resource(self):
+        """Test unknown resource types are refused."""
+        with pytest.raises(ValueError, match="Unsupported resource"):
+            StatusWaiter().wait("routers", ["r1"], ["ACTIVE"], 1)